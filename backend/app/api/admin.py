@@ -0,0 +1,66 @@
+"""Admin API endpoints (캐시 관측/관리)"""
+from typing import Optional
+import asyncio
+import hmac
+from fastapi import APIRouter, Depends, Header, Query
+from app.core.cache import aclear_cache, cache_metrics
+from app.core.config import settings
+from app.core.exceptions import AdminAccessDeniedError
+from app.core.metrics import histogram_stats
+from app.core.singleflight import singleflight_stats
+from app.core.tokens import token_counting_info
+from app.services.openai_service import get_openai_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """ADMIN_TOKEN 이 설정되어 있으면 헤더 토큰 확인, 없으면 DEBUG 모드에서만 허용"""
+    if settings.admin_token:
+        if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.admin_token):
+            raise AdminAccessDeniedError()
+    elif not settings.debug:
+        raise AdminAccessDeniedError("ADMIN_TOKEN 을 설정해야 관리자 API 를 사용할 수 있습니다.")
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/cache")
+async def get_cache_metrics():
+    """캐시 지표 (접두사별 적중/미스/만료/제거, 항목 수/바이트, 지연 시간 히스토그램)"""
+    metrics = await asyncio.to_thread(cache_metrics)
+    metrics["singleflight"] = singleflight_stats()
+    return metrics
+
+
+@router.delete("/cache")
+async def delete_cache(prefix: Optional[str] = Query(None, description="삭제할 키 접두사 (없으면 전체)")):
+    """캐시 삭제"""
+    cleared = await aclear_cache(prefix)
+    logger.info(f"관리자 캐시 삭제: {prefix or '전체'} {cleared}건")
+    return {"cleared": cleared, "prefix": prefix}
+
+
+@router.get("/metrics")
+async def get_latency_metrics():
+    """
+    히스토그램 (chat_ttft: 첫 토큰까지, chat_stream: 스트리밍 응답 전체, prompt_tokens: 프롬프트 토큰 수)
+
+    token_counting.exact 가 False 면 prompt_tokens 는 tiktoken 없이 센 근사치입니다.
+    """
+    metrics = histogram_stats()
+    metrics["token_counting"] = token_counting_info()
+    return metrics
+
+
+@router.get("/openai")
+async def get_openai_metrics():
+    """OpenAI 호출 동시 실행/대기/거절 수, 슬롯 대기 시간, 답변/의미 캐시 적중률"""
+    openai_service = get_openai_service()
+    return {
+        "limiter": openai_service.limiter.stats(),
+        "answer_cache": openai_service.answer_cache.stats(),
+        "semantic_cache": openai_service.semantic_cache.stats() if openai_service.semantic_cache else None,
+    }
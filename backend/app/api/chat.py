@@ -1,13 +1,20 @@
 """Chat API endpoints"""
+from typing import AsyncIterator, List, Optional, Tuple
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.schemas.chat import ChatRequest, ChatResponse, LawReference, MessageCreate, ConversationCreate
-from app.db.database import get_db
+from app.db.database import get_db, SessionLocal
 from app.repositories.message_repository import MessageRepository
 from app.repositories.conversation_repository import ConversationRepository
+from app.repositories.conversation_summary_repository import ConversationSummaryRepository
 from app.services.openai_service import get_openai_service
-from app.core.exceptions import OpenAIAPIError, InvalidRequestError
-from app.mock.law_data import search_laws_by_keyword
+from app.services.law_service import LawService, RetrievalResult
+from app.services.conversation_summary import recent_message_limit, schedule_summary_update
+from app.core.exceptions import OpenAIAPIError, InvalidRequestError, ServiceOverloadedError
+from app.core.metrics import get_histogram
+import json
+import time
 import uuid
 import logging
 
@@ -16,6 +23,102 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 
+def _validate_message(message: str) -> None:
+    """질문 입력 검증"""
+    if not message or not message.strip():
+        raise InvalidRequestError("질문 내용을 입력해주세요.")
+    
+    if len(message) > 1000:
+        raise InvalidRequestError("질문은 1000자 이하로 입력해주세요.")
+
+
+def _start_turn(db: Session, request: ChatRequest) -> Tuple[str, List[dict], Optional[str]]:
+    """
+    대화 세션 확인/생성 후 사용자 메시지 저장
+    
+    Returns:
+        (대화 세션 ID, 최근 대화 히스토리(현재 메시지 포함), 그 이전 대화의 누적 요약)
+    """
+    # 대화 세션 확인 및 생성
+    conversation_id = request.conversation_id
+    if not conversation_id:
+        # 새 대화 세션 생성
+        conversation_repo = ConversationRepository(db)
+        new_conversation = conversation_repo.create(
+            ConversationCreate(title=request.message[:50])  # 첫 메시지의 일부를 제목으로
+        )
+        conversation_id = new_conversation.id
+    
+    # 사용자 메시지 저장
+    message_repo = MessageRepository(db)
+    message_repo.create(
+        MessageCreate(
+            role="user",
+            content=request.message,
+            conversation_id=conversation_id,
+            law_references=None
+        )
+    )
+    
+    # 최근 대화만 원문으로 가져오고 그 이전은 누적 요약으로 대신함
+    recent_messages = message_repo.get_recent_by_conversation_id(conversation_id, recent_message_limit() + 1)
+    conversation_history = [
+        {"role": msg.role, "content": msg.content}
+        for msg in recent_messages
+    ]
+    summary = ConversationSummaryRepository(db).get(conversation_id)
+    return conversation_id, conversation_history, summary.summary if summary else None
+
+
+def _law_references(response_content: str, retrieval: RetrievalResult) -> List[LawReference]:
+    """답변에서 법령 출처 추출 (프롬프트에 사용한 검색 결과 기준)"""
+    law_references_data = get_openai_service().extract_law_references(
+        response_content,
+        retrieval
+    )
+    
+    # LawReference 객체로 변환
+    return [
+        LawReference(
+            law_id=ref["law_id"],
+            title=ref["title"],
+            article=ref.get("article")
+        )
+        for ref in law_references_data
+    ]
+
+
+def _finish_turn(
+    db: Session,
+    conversation_id: str,
+    response_content: str,
+    law_references: List[LawReference],
+):
+    """응답 메시지 저장, 대화 세션 갱신 및 누적 요약 갱신 예약"""
+    message_repo = MessageRepository(db)
+    bot_message = message_repo.create(
+        MessageCreate(
+            role="assistant",
+            content=response_content,
+            conversation_id=conversation_id,
+            law_references=law_references
+        )
+    )
+    
+    # 대화 세션 업데이트 시간 갱신
+    conversation_repo = ConversationRepository(db)
+    conversation_repo.update(conversation_id)
+    
+    # 최근 대화 창 밖으로 밀려난 메시지를 백그라운드에서 요약에 반영
+    schedule_summary_update(conversation_id, get_openai_service().summarize_conversation)
+    return bot_message
+
+
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 한 개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post("/", response_model=ChatResponse)
 async def send_message(
     request: ChatRequest,
@@ -23,84 +126,33 @@ async def send_message(
 ):
     """채팅 메시지 전송 및 응답 생성"""
     # 입력 검증
-    if not request.message or not request.message.strip():
-        raise InvalidRequestError("질문 내용을 입력해주세요.")
-    
-    if len(request.message) > 1000:
-        raise InvalidRequestError("질문은 1000자 이하로 입력해주세요.")
+    _validate_message(request.message)
     
     try:
-        # 대화 세션 확인 및 생성
-        conversation_id = request.conversation_id
-        if not conversation_id:
-            # 새 대화 세션 생성
-            conversation_repo = ConversationRepository(db)
-            new_conversation = conversation_repo.create(
-                ConversationCreate(title=request.message[:50])  # 첫 메시지의 일부를 제목으로
-            )
-            conversation_id = new_conversation.id
-        
-        # 사용자 메시지 저장
-        message_repo = MessageRepository(db)
-        user_message = message_repo.create(
-            MessageCreate(
-                role="user",
-                content=request.message,
-                conversation_id=conversation_id,
-                law_references=None
-            )
-        )
-        
-        # 관련 법령 검색
-        related_laws = search_laws_by_keyword(request.message)
+        conversation_id, conversation_history, conversation_summary = _start_turn(db, request)
         
-        # 대화 히스토리 가져오기
-        previous_messages = message_repo.get_by_conversation_id(conversation_id)
-        conversation_history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in previous_messages[-10:]  # 최근 10개만 (현재 메시지 제외)
-        ]
+        # 관련 법령/조문 검색은 요청당 한 번 (프롬프트 구성과 출처 추출에 같은 결과 사용)
+        retrieval = await LawService.retrieve(request.message)
         
         # OpenAI 서비스를 사용하여 답변 생성
         try:
             openai_service = get_openai_service()
-            response_content = openai_service.ask_question(
+            response_content = await openai_service.ask_question(
                 question=request.message,
-                conversation_history=conversation_history
+                conversation_history=conversation_history,
+                conversation_summary=conversation_summary,
+                retrieval=retrieval
             )
+        except ServiceOverloadedError:
+            raise
         except Exception as e:
             logger.error(f"OpenAI API 호출 실패: {str(e)}")
             raise OpenAIAPIError(f"AI 답변 생성 중 오류가 발생했습니다: {str(e)}")
         
-        # 법령 출처 추출
-        law_references_data = openai_service.extract_law_references(
-            response_content,
-            related_laws
-        )
-        
-        # LawReference 객체로 변환
-        law_references = [
-            LawReference(
-                law_id=ref["law_id"],
-                title=ref["title"],
-                article=ref.get("article")
-            )
-            for ref in law_references_data
-        ]
+        law_references = _law_references(response_content, retrieval)
         
         # 응답 메시지 저장
-        bot_message = message_repo.create(
-            MessageCreate(
-                role="assistant",
-                content=response_content,
-                conversation_id=conversation_id,
-                law_references=law_references
-            )
-        )
-        
-        # 대화 세션 업데이트 시간 갱신
-        conversation_repo = ConversationRepository(db)
-        conversation_repo.update(conversation_id)
+        bot_message = _finish_turn(db, conversation_id, response_content, law_references)
         
         return ChatResponse(
             id=str(bot_message.id),
@@ -108,7 +160,7 @@ async def send_message(
             law_references=law_references
         )
     
-    except (OpenAIAPIError, InvalidRequestError):
+    except (OpenAIAPIError, InvalidRequestError, ServiceOverloadedError):
         # 커스텀 예외는 그대로 전파
         raise
     except Exception as e:
@@ -116,3 +168,75 @@ async def send_message(
         raise
 
 
+@router.post("/stream")
+async def stream_message(
+    request: ChatRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    채팅 메시지 전송 및 응답 스트리밍 (Server-Sent Events)
+    
+    이벤트:
+    - token: {"content": 응답 조각} (도착하는 대로)
+    - done: {"id", "conversation_id", "law_references"} (응답 메시지 저장 후)
+    - error: {"message"} (답변 생성/저장 실패)
+    """
+    _validate_message(request.message)
+    started = time.perf_counter()
+    openai_service = get_openai_service()
+    # 응답 헤더를 보낸 뒤에는 503 을 줄 수 없으므로 대기열이 가득 찼으면 여기서 바로 거절
+    openai_service.limiter.check_capacity()
+    conversation_id, conversation_history, conversation_summary = _start_turn(db, request)
+    retrieval = await LawService.retrieve(request.message)
+    
+    async def events() -> AsyncIterator[str]:
+        chunks: List[str] = []
+        try:
+            async for token in openai_service.stream_answer(
+                question=request.message,
+                conversation_history=conversation_history,
+                conversation_summary=conversation_summary,
+                retrieval=retrieval
+            ):
+                if not chunks:
+                    get_histogram("chat_ttft").observe(time.perf_counter() - started)
+                chunks.append(token)
+                yield _sse("token", {"content": token})
+        except ServiceOverloadedError as e:
+            yield _sse("error", {"message": e.message, "retry_after": e.retry_after})
+            return
+        except Exception as e:
+            logger.error(f"OpenAI 스트리밍 실패: {str(e)}")
+            yield _sse("error", {"message": "AI 답변 생성 중 오류가 발생했습니다."})
+            return
+        
+        response_content = "".join(chunks).strip()
+        # 응답이 이미 시작되어 예외를 HTTP 오류로 바꿀 수 없으므로 error 이벤트로 알림
+        try:
+            law_references = _law_references(response_content, retrieval)
+            # 스트리밍 중에는 요청 DB 세션이 이미 닫혔을 수 있어 새 세션으로 저장
+            stream_db = SessionLocal()
+            try:
+                bot_message = _finish_turn(stream_db, conversation_id, response_content, law_references)
+                # 세션을 닫으면 인스턴스가 분리되어 속성을 읽을 수 없으므로 미리 꺼내 둠
+                message_id = str(bot_message.id)
+            finally:
+                stream_db.close()
+        except Exception as e:
+            logger.error(f"스트리밍 응답 저장 실패: {str(e)}")
+            yield _sse("error", {"message": "답변을 저장하는 중 오류가 발생했습니다."})
+            return
+        get_histogram("chat_stream").observe(time.perf_counter() - started)
+        
+        yield _sse("done", {
+            "id": message_id,
+            "conversation_id": conversation_id,
+            "law_references": [ref.model_dump() for ref in law_references],
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 버퍼링하지 않고 바로 전달하도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
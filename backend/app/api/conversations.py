@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from app.db.database import get_db
 from app.repositories.conversation_repository import ConversationRepository
+from app.repositories.conversation_summary_repository import ConversationSummaryRepository
 from app.repositories.message_repository import MessageRepository
 from app.schemas.chat import ConversationCreate, ConversationResponse, MessageResponse
 from app.core.exceptions import ConversationNotFoundError, InvalidRequestError
@@ -130,6 +131,7 @@ async def delete_conversation(
     
     if not success:
         raise ConversationNotFoundError(conversation_id)
+    ConversationSummaryRepository(db).delete(conversation_id)
     
     return {"success": True, "message": "Conversation deleted"}
 
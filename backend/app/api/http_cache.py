@@ -0,0 +1,136 @@
+"""직렬화된 JSON 응답 캐시 + 조건부 요청(ETag / Last-Modified, 304)"""
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+import json
+
+from fastapi import Request, Response
+
+from app.core.cache import aget_cache, aset_cache
+from app.core.singleflight import get_singleflight
+
+try:
+    # 선택 의존성 - 큰 법령 문서 직렬화가 json 모듈보다 훨씬 빠름
+    import orjson
+except ImportError:
+    orjson = None
+
+_response_flight = get_singleflight("law_response")
+
+
+class CachedResponse(NamedTuple):
+    """캐시에 저장하는 응답 (인코딩된 본문 + 검증자)"""
+
+    body: bytes
+    etag: str
+    last_modified: Optional[str]
+    # False 면 응답 캐시에 저장하지 않았고 클라이언트도 매번 재검증 (임시 대체 데이터 등)
+    cacheable: bool = True
+
+
+def dump_json(payload: Any) -> bytes:
+    """
+    JSON 인코딩 (orjson 이 설치되어 있으면 사용)
+
+    FastAPI 기본 JSONResponse 와 같은 형식(UTF-8, 공백 없음)입니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def last_modified_of(laws: Iterable[Dict[str, Any]]) -> Optional[str]:
+    """
+    법령들의 최종 개정일(없으면 시행일) 중 가장 최근 날짜를 HTTP 날짜로 변환
+
+    법령 상세처럼 내용이 개정일과 함께 바뀌는 응답에만 씁니다. 목록/검색 결과는 법령이 추가·삭제되거나
+    순위가 바뀌어도 가장 최근 개정일이 그대로일 수 있으므로 Last-Modified 없이 ETag 만 씁니다.
+
+    Args:
+        laws: 법령 목록 (날짜는 "YYYY-MM-DD" 또는 law.go.kr 의 "YYYYMMDD")
+
+    Returns:
+        "Sun, 11 Jun 2023 00:00:00 GMT" 형식 문자열 또는 None
+    """
+    latest = ""
+    for law in laws:
+        digits = "".join(ch for ch in (law.get("amendment_date") or law.get("enactment_date") or "") if ch.isdigit())
+        if len(digits) == 8 and digits > latest:
+            latest = digits
+    if not latest:
+        return None
+    try:
+        date = datetime.strptime(latest, "%Y%m%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return format_datetime(date, usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match 는 약한 비교 (W/ 접두사 무시)
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(header: str, last_modified: Optional[str]) -> bool:
+    if not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+    """조건부 요청 헤더와 검증자를 비교 (If-None-Match 가 있으면 If-Modified-Since 는 무시)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    return if_modified_since is not None and _not_modified_since(if_modified_since, last_modified)
+
+
+async def cached_json_response(
+    request: Request,
+    key: str,
+    build: Callable[[], Awaitable[Tuple[Any, Optional[str], bool]]],
+    ttl: int,
+    max_age: int,
+) -> Response:
+    """
+    인코딩된 JSON 응답을 캐싱하고 조건부 요청에는 304로 응답
+
+    같은 응답을 다시 만들거나 직렬화하지 않고, 클라이언트가 이미 가진 버전이면 본문도 보내지 않습니다.
+
+    Args:
+        request: 요청 (If-None-Match / If-Modified-Since 확인용)
+        key: 응답 캐시 키 (데이터 버전을 포함해야 함)
+        build: (응답 데이터, Last-Modified, 캐싱 여부) 를 만드는 코루틴 함수
+            (예외는 그대로 전파되고 캐싱하지 않음, 캐싱 여부가 False 면 이번 응답만 보냄)
+        ttl: 응답 캐시 유지 시간 (초)
+        max_age: Cache-Control max-age (초)
+
+    Returns:
+        200 JSON 응답 또는 304 응답
+    """
+    cached = await aget_cache(key, ttl)
+    if cached is None:
+        async def render() -> CachedResponse:
+            payload, last_modified, cacheable = await build()
+            body = dump_json(payload)
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            entry = CachedResponse(body, etag, last_modified, cacheable)
+            if cacheable:
+                await aset_cache(key, entry, ttl)
+            return entry
+
+        cached = await _response_flight.do(key, render)
+
+    cache_control = f"public, max-age={max_age}, must-revalidate" if cached.cacheable else "no-cache"
+    headers = {"ETag": cached.etag, "Cache-Control": cache_control}
+    if cached.last_modified:
+        headers["Last-Modified"] = cached.last_modified
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
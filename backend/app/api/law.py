@@ -1,6 +1,10 @@
 """Law API endpoints"""
-from fastapi import APIRouter, Query
-from app.services.law_service import LawService
+from typing import Optional
+from fastapi import APIRouter, Query, Request
+from app.services.law_service import LawService, is_fallback
+from app.api.http_cache import cached_json_response, last_modified_of
+from app.core.cache import get_cache_key
+from app.core.config import settings
 from app.core.exceptions import LawNotFoundError, InvalidRequestError
 import logging
 
@@ -10,45 +14,79 @@ router = APIRouter(prefix="/api/laws", tags=["laws"])
 law_service = LawService()
 
 
+def _respond(request: Request, name: str, build, *args):
+    """
+    직렬화된 응답 캐시 + ETag/304 로 응답
+
+    캐시 키에 데이터 버전(목업/코퍼스 버전)을 넣어서 코퍼스가 바뀌면 새 응답을 만듭니다.
+    버전을 알 수 없는 외부 API 응답은 짧게만 캐싱합니다.
+    """
+    version = law_service.data_version()
+    key = get_cache_key(f"law_response_{name}", version, *args)
+    ttl = 3600 if version else settings.law_response_cache_ttl
+    return cached_json_response(request, key, build, ttl=ttl, max_age=settings.law_response_max_age)
+
+
 @router.get("/")
-async def get_laws():
+async def get_laws(request: Request):
     """모든 법령 목록 조회"""
-    laws = law_service.get_all_laws()
-    return {"laws": laws, "count": len(laws)}
+    async def build():
+        laws = law_service.get_all_laws()
+        # 목록은 법령 추가/삭제로도 바뀌므로 개정일로 Last-Modified 를 만들지 않음 (ETag 로만 재검증)
+        return {"laws": laws, "count": len(laws)}, None, True
+
+    return await _respond(request, "list", build)
 
 
 @router.get("/search")
-async def search_laws(keyword: str = Query(..., description="검색 키워드")):
-    """키워드로 법령 검색 (관련도 순 정렬)"""
+async def search_laws(
+    request: Request,
+    keyword: str = Query(..., description="검색 키워드"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="상위 결과 개수"),
+):
+    """키워드로 법령 검색 (BM25F 관련도 순 정렬)"""
     if not keyword or not keyword.strip():
         raise InvalidRequestError("검색 키워드를 입력해주세요.")
     
     if len(keyword) > 100:
         raise InvalidRequestError("검색 키워드는 100자 이하로 입력해주세요.")
     
-    try:
-        results = law_service.search_laws(keyword)
+    async def build():
+        results = await law_service.search_laws(keyword, limit)
         # 관련도 순으로 정렬
-        ranked_results = law_service.rank_search_results(results, keyword)
-        return {"laws": ranked_results, "count": len(ranked_results), "keyword": keyword}
+        ranked_results = law_service.rank_search_results(results, keyword, limit)
+        payload = {
+            "laws": ranked_results,
+            "count": len(ranked_results),
+            "keyword": keyword,
+        }
+        # 검색 결과 집합은 개정일과 무관하게 바뀔 수 있으므로 ETag 로만 재검증,
+        # 외부 API 장애로 대체한 결과는 응답 캐시에 저장하지 않음
+        return payload, None, not is_fallback(results)
+
+    try:
+        return await _respond(request, "search", build, keyword, limit)
     except Exception as e:
         logger.error(f"법령 검색 중 오류: {str(e)}")
         raise
 
 
 @router.get("/{law_id}")
-async def get_law(law_id: str):
+async def get_law(request: Request, law_id: str):
     """법령 ID로 법령 상세 조회"""
-    law = law_service.get_law(law_id)
-    if not law:
-        raise LawNotFoundError(law_id)
-    return {"law": law}
+    async def build():
+        law = await law_service.get_law(law_id)
+        if not law:
+            raise LawNotFoundError(law_id)
+        return {"law": law}, last_modified_of([law]), not is_fallback(law)
+
+    return await _respond(request, "detail", build, law_id)
 
 
 @router.get("/{law_id}/articles/{article_id}")
 async def get_article(law_id: str, article_id: str):
-    """조문 ID로 조문 상세 조회"""
-    article = law_service.get_article(article_id)
+    """조문 ID로 조문 상세 조회 (해당 법령 소속 조문만)"""
+    article = await law_service.get_article(article_id, law_id)
     if not article:
         raise LawNotFoundError(f"조문을 찾을 수 없습니다. (ID: {article_id})")
     return {"article": article}
@@ -1,11 +1,133 @@
 """캐시 유틸리티"""
-from typing import Optional, Any
-from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Set, Tuple
+import asyncio
+import functools
 import hashlib
 import json
+import logging
+import pickle
+import threading
+import time
 
-# 간단한 인메모리 캐시 (프로덕션에서는 Redis 등을 사용 권장)
-_cache: dict[str, dict[str, Any]] = {}
+from app.core.cache_backends import (
+    CACHE_BACKEND_ERRORS,
+    BoundedCache,
+    CacheBackend,
+    RedisBackend,
+    SQLiteBackend,
+    TieredCache,
+    estimate_size,
+    key_segment,
+)
+from app.core.config import settings
+from app.core.metrics import LatencyHistogram
+from app.core.singleflight import SingleFlight, SyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def create_cache_backend(backend: Optional[str] = None) -> CacheBackend:
+    """
+    설정에 따라 캐시 백엔드 생성
+
+    Args:
+        backend: "memory" / "sqlite" / "redis" / "tiered" (None이면 settings.cache_backend)
+
+    Returns:
+        CacheBackend
+    """
+    backend = backend or settings.cache_backend
+    signing_key = settings.cache_signing_key.encode("utf-8") or None
+    if backend == "sqlite":
+        return SQLiteBackend(
+            settings.cache_sqlite_path, max_entries=settings.cache_l2_max_entries, signing_key=signing_key
+        )
+    if backend == "redis":
+        return RedisBackend(settings.cache_redis_url, signing_key)
+    memory = BoundedCache(
+        max_entries=settings.cache_max_entries,
+        max_bytes=settings.cache_max_bytes,
+        prefix_quotas=settings.cache_prefix_quotas,
+    )
+    if backend == "tiered":
+        return TieredCache(memory, SQLiteBackend(
+            settings.cache_sqlite_path, max_entries=settings.cache_l2_max_entries, signing_key=signing_key
+        ))
+    return memory
+
+
+# 기본은 워커별 인메모리 캐시, 워커/호스트 간 공유가 필요하면 CACHE_BACKEND=sqlite|redis,
+# 재시작 후에도 캐시를 유지하려면 CACHE_BACKEND=tiered
+_cache: CacheBackend = create_cache_backend()
+_sweeper: Optional[threading.Thread] = None
+_sweeper_stop = threading.Event()
+
+# lookup_cache() 상태
+FRESH = "fresh"
+REFRESH_AHEAD = "refresh_ahead"
+STALE = "stale"
+
+
+class StaleableEntry(NamedTuple):
+    """stale-while-revalidate 정책이 있는 구역의 저장 형식
+
+    백엔드에는 ttl + stale_seconds 동안 저장하고, fresh_until(wall clock) 이후는 stale 로 봅니다.
+    """
+
+    value: Any
+    fresh_until: float
+    ttl: float
+
+
+# stale 판정 시계 (공유 백엔드에서도 비교할 수 있도록 wall clock, 테스트에서 교체)
+_clock = time.time
+
+# 백그라운드 갱신 Task (완료 전에 GC 되지 않도록 참조 유지)
+_refresh_tasks: Set[asyncio.Task] = set()
+_refresh_counts: Dict[str, Dict[str, int]] = {}
+
+# 백엔드 장애 로그는 이 간격(초)마다 한 번만 warning (장애 중 요청마다 로그가 쌓이지 않도록)
+_ERROR_LOG_INTERVAL = 30.0
+_last_error_log = 0.0
+_backend_errors = 0
+
+
+class PrefixMetrics:
+    """키 접두사별 조회/저장 횟수와 적중/미스 지연 시간"""
+
+    def __init__(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.sets = 0
+        # 백엔드 장애로 실패한 조회/저장/삭제 수 (조회는 미스, 저장은 건너뜀으로 처리)
+        self.errors = 0
+        self.hit_latency = LatencyHistogram()
+        self.miss_latency = LatencyHistogram()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "errors": self.errors,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "hit_latency": self.hit_latency.snapshot(),
+            "miss_latency": self.miss_latency.snapshot(),
+        }
+
+
+_prefix_metrics: Dict[str, PrefixMetrics] = {}
+
+
+def _metrics_for(key: str) -> PrefixMetrics:
+    prefix = key_segment(key)
+    metrics = _prefix_metrics.get(prefix)
+    if metrics is None:
+        metrics = _prefix_metrics[prefix] = PrefixMetrics()
+    return metrics
 
 
 def get_cache_key(prefix: str, *args, **kwargs) -> str:
@@ -31,6 +153,10 @@ def get_cache_key(prefix: str, *args, **kwargs) -> str:
     return f"{prefix}:{key_hash}"
 
 
+def _refresh_policy(key: str) -> Optional[Dict[str, float]]:
+    return settings.cache_refresh_policies.get(key_segment(key))
+
+
 def get_cache(key: str, ttl: int = 3600) -> Optional[Any]:
     """
     캐시에서 값 가져오기
@@ -40,37 +166,199 @@ def get_cache(key: str, ttl: int = 3600) -> Optional[Any]:
         ttl: Time To Live (초 단위, 기본값 1시간)
     
     Returns:
-        캐시된 값 또는 None
+        캐시된 값 또는 None (stale 항목도 None)
     """
-    if key not in _cache:
-        return None
-    
-    cached_item = _cache[key]
-    expires_at = cached_item.get("expires_at")
-    
-    # 만료 시간 확인
-    if expires_at and datetime.now() > expires_at:
-        del _cache[key]
+    value, state = lookup_cache(key)
+    return None if state == STALE else value
+
+
+def _backend_error(key: str, operation: str, error: Exception) -> None:
+    """백엔드 장애 기록 (요청은 캐시 없이 계속 진행)"""
+    global _last_error_log, _backend_errors
+    _backend_errors += 1
+    _metrics_for(key).errors += 1
+    now = time.monotonic()
+    if now - _last_error_log >= _ERROR_LOG_INTERVAL:
+        _last_error_log = now
+        logger.warning(f"캐시 백엔드({_cache.name}) {operation} 실패, 캐시 없이 진행합니다 ({key}): {error!r}")
+    else:
+        logger.debug(f"캐시 백엔드({_cache.name}) {operation} 실패 ({key}): {error!r}")
+
+
+def _backend_get(key: str, fetch: bool = False) -> Optional[Any]:
+    try:
+        return _cache.fetch(key) if fetch else _cache.get(key)
+    except CACHE_BACKEND_ERRORS as e:
+        _backend_error(key, "조회", e)
         return None
-    
-    return cached_item.get("value")
+
+
+def _backend_set(key: str, value: Any, ttl: float) -> None:
+    try:
+        _cache.set(key, value, ttl)
+    except CACHE_BACKEND_ERRORS as e:
+        _backend_error(key, "저장", e)
+
+
+def _backend_clear(prefix: Optional[str]) -> int:
+    try:
+        return _cache.clear(prefix)
+    except CACHE_BACKEND_ERRORS as e:
+        _backend_error(prefix or "*", "삭제", e)
+        return 0
+
+
+async def _run_blocking(func, *args) -> Any:
+    """I/O 를 하는 백엔드면 스레드에서 실행 (이벤트 루프를 막지 않도록)"""
+    if _cache.blocking:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+def lookup_cache(key: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    캐시 값과 신선도 조회
+
+    백엔드 장애(연결 실패, 잠금, 손상된 값)는 미스로 처리하고 cache_metrics()의 errors 로 셉니다.
+
+    Args:
+        key: 캐시 키
+
+    Returns:
+        (값, 상태) - 상태는 FRESH / REFRESH_AHEAD(곧 만료) / STALE(만료됐지만 보관 중),
+        캐시에 없으면 (None, None)
+    """
+    start = time.perf_counter()
+    item = _backend_get(key)
+    return _resolve(key, item, time.perf_counter() - start)
+
+
+async def alookup_cache(key: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    lookup_cache() 의 async 버전 (sqlite/redis 조회는 스레드에서 실행)
+
+    tiered 백엔드의 L1 적중은 스레드를 거치지 않습니다.
+    """
+    start = time.perf_counter()
+    item = _cache.peek(key) if _cache.blocking else None
+    if item is None:
+        item = await _run_blocking(_backend_get, key, _cache.blocking)
+    return _resolve(key, item, time.perf_counter() - start)
+
+
+def _resolve(key: str, item: Optional[Any], elapsed: float) -> Tuple[Optional[Any], Optional[str]]:
+    metrics = _metrics_for(key)
+    if item is None:
+        metrics.misses += 1
+        metrics.miss_latency.observe(elapsed)
+        return None, None
+    metrics.hit_latency.observe(elapsed)
+    if not isinstance(item, StaleableEntry):
+        metrics.hits += 1
+        return item, FRESH
+    remaining = item.fresh_until - _clock()
+    if remaining <= 0:
+        metrics.stale_hits += 1
+        return item.value, STALE
+    metrics.hits += 1
+    policy = _refresh_policy(key) or {}
+    if remaining <= item.ttl * policy.get("refresh_ahead", 0.0):
+        return item.value, REFRESH_AHEAD
+    return item.value, FRESH
+
+
+async def aget_cache(key: str, ttl: int = 3600) -> Optional[Any]:
+    """get_cache() 의 async 버전 (sqlite/redis 조회는 스레드에서 실행)"""
+    value, state = await alookup_cache(key)
+    return None if state == STALE else value
+
+
+def _entry_for(key: str, value: Any, ttl: int) -> Tuple[Any, float]:
+    """(백엔드에 저장할 값, 백엔드 TTL) - stale-while-revalidate 구역은 StaleableEntry 로 감쌈"""
+    _metrics_for(key).sets += 1
+    policy = _refresh_policy(key)
+    if policy is None:
+        return value, ttl
+    return StaleableEntry(value, _clock() + ttl, ttl), ttl + policy.get("stale_seconds", 0)
 
 
 def set_cache(key: str, value: Any, ttl: int = 3600) -> None:
     """
-    캐시에 값 저장
+    캐시에 값 저장 (한도를 넘으면 같은 구역에서 가장 오래 사용되지 않은 항목부터 제거)
+    
+    stale-while-revalidate 정책이 있는 구역(settings.cache_refresh_policies)은
+    ttl 이 지난 뒤에도 stale_seconds 동안 보관합니다.
+    백엔드 장애 시에는 저장을 건너뛰고 cache_metrics()의 errors 로 셉니다.
     
     Args:
         key: 캐시 키
         value: 저장할 값
         ttl: Time To Live (초 단위, 기본값 1시간)
     """
-    expires_at = datetime.now() + timedelta(seconds=ttl)
-    _cache[key] = {
-        "value": value,
-        "expires_at": expires_at,
-        "created_at": datetime.now()
-    }
+    _backend_set(key, *_entry_for(key, value, ttl))
+
+
+async def aset_cache(key: str, value: Any, ttl: int = 3600) -> None:
+    """set_cache() 의 async 버전 (sqlite/redis 저장은 스레드에서 실행)"""
+    await _run_blocking(_backend_set, key, *_entry_for(key, value, ttl))
+
+
+async def get_or_revalidate(
+    key: str,
+    flight: SingleFlight,
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    stale-while-revalidate / refresh-ahead 조회
+
+    - 신선한 값: 그대로 반환
+    - 곧 만료될 값(refresh-ahead) / 만료된 값(stale): 바로 반환하고 백그라운드에서 갱신
+    - 캐시에 없으면: fetch() 결과를 기다림 (동시 미스는 single-flight 로 병합)
+
+    fetch()는 결과를 직접 aset_cache 해야 합니다 (실패/대체 결과는 캐싱하지 않아도 됨).
+
+    Args:
+        key: 캐시 키
+        flight: 병합에 쓸 SingleFlight (갱신 중인 키는 중복 갱신하지 않음)
+        fetch: 원본 조회 코루틴 함수
+
+    Returns:
+        캐시된 값 또는 fetch() 결과
+    """
+    value, state = await alookup_cache(key)
+    if state is None:
+        return await flight.do(key, fetch)
+    if state != FRESH:
+        _count_refresh(key, state)
+        _schedule_refresh(key, flight, fetch)
+    return value
+
+
+def _count_refresh(key: str, counter: str) -> None:
+    counters = _refresh_counts.setdefault(key_segment(key), {})
+    counters[counter] = counters.get(counter, 0) + 1
+
+
+def _schedule_refresh(key: str, flight: SingleFlight, fetch: Callable[[], Awaitable[Any]]) -> None:
+    if flight.is_running(key):
+        return
+    _count_refresh(key, "refreshes")
+    task = asyncio.ensure_future(flight.do(key, fetch))
+    _refresh_tasks.add(task)
+    task.add_done_callback(lambda done: _refresh_done(key, done))
+
+
+def _refresh_done(key: str, task: asyncio.Task) -> None:
+    _refresh_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # stale 값은 그대로 남아 있으므로 다음 조회에서 다시 시도
+        _count_refresh(key, "refresh_errors")
+        logger.warning(f"캐시 백그라운드 갱신 실패 ({key}): {task.exception()}")
+
+
+def refresh_stats() -> Dict[str, Dict[str, int]]:
+    """구역별 stale/refresh-ahead 응답 수와 백그라운드 갱신 수"""
+    return {segment: dict(counters) for segment, counters in _refresh_counts.items()}
 
 
 def clear_cache(prefix: Optional[str] = None) -> int:
@@ -81,46 +369,303 @@ def clear_cache(prefix: Optional[str] = None) -> int:
         prefix: 접두사로 시작하는 키만 삭제 (None이면 전체 삭제)
     
     Returns:
-        삭제된 항목 수
+        삭제된 항목 수 (백엔드 장애 시 0)
     """
-    if prefix is None:
-        count = len(_cache)
-        _cache.clear()
-        return count
-    
-    keys_to_delete = [key for key in _cache.keys() if key.startswith(prefix)]
-    for key in keys_to_delete:
-        del _cache[key]
-    
-    return len(keys_to_delete)
+    return _backend_clear(prefix)
 
 
-def cache_decorator(ttl: int = 3600, prefix: str = "cache"):
+async def aclear_cache(prefix: Optional[str] = None) -> int:
+    """clear_cache() 의 async 버전 (sqlite/redis 삭제는 스레드에서 실행)"""
+    return await _run_blocking(_backend_clear, prefix)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """구역별 캐시 통계"""
+    return _cache.stats()
+
+
+def cache_metrics() -> Dict[str, Any]:
     """
-    함수 결과를 캐싱하는 데코레이터
-    
+    캐시 관측 지표 (관리자 API 용)
+
+    Returns:
+        - backend: 백엔드 이름
+        - prefixes: 키 접두사(law_detail, law_search_mock, memo 등)별 적중/미스/저장 수, 적중률,
+          항목 수/바이트/제거/만료 수, 적중·미스 지연 시간 히스토그램
+        - segments: 백엔드 구역별 통계 (인메모리는 quota 구역, 한도 포함)
+        - errors: 백엔드 장애로 실패한 조회/저장/삭제 수 (접두사별 수는 prefixes 의 errors)
+        - refresh: stale-while-revalidate / refresh-ahead 갱신 수
+        - memoize: memoize 함수별 통계
+    """
+    try:
+        usage = _cache.usage()
+        segments = _cache.stats()
+    except CACHE_BACKEND_ERRORS as e:
+        logger.warning(f"캐시 백엔드({_cache.name}) 통계 조회 실패: {e!r}")
+        usage, segments = {}, {"error": repr(e)}
+    prefixes: Dict[str, Dict[str, Any]] = {}
+    for prefix in sorted(set(usage) | set(_prefix_metrics)):
+        item = dict(usage.get(prefix, {"entries": 0, "bytes": 0, "evictions": 0, "expirations": 0}))
+        if prefix in _prefix_metrics:
+            item.update(_prefix_metrics[prefix].stats())
+        prefixes[prefix] = item
+    return {
+        "backend": _cache.name,
+        "prefixes": prefixes,
+        "segments": segments,
+        "errors": _backend_errors,
+        "refresh": refresh_stats(),
+        "memoize": memoize_stats(),
+    }
+
+
+def get_cache_backend() -> CacheBackend:
+    """현재 캐시 백엔드"""
+    return _cache
+
+
+def warm_cache(limit: Optional[int] = None) -> int:
+    """
+    디스크(L2)에 남아 있는 캐시로 인메모리(L1) 채우기 (tiered 백엔드에서만 동작)
+
+    Args:
+        limit: 최대 항목 수 (None이면 L1 최대 항목 수)
+
+    Returns:
+        채운 항목 수
+    """
+    if not isinstance(_cache, TieredCache):
+        return 0
+    try:
+        count = _cache.warm(limit)
+    except CACHE_BACKEND_ERRORS as e:
+        logger.warning(f"디스크 캐시 로드 실패: {e!r}")
+        return 0
+    logger.info(f"디스크 캐시에서 {count}건 로드")
+    return count
+
+
+def start_cache_sweeper(interval: float = 60.0) -> None:
+    """만료 캐시 백그라운드 정리 시작 (앱 시작 시)"""
+    global _sweeper
+    if _sweeper is not None and _sweeper.is_alive():
+        return
+    _sweeper_stop.clear()
+
+    def run() -> None:
+        while not _sweeper_stop.wait(interval):
+            try:
+                removed = _cache.sweep()
+            except Exception as e:
+                # 공유 백엔드 일시 장애로 정리 스레드가 죽지 않도록
+                logger.warning(f"캐시 정리 실패: {e}")
+                continue
+            if removed:
+                logger.debug(f"만료 캐시 {removed}건 정리")
+
+    _sweeper = threading.Thread(target=run, name="cache-sweeper", daemon=True)
+    _sweeper.start()
+
+
+def stop_cache_sweeper() -> None:
+    """만료 캐시 백그라운드 정리 종료 (앱 종료 시)"""
+    global _sweeper
+    _sweeper_stop.set()
+    if _sweeper is not None:
+        _sweeper.join(timeout=1.0)
+        _sweeper = None
+    _cache.close()
+
+
+# 함수 결과 None 을 캐시의 "없음"과 구분하기 위한 저장 값
+_CACHED_NONE = "__cached_none__"
+
+# 타입 태그를 붙인 인자 문자열이 이 길이를 넘으면 해시로 줄임
+_MAX_RAW_KEY = 128
+# 값 repr 이 곧 값인 타입 (정확히 이 타입일 때만, 하위 클래스는 제외)
+_FAST_KEY_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+_memo_stats: Dict[str, "MemoStats"] = {}
+
+
+def _typed_repr(value: Any) -> Optional[str]:
+    """기본 타입 (및 그 tuple / frozenset) -> 타입 태그가 붙은 repr, 그 밖의 값은 None"""
+    value_type = type(value)
+    if value_type in _FAST_KEY_TYPES:
+        return f"{value_type.__name__}:{value!r}"
+    if value_type is tuple or value_type is frozenset:
+        parts = [_typed_repr(item) for item in value]
+        if any(part is None for part in parts):
+            return None
+        if value_type is frozenset:
+            parts.sort()
+        return f"{value_type.__name__}({','.join(parts)})"
+    return None
+
+
+def make_fast_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """
+    함수 인자 -> 캐시 키 (타입 구분)
+
+    None / bool / int / float / str / bytes 와 이들로 된 tuple / frozenset 은 타입 태그를 붙인 repr 로
+    키를 만들어 1 / 1.0 / True / "1" 이 서로 다른 키가 됩니다. 짧은 키는 그대로 쓰고 긴 키만 blake2b 로 줄입니다.
+    그 밖의 인자(dict, list, 객체, NumPy 배열 등)는 repr 에 객체 주소가 들어가거나 내용이 생략될 수 있으므로
+    pickle 직렬화 결과를 blake2b 로 해싱합니다.
+
+    Args:
+        args: 위치 인자
+        kwargs: 키워드 인자
+
+    Returns:
+        키 문자열
+
+    Raises:
+        TypeError: pickle 로 직렬화할 수 없는 인자 (캐싱하지 않아야 하는 호출)
+    """
+    parts = [_typed_repr(arg) for arg in args]
+    for name in sorted(kwargs):
+        part = _typed_repr(kwargs[name])
+        parts.append(None if part is None else f"{name}={part}")
+    if None not in parts:
+        raw = "|".join(parts)
+        if len(raw) <= _MAX_RAW_KEY:
+            return raw
+        return hashlib.blake2b(raw.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    try:
+        data = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise TypeError(f"캐시 키로 만들 수 없는 인자입니다: {e}") from e
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class MemoStats:
+    """memoize 함수별 적중/미스/지연 시간 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_latency = LatencyHistogram()
+        self.miss_latency = LatencyHistogram()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / total if total else 0.0,
+            "hit_latency": self.hit_latency.snapshot(),
+            "miss_latency": self.miss_latency.snapshot(),
+        }
+
+
+def _unique_memo_name(name: str) -> str:
+    """같은 이름(모듈 + qualname)의 함수가 또 memoize 되면 "#2", "#3" 을 붙임 (통계/캐시 키 구분)"""
+    if name not in _memo_stats:
+        return name
+    n = 2
+    while f"{name}#{n}" in _memo_stats:
+        n += 1
+    return f"{name}#{n}"
+
+
+def memoize(ttl: int = 3600, prefix: str = "memo"):
+    """
+    함수 결과를 캐싱하는 데코레이터 (def / async def 모두 지원)
+
+    - None 등 falsy 결과도 캐싱
+    - 같은 인자의 동시 호출은 한 번만 실행 (async: SingleFlight, 동기: 스레드 간 병합)
+    - 함수별 적중/미스/지연 시간 통계: wrapper.cache_stats(), memoize_stats()
+    - wrapper.cache_clear() 로 해당 함수의 캐시만 삭제
+    - 키는 make_fast_key() (pickle 로 직렬화할 수 없는 인자로 호출하면 TypeError)
+
     Args:
         ttl: 캐시 유지 시간 (초)
-        prefix: 캐시 키 접두사
+        prefix: 캐시 키 접두사 (구역/통계 단위)
     """
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            # 캐시 키 생성
-            cache_key = get_cache_key(prefix, func.__name__, *args, **kwargs)
-            
-            # 캐시에서 가져오기
-            cached_value = get_cache(cache_key, ttl)
-            if cached_value is not None:
-                return cached_value
-            
-            # 함수 실행
-            result = func(*args, **kwargs)
-            
-            # 결과 캐싱
-            set_cache(cache_key, result, ttl)
-            
+        name = _unique_memo_name(f"{func.__module__}.{func.__qualname__}")
+        key_prefix = f"{prefix}:{name}:"
+        stats = _memo_stats[name] = MemoStats(name)
+
+        def lookup(args, kwargs) -> Tuple[str, Optional[Any]]:
+            key = key_prefix + make_fast_key(args, kwargs)
+            return key, get_cache(key, ttl)
+
+        def store(key: str, result: Any) -> Any:
+            set_cache(key, _CACHED_NONE if result is None else result, ttl)
+            return result
+
+        async def astore(key: str, result: Any) -> Any:
+            await aset_cache(key, _CACHED_NONE if result is None else result, ttl)
             return result
-        
+
+        def unwrap(cached: Any) -> Any:
+            return None if isinstance(cached, str) and cached == _CACHED_NONE else cached
+
+        if asyncio.iscoroutinefunction(func):
+            flight = SingleFlight(name)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                key = key_prefix + make_fast_key(args, kwargs)
+                cached = await aget_cache(key, ttl)
+                if cached is not None:
+                    stats.hits += 1
+                    stats.hit_latency.observe(time.perf_counter() - start)
+                    return unwrap(cached)
+                stats.misses += 1
+                try:
+                    return await flight.do(key, lambda: _run_and_store(func, args, kwargs, key, astore))
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    stats.miss_latency.observe(time.perf_counter() - start)
+        else:
+            flight = SyncSingleFlight(name)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                key, cached = lookup(args, kwargs)
+                if cached is not None:
+                    stats.hits += 1
+                    stats.hit_latency.observe(time.perf_counter() - start)
+                    return unwrap(cached)
+                stats.misses += 1
+                try:
+                    return flight.do(key, lambda: store(key, func(*args, **kwargs)))
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    stats.miss_latency.observe(time.perf_counter() - start)
+
+        wrapper.cache_stats = stats.stats
+        wrapper.cache_clear = lambda: clear_cache(key_prefix)
         return wrapper
     return decorator
 
+
+async def _run_and_store(func, args, kwargs, key: str, store) -> Any:
+    return await store(key, await func(*args, **kwargs))
+
+
+def memoize_stats() -> Dict[str, Dict[str, Any]]:
+    """memoize 함수별 통계"""
+    return {name: stats.stats() for name, stats in _memo_stats.items()}
+
+
+def cache_decorator(ttl: int = 3600, prefix: str = "cache"):
+    """
+    함수 결과를 캐싱하는 데코레이터 (memoize 참고, 기존 호출부 호환용)
+    
+    Args:
+        ttl: 캐시 유지 시간 (초)
+        prefix: 캐시 키 접두사
+    """
+    return memoize(ttl=ttl, prefix=prefix)
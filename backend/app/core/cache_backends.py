@@ -0,0 +1,797 @@
+"""캐시 백엔드 (인메모리 / SQLite 파일 / Redis 프로토콜)
+
+- memory: 워커 프로세스별 LRU 캐시 (직렬화 없음, 가장 빠름)
+- sqlite: 같은 호스트의 워커들이 하나의 SQLite 파일(WAL)을 공유
+- redis: Redis 프로토콜(RESP) 서버를 여러 호스트가 공유
+- tiered: 작은 인메모리 L1 + 재시작 후에도 남는 SQLite 파일 L2
+
+공유 백엔드는 값을 pickle(최신 프로토콜) 바이너리 앞에 HMAC-SHA256 서명을 붙여 저장하고,
+서명이 맞는 값만 복원합니다 (공유 서버에 다른 누군가가 쓴 값을 unpickle 하지 않도록).
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from urllib.parse import unquote, urlparse
+import hashlib
+import hmac
+import logging
+import os
+import pickle
+import secrets
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+class CacheValueError(Exception):
+    """복원할 수 없는 캐시 값 (서명 불일치, 형식 오류)"""
+
+
+def serialize(value: Any, signing_key: bytes) -> bytes:
+    """캐시 값 -> 바이트 (HMAC-SHA256 서명 + pickle 최신 프로토콜)"""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return hmac.new(signing_key, data, hashlib.sha256).digest() + data
+
+
+def deserialize(data: bytes, signing_key: bytes) -> Any:
+    """
+    바이트 -> 캐시 값 (서명을 먼저 확인)
+
+    Raises:
+        CacheValueError: 서명이 맞지 않거나 복원할 수 없는 값
+    """
+    signature, payload = data[:_SIGNATURE_SIZE], data[_SIGNATURE_SIZE:]
+    if not hmac.compare_digest(signature, hmac.new(signing_key, payload, hashlib.sha256).digest()):
+        raise CacheValueError("캐시 값 서명이 맞지 않습니다.")
+    try:
+        return pickle.loads(payload)
+    except Exception as e:
+        # 코드 변경으로 클래스가 바뀐 항목 등
+        raise CacheValueError(f"캐시 값을 복원할 수 없습니다: {e}") from e
+
+
+def file_signing_key(path: str) -> bytes:
+    """
+    SQLite 캐시 파일 옆({path}.key)의 서명 키 (없으면 만들고, 같은 호스트의 워커들이 공유)
+
+    Args:
+        path: SQLite 캐시 파일 경로
+
+    Returns:
+        32바이트 키
+    """
+    if path == ":memory:":
+        return secrets.token_bytes(32)
+    key_path = f"{path}.key"
+    try:
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # 다른 워커가 방금 만들고 있으면 다 쓸 때까지 잠깐 기다림
+        for _ in range(100):
+            with open(key_path, "rb") as f:
+                key = f.read()
+            if len(key) >= 32:
+                return key
+            time.sleep(0.01)
+        raise CacheValueError(f"캐시 서명 키 파일이 비어 있습니다: {key_path}")
+    key = secrets.token_bytes(32)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def key_segment(key: str) -> str:
+    """통계용 키 구역 이름 (':' 앞 접두사)"""
+    return key.split(":", 1)[0]
+
+
+def _empty_usage() -> Dict[str, int]:
+    return {"entries": 0, "bytes": 0, "evictions": 0, "expirations": 0}
+
+
+class CacheBackend(ABC):
+    """캐시 백엔드 인터페이스 (get_cache / set_cache / clear_cache 가 사용)"""
+
+    name = "backend"
+    # 디스크/네트워크 I/O 를 하는지 (async 호출부에서는 스레드에서 실행)
+    blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+
+    def peek(self, key: str) -> Optional[Any]:
+        """I/O 없이 조회할 수 있는 값 (프로세스 메모리에 있는 값만, 없으면 None)"""
+        return None
+
+    def fetch(self, key: str) -> Optional[Any]:
+        """peek() 이 None 일 때의 조회 (I/O 가 필요한 부분만)"""
+        return self.get(key)
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """값 저장 (ttl 초 후 만료)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """키 하나 삭제"""
+
+    @abstractmethod
+    def clear(self, prefix: Optional[str] = None) -> int:
+        """접두사로 시작하는 키 삭제 (None이면 전체), 삭제 수 반환"""
+
+    def sweep(self) -> int:
+        """만료 항목 정리 (만료를 자체 처리하는 백엔드는 0)"""
+        return 0
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """구역별 통계"""
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """
+        키 접두사(':' 앞)별 항목 수/바이트/제거/만료 수
+
+        Returns:
+            접두사 -> {"entries", "bytes", "evictions", "expirations"} (백엔드가 알 수 있는 값만)
+        """
+        return {}
+
+    def close(self) -> None:
+        """연결 정리"""
+
+
+def estimate_size(value: Any) -> int:
+    """
+    값의 대략적인 메모리 크기 (바이트)
+
+    dict/list/tuple/set 을 따라 내려가며 sys.getsizeof 를 합산합니다.
+    저장 시 한 번만 계산하므로 조문이 많은 법령도 조회 비용에는 영향이 없습니다.
+
+    Args:
+        value: 크기를 잴 값
+
+    Returns:
+        바이트 수 (공유 객체는 한 번만 계산)
+    """
+    total = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+class CacheSegment:
+    """LRU 순서와 개수/바이트 한도를 가진 캐시 구역
+
+    항목: 키 -> (값, 만료 시각(monotonic), 크기)
+    """
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        # 키 접두사별 제거/만료 수 (구역 하나에 law_search_mock / law_search_external 등이 섞임)
+        self.removals: Dict[str, Dict[str, int]] = {}
+
+    def _count_removal(self, key: str, kind: str) -> None:
+        counters = self.removals.setdefault(key_segment(key), {"evictions": 0, "expirations": 0})
+        counters[kind] += 1
+
+    def get(self, key: str, now: float) -> Optional[Any]:
+        item = self.entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = item
+        if expires_at <= now:
+            self._remove(key)
+            self.expirations += 1
+            self._count_removal(key, "expirations")
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, expires_at: float, size: int) -> None:
+        if key in self.entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            # 구역 한도보다 큰 값은 다른 항목을 모두 밀어내므로 저장하지 않음
+            logger.debug(f"캐시 항목이 너무 커서 저장하지 않습니다: {key} ({size} bytes)")
+            return
+        self.entries[key] = (value, expires_at, size)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+            self._count_removal(oldest, "evictions")
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self.entries.pop(key)
+        self.bytes -= size
+
+    def delete(self, key: str) -> bool:
+        if key not in self.entries:
+            return False
+        self._remove(key)
+        return True
+
+    def delete_prefix(self, prefix: Optional[str]) -> int:
+        keys = [key for key in self.entries if prefix is None or key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def sweep(self, now: float) -> int:
+        """만료된 항목 정리"""
+        expired = [key for key, (_, expires_at, _) in self.entries.items() if expires_at <= now]
+        for key in expired:
+            self._remove(key)
+            self._count_removal(key, "expirations")
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class BoundedCache(CacheBackend):
+    """개수/바이트 한도가 있는 인메모리 LRU 캐시 (기본 백엔드, 워커 프로세스별)
+
+    - 키 접두사별 구역(quota)을 나눠서 검색 결과(law_search_*)가 아무리 많아도
+      법령 상세(law_detail) 항목을 밀어내지 못하게 함
+    - 구역마다 LRU 순서로 개수/바이트 한도를 넘는 항목을 제거
+    - 만료 항목은 조회 시 + 백그라운드 sweeper 가 주기적으로 정리
+    - 값을 직렬화하지 않고 객체 그대로 저장
+    """
+
+    name = "memory"
+    blocking = False
+
+    DEFAULT_SEGMENT = "default"
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        prefix_quotas: Optional[Dict[str, float]] = None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: 전체 최대 항목 수
+            max_bytes: 전체 최대 바이트 (대략적인 크기 기준)
+            prefix_quotas: 키 접두사 -> 전체 한도 중 해당 구역 비율 (나머지는 기본 구역)
+            clock: 시간 함수 (테스트용)
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self.max_entries = max_entries
+        quotas = dict(prefix_quotas or {})
+        default_share = max(1.0 - sum(quotas.values()), 0.05)
+        self._segments: Dict[str, CacheSegment] = {}
+        for name, share in list(quotas.items()) + [(self.DEFAULT_SEGMENT, default_share)]:
+            self._segments[name] = CacheSegment(
+                name,
+                max(int(max_entries * share), 1),
+                max(int(max_bytes * share), 1),
+            )
+        # 긴 접두사부터 비교 (law_search_external 이 law_search 보다 먼저)
+        self._prefixes: List[str] = sorted(quotas, key=len, reverse=True)
+
+    def _segment(self, key: str) -> CacheSegment:
+        for prefix in self._prefixes:
+            if key.startswith(prefix):
+                return self._segments[prefix]
+        return self._segments[self.DEFAULT_SEGMENT]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._segment(key).get(key, self._clock())
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        size = estimate_size(value) + sys.getsizeof(key)
+        with self._lock:
+            self._segment(key).set(key, value, self._clock() + ttl, size)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._segment(key).delete(key)
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        with self._lock:
+            return sum(segment.delete_prefix(prefix) for segment in self._segments.values())
+
+    def sweep(self) -> int:
+        """모든 구역의 만료 항목 정리"""
+        with self._lock:
+            now = self._clock()
+            return sum(segment.sweep(now) for segment in self._segments.values())
+
+    def __len__(self) -> int:
+        return sum(len(segment.entries) for segment in self._segments.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._segment(key).entries
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """구역별 항목 수/바이트/적중/미스/제거/만료 통계"""
+        with self._lock:
+            return {name: segment.stats() for name, segment in self._segments.items()}
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        usage: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for segment in self._segments.values():
+                for key, (_, _, size) in segment.entries.items():
+                    item = usage.setdefault(key_segment(key), _empty_usage())
+                    item["entries"] += 1
+                    item["bytes"] += size
+                for prefix, counters in segment.removals.items():
+                    item = usage.setdefault(prefix, _empty_usage())
+                    item["evictions"] += counters["evictions"]
+                    item["expirations"] += counters["expirations"]
+        return usage
+
+
+class SQLiteBackend(CacheBackend):
+    """SQLite 파일 캐시 (같은 호스트의 uvicorn 워커들이 공유)
+
+    WAL 모드라 여러 프로세스가 동시에 읽을 수 있고, 쓰기는 짧은 트랜잭션 하나입니다.
+    만료 시각은 프로세스 간에 비교할 수 있도록 wall clock(time.time) 기준입니다.
+    항목 수가 max_entries 를 넘으면 만료가 가장 가까운 항목부터 제거합니다.
+    서명 키를 주지 않으면 파일 옆의 키 파일({path}.key)을 씁니다.
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expires_at REAL NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at);
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100000,
+        clock=time.time,
+        signing_key: Optional[bytes] = None,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self._signing_key = signing_key or file_signing_key(path)
+        self._clock = clock
+        self._local = threading.local()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._writes = 0
+        with self.conn:
+            self.conn.executescript(self._SCHEMA)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """현재 스레드의 커넥션"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, key: str, counter: str, n: int = 1) -> None:
+        counters = self._counters.setdefault(key_segment(key), {})
+        counters[counter] = counters.get(counter, 0) + n
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        값과 남은 TTL 조회 (상위 캐시로 승격할 때 만료 시각을 유지하기 위해 사용)
+
+        Returns:
+            (값, 남은 초) 또는 None
+        """
+        row = self.conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        now = self._clock()
+        if row is None or row[1] <= now:
+            self._count(key, "misses")
+            return None
+        self._count(key, "hits")
+        return deserialize(row[0], self._signing_key), row[1] - now
+
+    def iter_entries(self, limit: int) -> Iterator[Tuple[str, Any, float]]:
+        """
+        만료되지 않은 항목을 만료가 늦은(최근에 저장된) 순서로 조회
+
+        Args:
+            limit: 최대 항목 수
+
+        Yields:
+            (키, 값, 남은 초)
+        """
+        now = self._clock()
+        rows = self.conn.execute(
+            "SELECT key, value, expires_at FROM cache WHERE expires_at > ? "
+            "ORDER BY expires_at DESC LIMIT ?",
+            (now, limit),
+        ).fetchall()
+        for key, data, expires_at in rows:
+            try:
+                yield key, deserialize(data, self._signing_key), expires_at - now
+            except Exception as e:
+                # 코드 변경 등으로 복원할 수 없는 항목은 건너뜀
+                logger.debug(f"캐시 항목 복원 실패: {key} ({e})")
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        data = serialize(value, self._signing_key)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+                (key, data, self._clock() + ttl, len(data)),
+            )
+        # 한도 확인은 가끔만 (매 쓰기마다 COUNT 하지 않도록)
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._evict()
+
+    def _evict(self) -> int:
+        with self.conn:
+            cur = self.conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY expires_at "
+                "LIMIT MAX((SELECT COUNT(*) FROM cache) - ?, 0))",
+                (self.max_entries,),
+            )
+        if cur.rowcount > 0:
+            self._count("default", "evictions", cur.rowcount)
+        return cur.rowcount
+
+    def delete(self, key: str) -> bool:
+        with self.conn:
+            return self.conn.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount > 0
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        with self.conn:
+            if prefix is None:
+                return self.conn.execute("DELETE FROM cache").rowcount
+            return self.conn.execute(
+                "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            ).rowcount
+
+    def sweep(self) -> int:
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+        if removed:
+            self._count("default", "expirations", removed)
+        return removed + self._evict()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats: Dict[str, Dict[str, Any]] = {}
+        rows = self.conn.execute(
+            "SELECT CASE WHEN instr(key, ':') > 0 THEN substr(key, 1, instr(key, ':') - 1) ELSE key END AS segment, "
+            "COUNT(*), SUM(size) FROM cache GROUP BY segment"
+        )
+        for segment, entries, size in rows:
+            stats[segment] = {"entries": entries, "bytes": size or 0}
+        for segment, counters in self._counters.items():
+            stats.setdefault(segment, {"entries": 0, "bytes": 0}).update(counters)
+        return stats
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        usage: Dict[str, Dict[str, int]] = {}
+        for segment, values in self.stats().items():
+            item = usage[segment] = _empty_usage()
+            for name in item:
+                item[name] = values.get(name, 0)
+        return usage
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RespError(Exception):
+    """Redis 서버 오류 응답"""
+
+
+# 캐시 백엔드 장애로 볼 예외 (연결 실패/타임아웃, 서버 오류 응답, SQLite 잠금/디스크 오류, 손상된 값)
+CACHE_BACKEND_ERRORS = (OSError, RespError, sqlite3.Error, CacheValueError)
+
+
+class RespClient:
+    """최소한의 Redis 프로토콜(RESP2) 클라이언트
+
+    캐시에 필요한 명령(GET/SET/DEL/SCAN 등)만 쓰므로 별도 패키지 없이 소켓으로 구현합니다.
+    스레드별로 연결을 하나씩 유지하고, 연결이 끊기면 한 번 다시 연결합니다.
+    """
+
+    def __init__(self, url: str, timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = (sock, sock.makefile("rb"))
+        self._local.conn = conn
+        if self.password:
+            auth = (self.username, self.password) if self.username else (self.password,)
+            self._call(conn, "AUTH", *auth)
+        if self.db:
+            self._call(conn, "SELECT", self.db)
+        return conn
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif not isinstance(arg, bytes):
+                arg = str(arg).encode("ascii")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read(self, reader) -> Any:
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            raise RespError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [self._read(reader) for _ in range(length)]
+        raise RespError(f"알 수 없는 응답: {line!r}")
+
+    def _call(self, conn, *args) -> Any:
+        sock, reader = conn
+        sock.sendall(self._encode(args))
+        return self._read(reader)
+
+    def execute(self, *args) -> Any:
+        """
+        명령 실행
+
+        Raises:
+            RespError: 서버 오류 응답
+            OSError: 연결 실패
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                return self._call(conn, *args)
+            except (OSError, ConnectionError):
+                self.close()
+        return self._call(self._connect(), *args)
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn[1].close()
+                conn[0].close()
+            except OSError:
+                pass
+            self._local.conn = None
+
+
+def _glob_escape(text: str) -> str:
+    for ch in "\\*?[]":
+        text = text.replace(ch, "\\" + ch)
+    return text
+
+
+class RedisBackend(CacheBackend):
+    """Redis 프로토콜 캐시 (여러 호스트/워커가 공유)
+
+    만료는 SET PX 로 서버가 처리하고, 메모리 한도/제거 정책은 서버 설정(maxmemory-policy)을 따릅니다.
+    다른 애플리케이션과 같은 서버를 써도 되도록 모든 키에 namespace 를 붙입니다.
+    값은 모든 워커/호스트가 같은 서명 키(CACHE_SIGNING_KEY)로 서명합니다.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        signing_key: bytes,
+        namespace: str = "lawchat:",
+        timeout: float = 1.0,
+    ):
+        if not signing_key:
+            raise ValueError("redis 캐시 백엔드에는 서명 키(CACHE_SIGNING_KEY)가 필요합니다.")
+        self._signing_key = signing_key
+        self.client = RespClient(url, timeout)
+        self.namespace = namespace
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, key: str, counter: str) -> None:
+        counters = self._counters.setdefault(key_segment(key), {})
+        counters[counter] = counters.get(counter, 0) + 1
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self.client.execute("GET", self.namespace + key)
+        if data is None:
+            self._count(key, "misses")
+            return None
+        self._count(key, "hits")
+        return deserialize(data, self._signing_key)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        data = serialize(value, self._signing_key)
+        self.client.execute("SET", self.namespace + key, data, "PX", max(int(ttl * 1000), 1))
+
+    def delete(self, key: str) -> bool:
+        return self.client.execute("DEL", self.namespace + key) > 0
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        pattern = _glob_escape(self.namespace + (prefix or "")) + "*"
+        removed = 0
+        cursor = b"0"
+        while True:
+            cursor, keys = self.client.execute("SCAN", cursor, "MATCH", pattern, "COUNT", 500)
+            if keys:
+                removed += self.client.execute("DEL", *keys)
+            if cursor in (b"0", "0"):
+                return removed
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {segment: dict(counters) for segment, counters in self._counters.items()}
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class TieredCache(CacheBackend):
+    """2단 캐시 (인메모리 L1 + 디스크 L2)
+
+    - 쓰기는 L1/L2 모두에 (write-through), 읽기는 L1 -> L2 순서
+    - L2에서 찾은 항목은 남은 TTL 그대로 L1으로 승격
+    - 재시작/배포 직후 warm()으로 L2의 최근 항목을 L1에 미리 채워서
+      첫 요청들이 law.go.kr / OpenAI 를 다시 호출하지 않게 함
+    """
+
+    name = "tiered"
+
+    def __init__(self, l1: BoundedCache, l2: SQLiteBackend):
+        self.l1 = l1
+        self.l2 = l2
+        self.promotions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+        return self.fetch(key)
+
+    def peek(self, key: str) -> Optional[Any]:
+        return self.l1.get(key)
+
+    def fetch(self, key: str) -> Optional[Any]:
+        """L2 조회 (찾으면 L1 으로 승격)"""
+        entry = self.l2.get_entry(key)
+        if entry is None:
+            return None
+        value, remaining = entry
+        self.l1.set(key, value, remaining)
+        self.promotions += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self.l1.set(key, value, ttl)
+        self.l2.set(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        deleted = self.l1.delete(key)
+        return self.l2.delete(key) or deleted
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        self.l1.clear(prefix)
+        # L1 항목은 모두 L2에도 있으므로 L2 삭제 수가 전체 삭제 수
+        return self.l2.clear(prefix)
+
+    def sweep(self) -> int:
+        return self.l1.sweep() + self.l2.sweep()
+
+    def warm(self, limit: Optional[int] = None) -> int:
+        """
+        L2의 최근 항목으로 L1 채우기 (앱 시작 시)
+
+        Args:
+            limit: 최대 항목 수 (None이면 L1 최대 항목 수)
+
+        Returns:
+            L1에 채운 항목 수
+        """
+        entries = list(self.l2.iter_entries(limit or self.l1.max_entries))
+        # 오래된 것부터 넣어야 구역이 넘칠 때 최근 항목이 LRU 로 남음
+        for key, value, remaining in reversed(entries):
+            self.l1.set(key, value, remaining)
+        return len(entries)
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """L1 사용량 + L2 항목 수/바이트 ("l2_entries" / "l2_bytes")"""
+        usage = self.l1.usage()
+        for prefix, values in self.l2.usage().items():
+            item = usage.setdefault(prefix, _empty_usage())
+            item["l2_entries"] = values["entries"]
+            item["l2_bytes"] = values["bytes"]
+        return usage
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """L1 구역별 통계 + L2 구역별 통계("l2:" 접두사)"""
+        stats = self.l1.stats()
+        for segment, values in self.l2.stats().items():
+            stats[f"l2:{segment}"] = values
+        stats["tiered"] = {"promotions": self.promotions}
+        return stats
+
+    def close(self) -> None:
+        self.l2.close()
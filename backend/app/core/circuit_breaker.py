@@ -0,0 +1,129 @@
+"""외부 API 회로 차단기 (circuit breaker)"""
+from typing import Any, Callable, Deque, Dict
+from collections import deque
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """실패율 기반 회로 차단기
+
+    - closed: 정상. 최근 window_size 번의 호출 중 실패율이 임계값 이상이면 open
+      (최소 minimum_calls 번은 호출된 뒤에만 판단)
+    - open: open_seconds 동안 호출하지 않고 바로 거절 (호출 측은 즉시 fallback)
+    - half_open: open_seconds 가 지나면 half_open_max_calls 번만 시험 호출을 허용해서
+      모두 성공하면 closed, 하나라도 실패하면 다시 open
+
+    이벤트 루프 한 곳에서 쓰는 것을 전제로 하며 락을 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 5,
+        window_size: int = 20,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CLOSED
+        self._results: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 유지 시간이 지났으면 half_open)"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+            self._trial_successes = 0
+        return self._state
+
+    def failure_rate(self) -> float:
+        """최근 호출 실패율"""
+        if not self._results:
+            return 0.0
+        return self._results.count(False) / len(self._results)
+
+    def allow_request(self) -> bool:
+        """
+        호출 허용 여부 (허용되면 반드시 record_success / record_failure / release 중 하나를 호출)
+
+        Returns:
+            호출해도 되면 True
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+            self._trial_calls += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록"""
+        if self._state == HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_max_calls:
+                self._close()
+            return
+        self._results.append(True)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (타임아웃/연결 오류/5xx)"""
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+        self._results.append(False)
+        if (
+            self._state == CLOSED
+            and len(self._results) >= self.minimum_calls
+            and self.failure_rate() >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(취소 등) - half_open 시험 호출 자리만 반환"""
+        if self._state == HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.opened += 1
+        logger.warning(
+            f"회로 차단 ({self.name}): 실패율 {self.failure_rate():.0%}, {self.open_seconds:.0f}초 동안 호출 중단"
+        )
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._results.clear()
+        logger.info(f"회로 복구 ({self.name})")
+
+    def stats(self) -> Dict[str, Any]:
+        """상태/실패율/거절 횟수"""
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 4),
+            "window": len(self._results),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
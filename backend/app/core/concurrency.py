@@ -0,0 +1,103 @@
+"""동시 실행 제한 + 대기열 한도 (backpressure)"""
+from typing import Any, AsyncIterator, Dict
+from contextlib import asynccontextmanager
+import asyncio
+import time
+
+from app.core.exceptions import ServiceOverloadedError
+from app.core.metrics import LatencyHistogram
+
+
+class ConcurrencyLimiter:
+    """동시 실행 수와 대기열 길이를 제한
+
+    - 동시에 max_concurrency 개까지만 실행하고 나머지는 대기
+    - 대기 중인 요청이 max_queue 개면 새 요청은 기다리지 않고 바로 ServiceOverloadedError(503)
+    - queue_timeout 안에 차례가 오지 않아도 ServiceOverloadedError
+    타임아웃이 날 때까지 요청이 쌓이는 대신 빨리 거절해서 클라이언트가 Retry-After 후 다시 시도하게 합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float = 10.0,
+        retry_after: int = 5,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_latency = LatencyHistogram()
+
+    def check_capacity(self) -> None:
+        """
+        대기열이 가득 찼으면 바로 거절 (스트리밍 응답 헤더를 보내기 전에 확인용)
+
+        Raises:
+            ServiceOverloadedError: 대기열 가득 참
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ServiceOverloadedError(self.name, self.retry_after)
+
+    async def acquire(self) -> None:
+        """
+        실행 슬롯 확보 (release() 로 반납)
+
+        Raises:
+            ServiceOverloadedError: 대기열 가득 참 / 대기 시간 초과
+        """
+        self.check_capacity()
+        if not self._semaphore.locked():
+            # 빈 슬롯이 있으면 대기 없이 바로 확보
+            await self._semaphore.acquire()
+            self.active += 1
+            return
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise ServiceOverloadedError(self.name, self.retry_after)
+        finally:
+            self.waiting -= 1
+            self.wait_latency.observe(time.perf_counter() - start)
+        self.active += 1
+
+    def release(self) -> None:
+        """실행 슬롯 반납"""
+        self.active -= 1
+        self.completed += 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """async with limiter.slot(): ... 로 슬롯을 잡고 실행"""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """실행/대기/거절 수와 대기 시간"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_latency": self.wait_latency.snapshot(),
+        }
@@ -1,5 +1,5 @@
 """Application configuration with environment variable validation"""
-from typing import List, Literal
+from typing import Dict, List, Literal
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
@@ -17,10 +17,98 @@ class Settings(BaseSettings):
     
     # OpenAI API
     openai_api_key: str = Field(..., description="OpenAI API key")
+    # OpenAI 호출 동시 실행/대기열 한도 (대기열이 차면 바로 503 + Retry-After)
+    openai_timeout: float = Field(default=60.0, description="OpenAI request timeout (seconds)")
+    openai_max_connections: int = Field(default=20, description="OpenAI max pooled connections")
+    openai_max_concurrency: int = Field(default=8, description="Maximum concurrent OpenAI calls per worker")
+    openai_max_queue: int = Field(default=32, description="Maximum OpenAI calls waiting for a slot per worker")
+    openai_queue_timeout: float = Field(default=10.0, description="Maximum wait for an OpenAI slot (seconds)")
+    openai_retry_after: int = Field(default=5, description="Retry-After seconds for overloaded responses")
+    # 첫 질문 답변 캐시 (정규화된 질문 + 법령 컨텍스트 해시 + 모델)
+    answer_cache_enabled: bool = Field(default=True, description="Reuse answers for identical first-turn questions")
+    answer_cache_ttl: int = Field(default=86400, description="Answer cache TTL (seconds)")
+    # 의미 기반 답변 캐시 (비슷한 첫 질문 + 같은 검색 법령이면 답변 재사용)
+    semantic_cache_enabled: bool = Field(default=False, description="Reuse answers for paraphrased first-turn questions (opt-in)")
+    semantic_cache_threshold: float = Field(default=0.8, description="Minimum question cosine similarity for a semantic cache hit")
+    semantic_cache_max_entries: int = Field(default=2000, description="Maximum semantic cache entries per worker")
+    semantic_cache_seed_scenarios: bool = Field(default=False, description="Answer MOCK_QA_SCENARIOS questions on startup (one OpenAI call each) and keep them as semantic cache entries")
+    # 프롬프트 법령 컨텍스트 토큰 예산 (관련도 순으로 채움)
+    prompt_context_token_budget: int = Field(default=3000, description="Token budget for the law context in a prompt")
+    prompt_token_encoding: str = Field(default="o200k_base", description="tiktoken encoding used to count prompt tokens")
+    # 대화 히스토리: 누적 요약 + 최근 N턴 원문을 토큰 예산 안에서 프롬프트에 포함
+    conversation_recent_turns: int = Field(default=2, description="Recent user/assistant turns sent verbatim")
+    conversation_history_token_budget: int = Field(default=1500, description="Token budget for summary + recent turns")
+    conversation_summary_enabled: bool = Field(default=True, description="Keep a rolling summary of older turns")
+    conversation_summary_max_tokens: int = Field(default=300, description="Maximum rolling summary length (tokens)")
     
     # 법령 API (국가법령정보센터)
     law_api_key: str = Field(default="", description="Law API key")
     
+    # 법령 API 커넥션 풀 (공유 httpx.AsyncClient)
+    law_api_timeout: float = Field(default=10.0, description="Law API request timeout (seconds)")
+    law_api_max_connections: int = Field(default=20, description="Law API max pooled connections")
+    law_api_max_keepalive: int = Field(default=10, description="Law API max keep-alive connections")
+    law_api_keepalive_expiry: float = Field(default=30.0, description="Law API keep-alive expiry (seconds)")
+    law_api_http2: bool = Field(default=True, description="Use HTTP/2 for Law API (needs the h2 package from httpx[http2]; falls back to HTTP/1.1 with a warning)")
+    
+    # 법령 API 회로 차단기 (최근 window 호출 중 실패율이 임계값 이상이면 open_seconds 동안 호출 중단)
+    law_api_breaker_failure_rate: float = Field(default=0.5, description="Failure rate that opens the circuit")
+    law_api_breaker_min_calls: int = Field(default=5, description="Minimum calls before the failure rate is evaluated")
+    law_api_breaker_window: int = Field(default=20, description="Number of recent calls in the failure-rate window")
+    law_api_breaker_open_seconds: float = Field(default=30.0, description="Seconds the circuit stays open")
+    # 키워드 검색(/api/laws/search) 최대 결과 수 - 로컬 코퍼스는 SQL LIMIT 으로 적용
+    law_search_max_results: int = Field(default=100, description="Maximum number of keyword search results")
+    # 존재하지 않는 법령 ID 결과 캐시 시간 (초)
+    law_not_found_ttl: int = Field(default=60, description="Negative cache TTL for missing laws (seconds)")
+    
+    # 법령 데이터 소스: auto(LAW_API_KEY 있으면 external, 없으면 mock) / mock / external / local
+    law_source: Literal["auto", "mock", "external", "local"] = Field(
+        default="auto",
+        description="Law data source: auto, mock, external (law.go.kr) or local (SQLite corpus)"
+    )
+    law_corpus_path: str = Field(default="./law_corpus.db", description="Local law corpus SQLite path")
+    
+    # 로컬 코퍼스 증분 동기화 - fixture 디렉터리를 지정하면 lawSearch.do 대신 사용
+    law_sync_fixture_dir: str = Field(default="", description="Local lawSearch/lawService XML fixture directory")
+    law_sync_interval_hours: float = Field(default=0, description="Corpus sync interval in hours (0 = disabled)")
+    
+    # dense(임베딩) 검색 설정 - scripts/build_dense_index.py 출력 디렉터리 (비우면 사용 안 함)
+    dense_index_dir: str = Field(default="", description="Dense passage index directory")
+    dense_top_k: int = Field(default=20, description="Dense retrieval top-k passages")
+    dense_min_score: float = Field(default=0.2, description="Minimum cosine similarity for dense hits")
+    dense_probes: int = Field(default=32, description="IVF lists scanned per dense query (more = better recall, slower)")
+    
+    # 인메모리 캐시 한도 - 접두사별 비율(quota)로 구역을 나눠서 검색 결과가 법령 상세를 밀어내지 않게 함
+    cache_max_entries: int = Field(default=10000, description="Maximum number of cache entries")
+    cache_max_bytes: int = Field(default=256 * 1024 * 1024, description="Approximate maximum cache size in bytes")
+    cache_prefix_quotas: Dict[str, float] = Field(
+        default={"law_detail": 0.4, "law_search": 0.2, "law_query": 0.1, "law_response": 0.1},
+        description="Share of the cache limits reserved per key prefix (JSON); the rest is shared"
+    )
+    cache_sweep_interval: float = Field(default=60.0, description="Expired cache sweep interval (seconds)")
+    # 접두사별 stale-while-revalidate / refresh-ahead 정책
+    # - stale_seconds: TTL 이 지난 뒤에도 보관하며 바로 응답하고 백그라운드에서 갱신하는 시간
+    # - refresh_ahead: 남은 신선 시간이 TTL 의 이 비율 이하일 때 조회되면 미리 백그라운드 갱신
+    cache_refresh_policies: Dict[str, Dict[str, float]] = Field(
+        default={"law_detail": {"stale_seconds": 86400, "refresh_ahead": 0.1}},
+        description="Stale-while-revalidate and refresh-ahead policy per key prefix (JSON)"
+    )
+    # /api/laws 응답 캐시 - 외부 API는 데이터 버전을 알 수 없어서 짧게 캐싱, 클라이언트는 ETag 로 재검증
+    law_response_cache_ttl: int = Field(default=300, description="Encoded law response cache TTL when the data version is unknown (seconds)")
+    law_response_max_age: int = Field(default=60, description="Cache-Control max-age for law responses (seconds)")
+    # 캐시 백엔드 - memory: 워커별, sqlite: 같은 호스트 워커 공유, redis: 여러 호스트 공유,
+    # tiered: 인메모리 L1(cache_max_*) + SQLite 파일 L2 (재시작 후에도 유지)
+    cache_backend: Literal["memory", "sqlite", "redis", "tiered"] = Field(default="memory", description="Cache backend")
+    cache_sqlite_path: str = Field(default="./cache.db", description="SQLite cache file path (sqlite backend / tiered L2)")
+    cache_l2_max_entries: int = Field(default=100000, description="Maximum number of entries in the SQLite cache file")
+    cache_warm_on_startup: bool = Field(default=True, description="Load recent L2 entries into memory on startup (tiered)")
+    cache_redis_url: str = Field(default="redis://localhost:6379/0", description="Redis (RESP) cache server URL")
+    # 공유 백엔드 값 서명 키 - redis 는 필수(모든 호스트가 같은 값), sqlite/tiered 는 비워 두면 {cache_sqlite_path}.key 사용
+    cache_signing_key: str = Field(default="", description="HMAC key for values in shared cache backends (required for redis)")
+    
+    # 관리자 API (/api/admin) - 토큰을 설정하면 X-Admin-Token 헤더 필요, 비워 두면 DEBUG 모드에서만 허용
+    admin_token: str = Field(default="", description="Token required for /api/admin endpoints")
+    
     # 애플리케이션 설정
     app_env: str = Field(default="development", description="Application environment")
     app_name: str = Field(default="LawChat", description="Application name")
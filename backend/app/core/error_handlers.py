@@ -16,13 +16,16 @@ logger = logging.getLogger(__name__)
 async def lawchat_exception_handler(request: Request, exc: LawChatException):
     """LawChat 커스텀 예외 핸들러"""
     logger.error(f"LawChatException: {exc.message} (Status: {exc.status_code})")
+    # 과부하(503) 응답은 언제 다시 시도할지 알려줌
+    retry_after = getattr(exc, "retry_after", None)
     return JSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
             "message": exc.message,
             "type": exc.__class__.__name__
-        }
+        },
+        headers={"Retry-After": str(retry_after)} if retry_after else None
     )
 
 
@@ -35,3 +35,24 @@ class InvalidRequestError(LawChatException):
     def __init__(self, message: str = "잘못된 요청입니다."):
         super().__init__(message, status_code=400)
 
+
+
+class CircuitOpenError(LawChatException):
+    """외부 API 회로 차단 중 (장애로 호출을 건너뜀)"""
+    def __init__(self, name: str = None):
+        message = "외부 API 장애로 호출이 일시 차단되었습니다." + (f" ({name})" if name else "")
+        super().__init__(message, status_code=503)
+
+
+class AdminAccessDeniedError(LawChatException):
+    """관리자 API 접근 거부"""
+    def __init__(self, message: str = "관리자 API 에 접근할 수 없습니다."):
+        super().__init__(message, status_code=403)
+
+
+class ServiceOverloadedError(LawChatException):
+    """동시 요청 한도 초과 (잠시 후 다시 시도)"""
+    def __init__(self, name: str = None, retry_after: int = 5):
+        message = "요청이 많아 잠시 후 다시 시도해주세요." + (f" ({name})" if name else "")
+        self.retry_after = retry_after
+        super().__init__(message, status_code=503)
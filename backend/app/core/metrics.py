@@ -0,0 +1,90 @@
+"""지연 시간 / 크기 히스토그램"""
+from typing import Any, Dict, Sequence
+import bisect
+import threading
+
+# 기본 버킷 경계 (초) - 인메모리 캐시 적중(수 µs)부터 외부 API 호출(수 초)까지
+DEFAULT_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 토큰 수 버킷 (프롬프트 크기 등)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 3000, 4000, 6000, 8000, 12000, 16000, 32000)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (Prometheus histogram 과 같은 누적 le 버킷)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """측정값 하나 기록"""
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 기준 근사 분위수 (해당 분위가 속한 버킷의 상한)
+
+        Args:
+            q: 0~1 사이 분위 (예: 0.99)
+
+        Returns:
+            초 단위 값 (측정값이 없으면 0)
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """횟수/평균/최대/p50/p99 와 누적 버킷 (le -> 횟수)"""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self.count, self.total, self.max
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, bucket_count in zip(list(self.buckets) + ["+Inf"], counts):
+            running += bucket_count
+            cumulative[str(bound)] = running
+        return {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "max": maximum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+
+
+def get_histogram(name: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> LatencyHistogram:
+    """이름별 히스토그램 가져오기 (예: chat_ttft, 버킷은 처음 만들 때만 적용)"""
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = LatencyHistogram(buckets)
+    return histogram
+
+
+def histogram_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 이름별 히스토그램 스냅샷"""
+    return {name: histogram.snapshot() for name, histogram in _histograms.items()}
@@ -0,0 +1,154 @@
+"""동일 키 동시 요청 병합 (single-flight)"""
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 호출을 하나의 실행으로 병합
+
+    캐시 미스가 동시에 몰릴 때(thundering herd) 첫 호출만 실제로 실행하고,
+    나머지는 그 결과(또는 예외)를 함께 기다립니다.
+    실행은 별도 Task로 돌리기 때문에 먼저 요청한 쪽이 취소(클라이언트 연결 종료 등)되어도
+    기다리는 다른 요청에는 영향이 없습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 대해 진행 중인 실행이 있으면 그 결과를, 없으면 func()를 실행한 결과를 반환
+
+        Args:
+            key: 병합 키 (보통 캐시 키)
+            func: 실행할 코루틴 함수
+
+        Returns:
+            func() 결과
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 요청이 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def is_running(self, key: str) -> bool:
+        """키에 대해 진행 중인 실행이 있는지 여부"""
+        return key in self._inflight
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 실행 수"""
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """호출/실행/병합 횟수 (coalesced = 절약한 upstream 호출 수)"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight(),
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """이름별 SingleFlight 인스턴스 가져오기"""
+    group: Optional[SingleFlight] = _groups.get(name)
+    if group is None:
+        group = _groups[name] = SingleFlight(name)
+    return group
+
+
+def singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 SingleFlight 통계"""
+    return {name: group.stats() for name, group in _groups.items()}
+
+
+class SyncSingleFlight:
+    """동기 함수용 single-flight (스레드 간 동일 키 호출 병합)
+
+    asyncio.to_thread / 스레드풀에서 도는 동기 함수의 동시 캐시 미스를 병합합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, "_SyncCall"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """
+        키에 대해 다른 스레드에서 실행 중이면 그 결과를, 없으면 func()를 실행한 결과를 반환
+
+        Args:
+            key: 병합 키
+            func: 실행할 함수
+
+        Returns:
+            func() 결과 (예외도 함께 전달)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                self.executions += 1
+                call = self._inflight[key] = _SyncCall()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """호출/실행/병합 횟수"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+class _SyncCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
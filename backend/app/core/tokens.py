@@ -0,0 +1,165 @@
+"""프롬프트 토큰 수 계산 (tiktoken 이 있으면 사용, 없으면 근사치)"""
+from typing import Any, Dict, Iterable, Optional
+import functools
+import logging
+import math
+import re
+
+from app.core.config import settings
+
+try:
+    # 선택 의존성 - 설치되어 있으면 OpenAI 와 같은 BPE 로 정확히 계산
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# 이 길이 이하 문자열은 토큰 수를 캐싱 (조문/헤더처럼 요청마다 반복되는 조각)
+_CACHEABLE_LENGTH = 4096
+
+# chat 메시지당 형식 토큰 / 답변 시작 토큰 (OpenAI chat 형식 기준)
+MESSAGE_OVERHEAD_TOKENS = 3
+REPLY_PRIMING_TOKENS = 3
+
+_CJK = re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3400-\u9fff]")
+_ALNUM_RUN = re.compile(r"[A-Za-z0-9]+")
+_SYMBOL = re.compile(r"[^\sA-Za-z0-9]")
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(name: str):
+    """
+    tiktoken 인코딩 가져오기 (프로세스당 한 번만 로드)
+
+    Args:
+        name: 인코딩 이름 (예: "o200k_base")
+
+    Returns:
+        tiktoken Encoding 또는 None (tiktoken 이 없거나 인코딩 파일을 받을 수 없는 경우)
+
+    tiktoken 은 인코딩 파일을 처음 쓸 때 내려받으므로 (TIKTOKEN_CACHE_DIR 에 미리 받아 두지 않았다면)
+    앱 시작 시 스레드에서 한 번 불러 둡니다 (요청 처리 중에 다운로드로 이벤트 루프가 막히지 않도록).
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning("tiktoken 인코딩 %s 로드 실패, 근사치로 계산합니다: %s", name, e)
+        return None
+
+
+def token_counts_exact(encoding_name: Optional[str] = None) -> bool:
+    """
+    토큰 수를 tokenizer 로 정확히 세는지 (False 면 estimate_tokens 근사치)
+
+    tiktoken 이 설치되어 있지 않거나 인코딩 파일을 받을 수 없으면 False 입니다.
+    """
+    return get_encoding(encoding_name or settings.prompt_token_encoding) is not None
+
+
+def token_counting_info() -> Dict[str, Any]:
+    """토큰 수 계산 방식 (관리자 지표용)"""
+    exact = token_counts_exact()
+    return {
+        "encoding": settings.prompt_token_encoding,
+        "exact": exact,
+        "method": "tiktoken" if exact else "estimate",
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    tokenizer 없이 토큰 수 근사 (넉넉하게 잡음)
+
+    한글/한자는 글자당 1토큰, 영문/숫자는 4글자당 1토큰, 기호는 1토큰으로 계산합니다.
+    """
+    cjk = len(_CJK.findall(text))
+    rest = _CJK.sub(" ", text)
+    alnum = sum(math.ceil(len(run) / 4) for run in _ALNUM_RUN.findall(rest))
+    return cjk + alnum + len(_SYMBOL.findall(rest))
+
+
+def _count(text: str, encoding_name: str) -> int:
+    encoding = get_encoding(encoding_name)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=8192)
+def _count_cached(text: str, encoding_name: str) -> int:
+    return _count(text, encoding_name)
+
+
+def count_tokens(text: str, encoding_name: Optional[str] = None) -> int:
+    """
+    텍스트 토큰 수
+
+    Args:
+        text: 텍스트
+        encoding_name: tiktoken 인코딩 이름 (None 이면 settings.prompt_token_encoding)
+
+    Returns:
+        토큰 수
+    """
+    if not text:
+        return 0
+    name = encoding_name or settings.prompt_token_encoding
+    if len(text) <= _CACHEABLE_LENGTH:
+        return _count_cached(text, name)
+    return _count(text, name)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, encoding_name: Optional[str] = None) -> str:
+    """
+    토큰 수가 max_tokens 이하가 되도록 텍스트 뒷부분을 자름
+
+    Args:
+        text: 텍스트
+        max_tokens: 최대 토큰 수
+        encoding_name: tiktoken 인코딩 이름
+
+    Returns:
+        잘린 텍스트 (이미 짧으면 그대로)
+    """
+    if max_tokens <= 0:
+        return ""
+    name = encoding_name or settings.prompt_token_encoding
+    if count_tokens(text, name) <= max_tokens:
+        return text
+    encoding = get_encoding(name)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+    # 근사치는 길이에 대해 단조 증가하므로 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+def message_tokens(role: str, content: str, encoding_name: Optional[str] = None) -> int:
+    """chat 메시지 하나의 토큰 수 (메시지 형식 토큰 포함)"""
+    return MESSAGE_OVERHEAD_TOKENS + count_tokens(role, encoding_name) + count_tokens(content, encoding_name)
+
+
+def count_message_tokens(messages: Iterable[Dict[str, Any]], encoding_name: Optional[str] = None) -> int:
+    """
+    chat 메시지 목록의 입력 토큰 수 (메시지 형식 토큰 포함)
+
+    Args:
+        messages: {"role": ..., "content": ...} 리스트
+        encoding_name: tiktoken 인코딩 이름
+
+    Returns:
+        토큰 수
+    """
+    return REPLY_PRIMING_TOKENS + sum(
+        message_tokens(message.get("role") or "", message.get("content") or "", encoding_name)
+        for message in messages
+    )
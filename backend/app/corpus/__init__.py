@@ -0,0 +1 @@
+"""Local law corpus store (SQLite FTS5)"""
@@ -0,0 +1,315 @@
+"""법제처 lawService.do / lawSearch.do XML 파싱
+
+lawService.do 응답은 조문이 수천 개인 법령도 있어서 전체 트리를 만들지 않고
+XMLPullParser로 받은 만큼씩 파싱합니다. 조문 하나가 끝날 때마다 조문 데이터로 변환하고
+해당 요소를 트리에서 제거하므로 최대 메모리는 법령 크기와 관계없이 조문 하나 수준입니다.
+"""
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+import xml.etree.ElementTree as ET
+
+
+def _field_map(candidates: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, int]]:
+    """{필드: 후보 태그들} -> {태그: (필드, 우선순위)}"""
+    return {
+        tag: (field, priority)
+        for field, tags in candidates.items()
+        for priority, tag in enumerate(tags)
+    }
+
+
+# NOTE: law.go.kr DRF 스펙에 따라 태그명이 조금씩 달라서 필드마다 여러 후보 태그가 있습니다.
+# 태그 -> (필드, 우선순위) 로 미리 펼쳐 두고 자식 요소를 한 번만 훑어서 채웁니다.
+_LAW_FIELDS = _field_map({
+    "id": ("법령ID", "lawId", "법령일련번호"),
+    "name": ("법령명한글", "법령명_한글", "법령명"),
+    "type": ("법령종류", "법종류", "법령종류코드"),
+    "enactment_date": ("시행일자", "공포일자"),
+    "amendment_date": ("최종시행일자", "개정일자"),
+})
+
+_ARTICLE_FIELDS = _field_map({
+    "number": ("조문번호", "조문번호_한글"),
+    "title": ("조문제목", "조문명"),
+    "content": ("조문내용", "조문내용_한글"),
+})
+
+# 법령 기본 정보를 담는 요소 (일부 응답은 <Law> 대문자, 실제 응답은 <기본정보>)
+_LAW_INFO_TAGS = frozenset({"law", "Law", "기본정보"})
+
+# 항/호/목 계층과 각 단위의 번호/내용 태그
+_SUB_LEVELS = {"항": "호", "호": "목", "목": None}
+_SUB_FIELDS = {level: (f"{level}번호", f"{level}내용") for level in _SUB_LEVELS}
+
+
+def _collect(
+    el: ET.Element,
+    fields: Dict[str, Tuple[str, int]],
+    values: Optional[Dict[str, str]] = None,
+    priorities: Optional[Dict[str, int]] = None,
+) -> Dict[str, str]:
+    """자식 요소를 한 번 훑어서 필드별로 우선순위가 가장 높은(값이 있는) 태그의 텍스트를 모음"""
+    values = {} if values is None else values
+    priorities = {} if priorities is None else priorities
+    for child in el:
+        mapped = fields.get(child.tag)
+        if mapped is None:
+            continue
+        field, priority = mapped
+        text = (child.text or "").strip()
+        if text and priority < priorities.get(field, len(fields)):
+            values[field] = text
+            priorities[field] = priority
+    return values
+
+
+def _parse_subparagraphs(article_el: ET.Element, article_id: str) -> List[Dict[str, Any]]:
+    """조문 하위 항/호/목 파싱 (응답에 있는 경우에만)"""
+    subparagraphs: List[Dict[str, Any]] = []
+
+    def walk(el: ET.Element, level: str, parent_id: str) -> None:
+        number_tag, content_tag = _SUB_FIELDS[level]
+        for sub_el in el.iterfind(level):
+            number = (sub_el.findtext(number_tag) or "").strip()
+            content = (sub_el.findtext(content_tag) or "").strip()
+            sub_id = f"{parent_id}-{level}{number or len(subparagraphs) + 1}"
+            if content:
+                subparagraphs.append(
+                    {
+                        "id": sub_id,
+                        "article_id": article_id,
+                        "type": level,
+                        "number": number,
+                        "content": content,
+                    }
+                )
+            if _SUB_LEVELS[level]:
+                walk(sub_el, _SUB_LEVELS[level], sub_id)
+
+    walk(article_el, "항", article_id)
+    # 항 없이 바로 호가 오는 조문
+    if not subparagraphs:
+        walk(article_el, "호", article_id)
+    return subparagraphs
+
+
+def parse_law_summary(law_el: ET.Element) -> Dict[str, Any]:
+    """
+    lawSearch.do 검색 결과의 <law> 요소 하나를 법령 기본 정보로 변환 (조문 없음)
+
+    Args:
+        law_el: <law> 요소
+
+    Returns:
+        법령 기본 정보 (값이 없는 필드는 빈 문자열)
+    """
+    values = _collect(law_el, _LAW_FIELDS)
+    return {
+        "id": values.get("id", ""),
+        "name": values.get("name", ""),
+        "type": values.get("type", ""),
+        "enactment_date": values.get("enactment_date", ""),
+        "amendment_date": values.get("amendment_date", ""),
+        "category": [],
+        "articles": [],
+        "source": "law.go.kr",
+    }
+
+
+def law_version(law: Dict[str, Any]) -> str:
+    """변경 감지에 쓰는 법령 버전 (최종시행일자, 없으면 시행일자)"""
+    return law.get("amendment_date") or law.get("enactment_date") or ""
+
+
+class LawXmlParser:
+    """lawService.do 응답 증분 파서
+
+    feed()로 받은 바이트 조각을 바로 파싱하고, 조문(<조문단위>, 구형 응답은 <조문>)이
+    닫히는 즉시 조문 데이터로 변환한 뒤 요소를 트리에서 떼어냅니다.
+
+    사용 예:
+        parser = LawXmlParser(law_id)
+        for chunk in chunks:
+            parser.feed(chunk)
+        law = parser.close()
+    """
+
+    def __init__(self, law_id: Optional[str] = None, fallback_id: Optional[str] = None):
+        self.law_id = law_id
+        self.fallback_id = fallback_id
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+        self._has_law_info = False
+        self._law_values: Dict[str, str] = {}
+        self._law_priorities: Dict[str, int] = {}
+        self._article_depth = 0
+        # 최상위 <조문> 요소와 그 아래 <조문단위> 존재 여부
+        self._container: Optional[ET.Element] = None
+        self._container_has_units = False
+        # (조문 키, 번호, 제목, 내용, 항호목) - 법령 ID는 응답 끝에서 확정되므로 close()에서 ID를 붙임
+        self._articles: List[Tuple[str, str, str, str, List[Dict[str, Any]]]] = []
+
+    def feed(self, data: bytes | str) -> None:
+        """
+        XML 조각 파싱
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+        """
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> Dict[str, Any] | None:
+        """
+        파싱 종료 후 법령 데이터 반환
+
+        Returns:
+            법령 데이터 또는 None (법령 기본 정보/ID가 없는 경우)
+
+        Raises:
+            ET.ParseError: XML 형식 오류 (문서가 끝나지 않은 경우 등)
+        """
+        self._parser.close()
+        self._drain()
+        if not self._has_law_info:
+            return None
+
+        law_id = self.law_id or self._law_values.get("id") or self.fallback_id
+        if not law_id:
+            return None
+
+        articles: List[Dict[str, Any]] = []
+        for key, number, title, content, subparagraphs in self._articles:
+            article_id = f"{law_id}-{key}"
+            for subp in subparagraphs:
+                subp["id"] = f"{law_id}-{subp['id']}"
+                subp["article_id"] = article_id
+            articles.append(
+                {
+                    "id": article_id,
+                    "law_id": law_id,
+                    "number": number,
+                    "title": title,
+                    "content": content,
+                    "subparagraphs": subparagraphs,
+                    "related_articles": [],
+                }
+            )
+
+        values = self._law_values
+        return {
+            "id": law_id,
+            "name": values.get("name") or law_id,
+            "type": values.get("type", ""),
+            "enactment_date": values.get("enactment_date", ""),
+            "amendment_date": values.get("amendment_date", ""),
+            "category": [],
+            "articles": articles,
+            "source": "law.go.kr",
+        }
+
+    def _drain(self) -> None:
+        for event, el in self._parser.read_events():
+            if event == "start":
+                if el.tag == "조문단위":
+                    self._article_depth += 1
+                    self._container_has_units = True
+                elif el.tag == "조문" and self._article_depth == 0:
+                    self._article_depth += 1
+                    self._container = el
+                    self._container_has_units = False
+                self._stack.append(el)
+                continue
+
+            self._stack.pop()
+            if el.tag == "조문단위":
+                self._article_depth -= 1
+                self._add_article(el)
+                continue
+            if el is self._container:
+                self._article_depth -= 1
+                self._container = None
+                # <조문단위> 없이 <조문> 자체가 조문인 구형 응답
+                if not self._container_has_units:
+                    self._add_article(el)
+                    continue
+            elif el.tag in _LAW_INFO_TAGS and self._article_depth == 0:
+                # "일치하는 법령이 없습니다" 처럼 텍스트만 있는 <Law> 응답은 법령 정보로 보지 않음
+                _collect(el, _LAW_FIELDS, self._law_values, self._law_priorities)
+                self._has_law_info = bool(self._law_values)
+
+            # 루트 바로 아래 요소(기본정보/조문/부칙 등)는 다 읽었으면 버림
+            if len(self._stack) == 1:
+                self._release(el)
+
+    def _add_article(self, el: ET.Element) -> None:
+        values = _collect(el, _ARTICLE_FIELDS)
+        number = values.get("number", "")
+        key = number or f"article-{len(self._articles) + 1}"
+        self._articles.append(
+            (key, number, values.get("title", ""), values.get("content", ""), _parse_subparagraphs(el, key))
+        )
+        self._release(el)
+
+    def _release(self, el: ET.Element) -> None:
+        """처리한 요소를 비우고 부모에서 떼어내 메모리에 쌓이지 않게 함"""
+        el.clear()
+        if self._stack:
+            self._stack[-1].remove(el)
+
+
+def parse_law_stream(
+    chunks: Iterable[bytes | str],
+    law_id: Optional[str] = None,
+    fallback_id: Optional[str] = None,
+) -> Dict[str, Any] | None:
+    """
+    XML 조각 스트림 파싱
+
+    Args:
+        chunks: 응답 바이트 조각
+        law_id: 법령 ID (없으면 응답의 법령ID 사용)
+        fallback_id: 응답에도 법령ID가 없을 때 사용할 ID
+
+    Returns:
+        법령 데이터 또는 None
+
+    Raises:
+        ET.ParseError: XML 형식 오류
+    """
+    parser = LawXmlParser(law_id, fallback_id)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+async def aparse_law_stream(
+    chunks: AsyncIterable[bytes],
+    law_id: Optional[str] = None,
+) -> Dict[str, Any] | None:
+    """비동기 응답 스트림(httpx aiter_bytes 등) 파싱 (parse_law_stream 참고)"""
+    parser = LawXmlParser(law_id)
+    async for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def parse_law_file(
+    path: str | Path,
+    law_id: Optional[str] = None,
+    fallback_id: Optional[str] = None,
+    chunk_size: int = 64 * 1024,
+) -> Dict[str, Any] | None:
+    """XML 파일을 조각 단위로 읽어서 파싱 (parse_law_stream 참고)"""
+    with open(path, "rb") as f:
+        return parse_law_stream(iter(lambda: f.read(chunk_size), b""), law_id, fallback_id)
+
+
+def parse_law_xml(text: str | bytes, law_id: Optional[str] = None) -> Dict[str, Any] | None:
+    """
+    lawService.do XML 문자열 파싱
+
+    Raises:
+        ET.ParseError: XML 형식 오류
+    """
+    return parse_law_stream([text], law_id)
@@ -0,0 +1,604 @@
+"""SQLite FTS5 기반 로컬 법령 코퍼스 저장소"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import sqlite3
+import threading
+
+from app.core.config import settings
+from app.search.text import normalize_text, char_ngrams
+from app.utils.date_utils import now_utc, iso_format
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS laws (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT,
+    enactment_date TEXT,
+    amendment_date TEXT,
+    category TEXT,
+    source TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    law_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    number TEXT,
+    title TEXT,
+    content TEXT,
+    related_articles TEXT,
+    PRIMARY KEY (law_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_id ON articles(id);
+CREATE TABLE IF NOT EXISTS subparagraphs (
+    law_id TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    type TEXT,
+    number TEXT,
+    content TEXT,
+    PRIMARY KEY (law_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_subparagraphs_article ON subparagraphs(law_id, article_id, seq);
+CREATE TABLE IF NOT EXISTS passages (
+    rowid INTEGER PRIMARY KEY,
+    law_id TEXT NOT NULL,
+    passage_id TEXT NOT NULL,
+    article_id TEXT,
+    kind TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_passages_law ON passages(law_id);
+CREATE INDEX IF NOT EXISTS idx_passages_id ON passages(passage_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS law_fts USING fts5(
+    name, category, title, content,
+    tokenize = 'unicode61 remove_diacritics 0'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# bm25() 컬럼 가중치 (name, category, title, content)
+_LAW_WEIGHTS = "3.0, 2.0, 2.0, 1.0"
+_PASSAGE_WEIGHTS = "1.5, 0.0, 2.0, 1.0"
+
+# passages.kind 값 중 법령 단위 행
+_LAW_KIND = "law"
+
+# IN (...) 쿼리 한 번에 넣는 최대 ID 수 (SQLite 바인드 변수 한도 이하)
+_IN_CHUNK = 500
+
+
+def _fts_text(text: str) -> str:
+    """FTS 색인용 텍스트 (문자 bigram을 공백으로 구분한 토큰열)
+
+    FTS5 기본 토크나이저는 한글 어절을 통째로 토큰화하므로, 메모리 역색인과 같은
+    문자 bigram으로 바꿔 저장합니다. bigram 구문(phrase) 검색이 곧 부분 문자열 검색이 됩니다.
+    """
+    return " ".join(char_ngrams(normalize_text(text)))
+
+
+def _chunks(items: Sequence[str]) -> Iterable[List[str]]:
+    """IN (...) 쿼리용으로 _IN_CHUNK 개씩 나누기"""
+    items = list(items)
+    for start in range(0, len(items), _IN_CHUNK):
+        yield items[start:start + _IN_CHUNK]
+
+
+def _phrase(term: str) -> Optional[str]:
+    """검색어 -> FTS5 bigram 구문 질의"""
+    grams = char_ngrams(normalize_text(term))
+    if not grams:
+        return None
+    return '"' + " ".join(gram.replace('"', '""') for gram in grams) + '"'
+
+
+class LawStore:
+    """SQLite 로컬 법령 코퍼스
+
+    - laws / articles / subparagraphs: 정규화된 원문 테이블 (상세 조회)
+    - passages + law_fts(FTS5): 법령/조문/항호목 단위 전문 검색 (bm25 정렬)
+    - meta: 코퍼스 버전 등
+
+    커넥션은 스레드별로 하나씩 열어 재사용합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self.init_schema()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """현재 스레드의 커넥션"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def init_schema(self) -> None:
+        """테이블/FTS 색인 생성"""
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """현재 스레드의 커넥션 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ---------- 쓰기 ----------
+    def _delete_law(self, law_id: str) -> None:
+        conn = self.conn
+        conn.execute(
+            "DELETE FROM law_fts WHERE rowid IN (SELECT rowid FROM passages WHERE law_id = ?)",
+            (law_id,),
+        )
+        conn.execute("DELETE FROM passages WHERE law_id = ?", (law_id,))
+        conn.execute("DELETE FROM subparagraphs WHERE law_id = ?", (law_id,))
+        conn.execute("DELETE FROM articles WHERE law_id = ?", (law_id,))
+        conn.execute("DELETE FROM laws WHERE id = ?", (law_id,))
+
+    def _add_passage(
+        self,
+        law_id: str,
+        passage_id: str,
+        article_id: Optional[str],
+        kind: str,
+        fts_fields: Tuple[str, str, str, str],
+    ) -> None:
+        cur = self.conn.execute(
+            "INSERT INTO passages (law_id, passage_id, article_id, kind) VALUES (?, ?, ?, ?)",
+            (law_id, passage_id, article_id, kind),
+        )
+        self.conn.execute(
+            "INSERT INTO law_fts (rowid, name, category, title, content) VALUES (?, ?, ?, ?, ?)",
+            (cur.lastrowid, *fts_fields),
+        )
+
+    def _insert_law(self, law: Dict[str, Any]) -> None:
+        conn = self.conn
+        law_id = law["id"]
+        name = law.get("name", "") or ""
+        category = list(law.get("category", []) or [])
+        fts_name = _fts_text(name)
+
+        conn.execute(
+            "INSERT INTO laws (id, name, type, enactment_date, amendment_date, category, source, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                law_id,
+                name,
+                law.get("type", ""),
+                law.get("enactment_date", ""),
+                law.get("amendment_date", ""),
+                json.dumps(category, ensure_ascii=False),
+                law.get("source", "local"),
+                iso_format(now_utc()),
+            ),
+        )
+        self._add_passage(law_id, "", None, _LAW_KIND, (fts_name, _fts_text(" ".join(category)), "", ""))
+
+        seen_articles = set()
+        for seq, article in enumerate(law.get("articles", [])):
+            article_id = article["id"]
+            # 외부 API 응답에는 같은 조문번호가 반복되는 경우(장/절 제목 등)가 있음
+            if article_id in seen_articles:
+                continue
+            seen_articles.add(article_id)
+
+            title = article.get("title", "") or ""
+            conn.execute(
+                "INSERT INTO articles (law_id, id, seq, number, title, content, related_articles) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    law_id,
+                    article_id,
+                    seq,
+                    article.get("number", ""),
+                    title,
+                    article.get("content", "") or "",
+                    json.dumps(article.get("related_articles", []), ensure_ascii=False),
+                ),
+            )
+            fts_title = _fts_text(title)
+            self._add_passage(
+                law_id, article_id, article_id, "조",
+                (fts_name, "", fts_title, _fts_text(article.get("content", "") or "")),
+            )
+
+            for sub_seq, subp in enumerate(article.get("subparagraphs", [])):
+                conn.execute(
+                    "INSERT OR IGNORE INTO subparagraphs (law_id, article_id, id, seq, type, number, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        law_id,
+                        article_id,
+                        subp["id"],
+                        sub_seq,
+                        subp.get("type", ""),
+                        subp.get("number", ""),
+                        subp.get("content", "") or "",
+                    ),
+                )
+                self._add_passage(
+                    law_id, subp["id"], article_id, subp.get("type", "") or "항",
+                    (fts_name, "", fts_title, _fts_text(subp.get("content", "") or "")),
+                )
+
+    def _bump_version(self) -> None:
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def upsert_laws(self, laws: Iterable[Dict[str, Any]]) -> int:
+        """
+        법령 일괄 저장 (이미 있으면 조문/색인까지 교체, 한 트랜잭션)
+
+        Args:
+            laws: 법령 데이터 (조문/항호목 포함)
+
+        Returns:
+            저장한 법령 수
+        """
+        count = 0
+        with self.conn:
+            for law in laws:
+                self._delete_law(law["id"])
+                self._insert_law(law)
+                count += 1
+            if count:
+                self._bump_version()
+        return count
+
+    def upsert_law(self, law: Dict[str, Any]) -> None:
+        """법령 하나 저장"""
+        self.upsert_laws([law])
+
+    def delete_laws(self, law_ids: Iterable[str]) -> int:
+        """
+        법령 삭제 (조문/색인 포함, 한 트랜잭션)
+
+        Args:
+            law_ids: 삭제할 법령 ID
+
+        Returns:
+            삭제한 법령 수
+        """
+        count = 0
+        with self.conn:
+            for law_id in law_ids:
+                if self.conn.execute("SELECT 1 FROM laws WHERE id = ?", (law_id,)).fetchone() is None:
+                    continue
+                self._delete_law(law_id)
+                count += 1
+            if count:
+                self._bump_version()
+        return count
+
+    # ---------- 조회 ----------
+    def corpus_version(self) -> int:
+        """코퍼스 버전 (쓰기 트랜잭션마다 1씩 증가)"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row["value"]) if row else 0
+
+    def count_laws(self) -> int:
+        """저장된 법령 수"""
+        return self.conn.execute("SELECT COUNT(*) FROM laws").fetchone()[0]
+
+    @staticmethod
+    def _law_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "type": row["type"] or "",
+            "enactment_date": row["enactment_date"] or "",
+            "amendment_date": row["amendment_date"] or "",
+            "category": json.loads(row["category"] or "[]"),
+            "articles": [],
+            "source": row["source"] or "local",
+        }
+
+    def _subparagraphs(self, law_id: str, article_id: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        sql = "SELECT article_id, id, type, number, content FROM subparagraphs WHERE law_id = ?"
+        params: Tuple[Any, ...] = (law_id,)
+        if article_id is not None:
+            sql += " AND article_id = ?"
+            params += (article_id,)
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.conn.execute(sql + " ORDER BY article_id, seq", params):
+            grouped.setdefault(row["article_id"], []).append(self._subparagraph_row(row))
+        return grouped
+
+    @staticmethod
+    def _subparagraph_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "article_id": row["article_id"],
+            "type": row["type"] or "",
+            "number": row["number"] or "",
+            "content": row["content"] or "",
+        }
+
+    @staticmethod
+    def _article_row(row: sqlite3.Row, subparagraphs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "law_id": row["law_id"],
+            "number": row["number"] or "",
+            "title": row["title"] or "",
+            "content": row["content"] or "",
+            "subparagraphs": subparagraphs,
+            "related_articles": json.loads(row["related_articles"] or "[]"),
+        }
+
+    def get_law(self, law_id: str) -> Dict[str, Any] | None:
+        """
+        법령 ID로 법령 + 조문 + 항/호/목 조회
+
+        Args:
+            law_id: 법령 ID
+
+        Returns:
+            법령 데이터 또는 None
+        """
+        laws = self.get_laws([law_id])
+        return laws[0] if laws else None
+
+    def _law_rows(self, law_ids: Sequence[str]) -> Dict[str, sqlite3.Row]:
+        """법령 ID -> laws 행 (IN 쿼리 한 번, 조문 제외)"""
+        rows: Dict[str, sqlite3.Row] = {}
+        for chunk in _chunks(law_ids):
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(f"SELECT * FROM laws WHERE id IN ({placeholders})", chunk):
+                rows[row["id"]] = row
+        return rows
+
+    def get_law_summaries(self, law_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """여러 법령 기본 정보 조회 (조문 제외, 요청 순서 유지, 없는 ID는 제외)"""
+        rows = self._law_rows(law_ids)
+        return [self._law_row(rows[law_id]) for law_id in law_ids if law_id in rows]
+
+    def get_laws(self, law_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        여러 법령 + 조문 + 항/호/목 조회 (요청 순서 유지, 없는 ID는 제외)
+
+        법령/조문/항·호·목을 각각 IN 쿼리 한 번으로 가져옵니다.
+        """
+        rows = self._law_rows(law_ids)
+        laws = {law_id: self._law_row(row) for law_id, row in rows.items()}
+        if not laws:
+            return []
+
+        for chunk in _chunks(list(laws)):
+            placeholders = ",".join("?" * len(chunk))
+            subparagraphs: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+            for row in self.conn.execute(
+                "SELECT law_id, article_id, id, type, number, content FROM subparagraphs "
+                f"WHERE law_id IN ({placeholders}) ORDER BY law_id, article_id, seq",
+                chunk,
+            ):
+                subparagraphs.setdefault((row["law_id"], row["article_id"]), []).append(self._subparagraph_row(row))
+            for article in self.conn.execute(
+                f"SELECT * FROM articles WHERE law_id IN ({placeholders}) ORDER BY law_id, seq", chunk
+            ):
+                laws[article["law_id"]]["articles"].append(
+                    self._article_row(article, subparagraphs.get((article["law_id"], article["id"]), []))
+                )
+        return [laws[law_id] for law_id in law_ids if law_id in laws]
+
+    def list_laws(self) -> List[Dict[str, Any]]:
+        """모든 법령 기본 정보 (조문 제외)"""
+        return [self._law_row(row) for row in self.conn.execute("SELECT * FROM laws ORDER BY id")]
+
+    def law_versions(self) -> Dict[str, str]:
+        """법령 ID -> 버전 (최종시행일자, 없으면 시행일자. 증분 동기화 비교용)"""
+        return {
+            row["id"]: row["version"]
+            for row in self.conn.execute(
+                "SELECT id, COALESCE(NULLIF(amendment_date, ''), enactment_date, '') AS version FROM laws"
+            )
+        }
+
+    def get_article(self, article_id: str, law_id: Optional[str] = None) -> Dict[str, Any] | None:
+        """
+        조문 ID로 조문 조회
+
+        Args:
+            article_id: 조문 ID
+            law_id: 지정하면 해당 법령의 조문만
+
+        Returns:
+            조문 데이터 또는 None
+        """
+        if law_id is not None:
+            row = self.conn.execute(
+                "SELECT * FROM articles WHERE law_id = ? AND id = ?", (law_id, article_id)
+            ).fetchone()
+        else:
+            row = self.conn.execute("SELECT * FROM articles WHERE id = ? LIMIT 1", (article_id,)).fetchone()
+        if row is None:
+            return None
+        subparagraphs = self._subparagraphs(row["law_id"], article_id)
+        return self._article_row(row, subparagraphs.get(article_id, []))
+
+    def get_passage(self, passage_id: str) -> Dict[str, Any] | None:
+        """passage(조문/항/호/목) ID로 조회"""
+        row = self.conn.execute(
+            "SELECT p.law_id, p.passage_id, p.article_id, p.kind, a.number AS article_number, "
+            "COALESCE(s.number, a.number) AS number, COALESCE(s.content, a.content) AS content "
+            "FROM passages p "
+            "JOIN articles a ON a.law_id = p.law_id AND a.id = p.article_id "
+            "LEFT JOIN subparagraphs s ON s.law_id = p.law_id AND s.id = p.passage_id AND p.kind != '조' "
+            "WHERE p.passage_id = ? AND p.kind != ? LIMIT 1",
+            (passage_id, _LAW_KIND),
+        ).fetchone()
+        return self._passage_row(row) if row is not None else None
+
+    @staticmethod
+    def _passage_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["passage_id"],
+            "law_id": row["law_id"],
+            "article_id": row["article_id"],
+            "article_number": row["article_number"] or "",
+            "type": row["kind"],
+            "number": row["number"] or "",
+            "content": row["content"] or "",
+        }
+
+    # ---------- 검색 ----------
+    def _like_search(self, keyword: str, limit: Optional[int]) -> List[str]:
+        """bigram으로 표현할 수 없는 1글자 검색어용 LIKE 검색 (전체 스캔, limit 개를 찾으면 멈춤)"""
+        pattern = f"%{normalize_text(keyword)}%"
+        rows = self.conn.execute(
+            "SELECT id AS law_id FROM laws WHERE lower(name) LIKE ?1 OR category LIKE ?1 "
+            "UNION SELECT law_id FROM articles WHERE lower(title) LIKE ?1 OR lower(content) LIKE ?1 "
+            "UNION SELECT law_id FROM subparagraphs WHERE lower(content) LIKE ?1 "
+            "ORDER BY law_id LIMIT ?2",
+            (pattern, limit or -1),
+        )
+        return [row["law_id"] for row in rows]
+
+    def _search_law_ids(self, match: str, limit: Optional[int]) -> List[Tuple[str, float]]:
+        # bm25()는 집계 함수 안에서 직접 쓸 수 없으므로 passage 단위 점수를 먼저 구한 뒤 법령별 최고점 선택
+        sql = (
+            "WITH hits AS MATERIALIZED ("
+            f"SELECT p.law_id AS law_id, bm25(law_fts, {_LAW_WEIGHTS}) AS rank "
+            "FROM law_fts JOIN passages p ON p.rowid = law_fts.rowid "
+            "WHERE law_fts MATCH ?"
+            ") SELECT law_id, MIN(rank) AS rank FROM hits GROUP BY law_id ORDER BY rank, law_id"
+        )
+        params: Tuple[Any, ...] = (match,)
+        if limit:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [(row["law_id"], -row["rank"]) for row in self.conn.execute(sql, params)]
+
+    def _with_scores(self, ranked: List[Tuple[str, float]], with_articles: bool) -> List[Dict[str, Any]]:
+        law_ids = [law_id for law_id, _ in ranked]
+        fetch = self.get_laws if with_articles else self.get_law_summaries
+        laws = {law["id"]: law for law in fetch(law_ids)}
+        return [{**laws[law_id], "score": round(score, 4)} for law_id, score in ranked if law_id in laws]
+
+    def search_laws(self, keyword: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        키워드(부분 문자열)로 법령 검색 (FTS5 bm25 순)
+
+        검색 목록용이라 조문은 빼고 반환합니다 (조문은 get_law 로 조회).
+
+        Args:
+            keyword: 검색 키워드
+            limit: 최대 반환 개수
+
+        Returns:
+            점수(score)가 포함된 법령 리스트 (articles 는 빈 리스트)
+        """
+        normalized = normalize_text(keyword)
+        if len(normalized.replace(" ", "")) < 2:
+            law_ids = self._like_search(normalized, limit) if normalized else []
+            return self._with_scores([(law_id, 0.0) for law_id in law_ids], with_articles=False)
+
+        match = _phrase(normalized)
+        return self._with_scores(self._search_law_ids(match, limit), with_articles=False) if match else []
+
+    def search_any(self, terms: Sequence[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        여러 검색어 중 하나라도 포함하는 법령 검색 (OR, bm25 순)
+
+        프롬프트 컨텍스트에 쓰이므로 조문까지 함께 반환합니다.
+
+        Args:
+            terms: 검색어 리스트
+            limit: 최대 반환 개수
+
+        Returns:
+            점수(score)가 포함된 법령 리스트
+        """
+        phrases = [p for p in (_phrase(term) for term in terms) if p]
+        if not phrases:
+            return []
+        return self._with_scores(self._search_law_ids(" OR ".join(phrases), limit), with_articles=True)
+
+    def search_passages(
+        self,
+        terms: Sequence[str],
+        law_ids: Optional[Sequence[str]] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 검색어 중 하나라도 포함하는 조문/항/호/목 passage 검색 (bm25 순)
+
+        Args:
+            terms: 검색어 리스트
+            law_ids: 지정하면 해당 법령의 passage만
+            limit: 최대 반환 개수
+
+        Returns:
+            점수(score)가 포함된 passage 리스트
+        """
+        phrases = [p for p in (_phrase(term) for term in terms) if p]
+        if not phrases:
+            return []
+
+        sql = (
+            f"SELECT p.law_id, p.passage_id, p.article_id, p.kind, bm25(law_fts, {_PASSAGE_WEIGHTS}) AS rank, "
+            "a.number AS article_number, COALESCE(s.number, a.number) AS number, "
+            "COALESCE(s.content, a.content) AS content "
+            "FROM law_fts JOIN passages p ON p.rowid = law_fts.rowid "
+            "JOIN articles a ON a.law_id = p.law_id AND a.id = p.article_id "
+            "LEFT JOIN subparagraphs s ON s.law_id = p.law_id AND s.id = p.passage_id AND p.kind != '조' "
+            "WHERE law_fts MATCH ? AND p.kind != ?"
+        )
+        params: List[Any] = [" OR ".join(phrases), _LAW_KIND]
+        if law_ids is not None:
+            if not law_ids:
+                return []
+            sql += f" AND p.law_id IN ({', '.join('?' * len(law_ids))})"
+            params.extend(law_ids)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        return [
+            {**self._passage_row(row), "score": round(-row["rank"], 4)}
+            for row in self.conn.execute(sql, params)
+        ]
+
+    def iter_passages(self) -> Iterable[Tuple[Dict[str, Any], str]]:
+        """(passage, 법령명+제목+본문 텍스트) 순회 (dense 임베딩 생성용)"""
+        rows = self.conn.execute(
+            "SELECT p.law_id, p.passage_id, p.article_id, p.kind, l.name AS law_name, a.title, "
+            "a.number AS article_number, COALESCE(s.number, a.number) AS number, "
+            "COALESCE(s.content, a.content) AS content "
+            "FROM passages p JOIN laws l ON l.id = p.law_id "
+            "JOIN articles a ON a.law_id = p.law_id AND a.id = p.article_id "
+            "LEFT JOIN subparagraphs s ON s.law_id = p.law_id AND s.id = p.passage_id AND p.kind != '조' "
+            "WHERE p.kind != ? ORDER BY p.rowid",
+            (_LAW_KIND,),
+        )
+        for row in rows:
+            text = "\n".join(part for part in (row["law_name"], row["title"], row["content"]) if part)
+            yield self._passage_row(row), text
+
+
+# 싱글톤 인스턴스
+_law_store: Optional[LawStore] = None
+
+
+def get_law_store() -> LawStore:
+    """로컬 법령 코퍼스 저장소 인스턴스 가져오기"""
+    global _law_store
+    if _law_store is None:
+        _law_store = LawStore(settings.law_corpus_path)
+    return _law_store
@@ -0,0 +1,198 @@
+"""로컬 코퍼스 증분 동기화 (최종시행일자 비교)
+
+법제처 lawSearch.do 목록(또는 같은 형식의 로컬 fixture)에서 법령별 최종시행일자를 읽어
+저장된 값과 비교하고, 달라진 법령만 lawService.do 로 다시 받아 재색인합니다.
+"""
+from typing import Any, Callable, Dict, List, Optional, Protocol
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import xml.etree.ElementTree as ET
+
+import httpx
+
+from app.corpus.law_xml import parse_law_summary, parse_law_stream, parse_law_file, law_version
+from app.corpus.store import LawStore
+
+logger = logging.getLogger(__name__)
+
+# lawSearch.do 페이지당 최대 결과 수
+SEARCH_PAGE_SIZE = 100
+
+
+class LawSource(Protocol):
+    """동기화 원본 (법령 버전 목록 + 법령 상세)"""
+
+    def list_versions(self) -> Dict[str, str]:
+        """법령 ID -> 버전(최종시행일자)"""
+        ...
+
+    def fetch_law(self, law_id: str) -> Dict[str, Any] | None:
+        """법령 상세 (조문 포함)"""
+        ...
+
+
+def _versions_from_search_xml(text: str | bytes) -> Dict[str, str]:
+    """lawSearch.do XML -> 법령 ID -> 버전"""
+    versions: Dict[str, str] = {}
+    for law_el in ET.fromstring(text).findall("law"):
+        summary = parse_law_summary(law_el)
+        if summary["id"]:
+            versions[summary["id"]] = law_version(summary)
+    return versions
+
+
+class RemoteLawSource:
+    """법제처 Open API (lawSearch.do 목록 + lawService.do 상세)"""
+
+    SEARCH_URL = "https://www.law.go.kr/DRF/lawSearch.do"
+    DETAIL_URL = "https://www.law.go.kr/DRF/lawService.do"
+
+    def __init__(self, api_key: str, page_size: int = SEARCH_PAGE_SIZE, timeout: float = 10.0):
+        self.api_key = api_key
+        self.page_size = page_size
+        self.timeout = timeout
+
+    def list_versions(self) -> Dict[str, str]:
+        """
+        현행 법령 전체 목록을 페이지 단위로 조회
+
+        Raises:
+            httpx.HTTPError: API 호출 실패 (목록이 불완전하면 동기화하지 않도록 그대로 전파)
+            ET.ParseError: XML 형식 오류
+        """
+        versions: Dict[str, str] = {}
+        page = 1
+        with httpx.Client(timeout=self.timeout) as client:
+            while True:
+                resp = client.get(
+                    self.SEARCH_URL,
+                    params={
+                        "OC": self.api_key,
+                        "target": "law",
+                        "type": "XML",
+                        "display": self.page_size,
+                        "page": page,
+                    },
+                )
+                resp.raise_for_status()
+                page_versions = _versions_from_search_xml(resp.content)
+                versions.update(page_versions)
+                if len(page_versions) < self.page_size:
+                    return versions
+                page += 1
+
+    def fetch_law(self, law_id: str) -> Dict[str, Any] | None:
+        """lawService.do 로 법령 상세 조회 (실패 시 None)"""
+        params = {"OC": self.api_key, "target": "law", "type": "XML", "ID": law_id}
+        try:
+            with httpx.stream("GET", self.DETAIL_URL, params=params, timeout=self.timeout) as resp:
+                resp.raise_for_status()
+                return parse_law_stream(resp.iter_bytes(), law_id)
+        except (httpx.HTTPError, ET.ParseError) as e:
+            logger.error(f"법령 상세 조회 실패 ({law_id}): {e}")
+            return None
+
+
+class FixtureLawSource:
+    """로컬 fixture 디렉터리 (외부 API 대신 사용하는 개발/테스트용 원본)
+
+    - lawSearch*.xml: lawSearch.do 응답 형식의 목록 (여러 페이지 파일 가능)
+    - <법령ID>.xml: lawService.do 응답 형식의 상세
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    def list_versions(self) -> Dict[str, str]:
+        versions: Dict[str, str] = {}
+        for path in sorted(self.directory.glob("lawSearch*.xml")):
+            versions.update(_versions_from_search_xml(path.read_bytes()))
+        return versions
+
+    def fetch_law(self, law_id: str) -> Dict[str, Any] | None:
+        path = self.directory / f"{law_id}.xml"
+        try:
+            return parse_law_file(path, law_id=law_id)
+        except (OSError, ET.ParseError) as e:
+            logger.error(f"fixture 법령 읽기 실패 ({path}): {e}")
+            return None
+
+
+@dataclass
+class SyncResult:
+    """증분 동기화 결과"""
+
+    checked: int = 0
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        """코퍼스가 바뀐 법령 ID (추가/갱신/삭제)"""
+        return self.added + self.updated + self.removed
+
+
+def sync_corpus(
+    store: LawStore,
+    source: LawSource,
+    prune: bool = False,
+    batch_size: int = 50,
+    on_change: Optional[Callable[[List[str]], None]] = None,
+) -> SyncResult:
+    """
+    최종시행일자가 바뀐 법령만 다시 받아 재색인
+
+    Args:
+        store: 로컬 코퍼스 저장소
+        source: 동기화 원본 (RemoteLawSource / FixtureLawSource)
+        prune: 원본 목록에 없는 법령(폐지 등)을 삭제할지 여부
+        batch_size: 트랜잭션당 법령 수
+        on_change: 배치가 커밋될 때마다 바뀐 법령 ID 목록으로 호출 (캐시 무효화용)
+
+    Returns:
+        SyncResult
+    """
+    remote = source.list_versions()
+    local = store.law_versions()
+    result = SyncResult(checked=len(remote))
+
+    stale = [law_id for law_id, version in remote.items() if local.get(law_id) != version]
+
+    def commit(batch: List[Dict[str, Any]]) -> None:
+        store.upsert_laws(batch)
+        if on_change:
+            on_change([law["id"] for law in batch])
+
+    batch: List[Dict[str, Any]] = []
+    for law_id in stale:
+        law = source.fetch_law(law_id)
+        if law is None:
+            # 다음 동기화에서 다시 시도 (저장된 이전 버전은 유지)
+            result.failed.append(law_id)
+            continue
+        # 목록과 상세의 날짜 태그가 다를 수 있어 목록 기준 버전을 저장
+        if law_version(law) != remote[law_id]:
+            law["amendment_date"] = remote[law_id]
+        (result.updated if law_id in local else result.added).append(law_id)
+        batch.append(law)
+        if len(batch) >= batch_size:
+            commit(batch)
+            batch = []
+    if batch:
+        commit(batch)
+
+    if prune and remote:
+        result.removed = sorted(set(local) - set(remote))
+        if result.removed:
+            store.delete_laws(result.removed)
+            if on_change:
+                on_change(result.removed)
+
+    logger.info(
+        f"코퍼스 동기화: 확인 {result.checked}건, 추가 {len(result.added)}건, "
+        f"갱신 {len(result.updated)}건, 삭제 {len(result.removed)}건, 실패 {len(result.failed)}건"
+    )
+    return result
@@ -26,3 +26,13 @@ class Message(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+
+
+class ConversationSummary(Base):
+    """대화 누적 요약 모델 (최근 대화 이전 메시지를 요약해서 프롬프트에 사용)"""
+    __tablename__ = "conversation_summaries"
+    
+    conversation_id = Column(String, primary_key=True, index=True)
+    summary = Column(Text, nullable=False, default="")
+    summarized_count = Column(Integer, nullable=False, default=0)  # 요약에 반영된 메시지 수 (작성 순서 기준)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
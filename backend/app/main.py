@@ -4,7 +4,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.db.database import init_db
-from app.api import chat, law, conversations
+from app.api import chat, law, conversations, admin
+from app.services.law_service import LawService
+from app.services.law_api_client import close_law_api_client
+from app.services.openai_service import close_openai_service, get_openai_service
+from app.core.cache import start_cache_sweeper, stop_cache_sweeper, warm_cache
+from app.core.tokens import get_encoding
 from app.core.exceptions import (
     LawChatException,
     OpenAIAPIError,
@@ -16,6 +21,7 @@ from app.core.error_handlers import (
     openai_error_handler,
     generic_exception_handler
 )
+import asyncio
 import logging
 
 # 로깅 설정
@@ -41,16 +47,46 @@ app.add_middleware(
 )
 
 
+async def corpus_sync_loop(interval_seconds: float):
+    """로컬 코퍼스 주기적 증분 동기화 (바뀐 법령의 캐시는 이 프로세스에서 바로 무효화)"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(LawService.sync_corpus)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"코퍼스 동기화 실패: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database and search index on startup"""
     init_db()
+    LawService.build_search_index()
+    if settings.cache_warm_on_startup:
+        # 네트워크 대신 디스크 캐시로 워밍 (배포 직후 law.go.kr / OpenAI 호출 몰림 방지)
+        await asyncio.to_thread(warm_cache)
+    # tiktoken 인코딩 파일 로드 (첫 사용 시 다운로드될 수 있어서 요청 전에 스레드에서)
+    await asyncio.to_thread(get_encoding, settings.prompt_token_encoding)
+    if settings.semantic_cache_seed_scenarios:
+        # 대표 질문(MOCK_QA_SCENARIOS)의 답변을 생성해서 의미 캐시 기준 항목으로 등록
+        await get_openai_service().seed_semantic_cache()
+    start_cache_sweeper(settings.cache_sweep_interval)
+    if settings.law_sync_interval_hours > 0 and LawService._use_local_corpus():
+        asyncio.create_task(corpus_sync_loop(settings.law_sync_interval_hours * 3600))
     # NOTE: Using only ASCII characters here to avoid UnicodeEncodeError on Windows cp949 consoles
     print(f"[START] {settings.app_name} v{settings.app_version} started")
     print(f"[ENV] {settings.app_env}")
     print(f"[SERVER] http://{settings.host}:{settings.port}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled upstream connections"""
+    await close_law_api_client()
+    await close_openai_service()
+    stop_cache_sweeper()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -71,6 +107,7 @@ async def health_check():
 app.include_router(chat.router)
 app.include_router(law.router)
 app.include_router(conversations.router)
+app.include_router(admin.router)
 
 # 에러 핸들러 등록
 app.add_exception_handler(LawChatException, lawchat_exception_handler)
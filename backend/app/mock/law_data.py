@@ -1,5 +1,7 @@
 """법령 목업 데이터"""
 from typing import List, Dict, Any
+from app.search.index import LawIndex
+from app.search.passages import PassageIndex
 
 # 법령 데이터 타입 정의
 LawData = Dict[str, Any]
@@ -296,6 +298,30 @@ MOCK_LAWS: List[LawData] = [
 ]
 
 
+# 목업 법령 역색인 (최초 조회 또는 앱 시작 시 한 번만 생성)
+_law_index: LawIndex | None = None
+
+
+def get_law_index() -> LawIndex:
+    """목업 법령 역색인 반환 (없으면 생성)"""
+    global _law_index
+    if _law_index is None:
+        _law_index = LawIndex(MOCK_LAWS)
+    return _law_index
+
+
+# 목업 조문(조/항/호/목) passage 색인
+_passage_index: PassageIndex | None = None
+
+
+def get_passage_index() -> PassageIndex:
+    """목업 조문 passage 색인 반환 (없으면 생성)"""
+    global _passage_index
+    if _passage_index is None:
+        _passage_index = PassageIndex(MOCK_LAWS)
+    return _passage_index
+
+
 def get_all_laws() -> List[LawData]:
     """모든 법령 데이터 반환"""
     return MOCK_LAWS
@@ -303,43 +329,15 @@ def get_all_laws() -> List[LawData]:
 
 def get_law_by_id(law_id: str) -> LawData | None:
     """법령 ID로 법령 데이터 조회"""
-    for law in MOCK_LAWS:
-        if law["id"] == law_id:
-            return law
-    return None
+    return get_law_index().get(law_id)
 
 
 def search_laws_by_keyword(keyword: str) -> List[LawData]:
-    """키워드로 법령 검색"""
-    keyword_lower = keyword.lower()
-    results = []
-    
-    for law in MOCK_LAWS:
-        # 법령명 검색
-        if keyword_lower in law["name"].lower():
-            results.append(law)
-            continue
-        
-        # 카테고리 검색
-        if any(keyword_lower in cat.lower() for cat in law["category"]):
-            results.append(law)
-            continue
-        
-        # 조문 내용 검색
-        for article in law.get("articles", []):
-            if keyword_lower in article.get("content", "").lower():
-                if law not in results:
-                    results.append(law)
-                break
-    
-    return results
+    """키워드로 법령 검색 (역색인 조회)"""
+    return get_law_index().search(keyword)
 
 
-def get_article_by_id(article_id: str) -> Dict[str, Any] | None:
-    """조문 ID로 조문 데이터 조회"""
-    for law in MOCK_LAWS:
-        for article in law.get("articles", []):
-            if article["id"] == article_id:
-                return article
-    return None
+def get_article_by_id(article_id: str, law_id: str | None = None) -> Dict[str, Any] | None:
+    """조문 ID로 조문 데이터 조회 (law_id 지정 시 해당 법령 소속인지 확인)"""
+    return get_passage_index().get_article(article_id, law_id)
 
@@ -0,0 +1,40 @@
+"""Conversation summary repository - SQLite implementation"""
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.db.models import ConversationSummary
+from app.utils.date_utils import now_utc
+
+
+class ConversationSummaryRepository:
+    """Conversation summary repository for SQLite"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get(self, conversation_id: str) -> Optional[ConversationSummary]:
+        """Get the rolling summary of a conversation"""
+        return self.db.query(ConversationSummary).filter(
+            ConversationSummary.conversation_id == conversation_id
+        ).first()
+    
+    def upsert(self, conversation_id: str, summary: str, summarized_count: int) -> ConversationSummary:
+        """Create or replace the rolling summary of a conversation"""
+        row = self.get(conversation_id)
+        if row is None:
+            row = ConversationSummary(conversation_id=conversation_id)
+            self.db.add(row)
+        row.summary = summary
+        row.summarized_count = summarized_count
+        row.updated_at = now_utc()
+        self.db.commit()
+        self.db.refresh(row)
+        return row
+    
+    def delete(self, conversation_id: str) -> bool:
+        """Delete the rolling summary of a conversation"""
+        row = self.get(conversation_id)
+        if row:
+            self.db.delete(row)
+            self.db.commit()
+            return True
+        return False
@@ -49,6 +49,25 @@ class MessageRepository:
         """Get all messages in a conversation"""
         return self.db.query(Message).filter(Message.conversation_id == conversation_id).order_by(Message.created_at).all()
     
+    def get_recent_by_conversation_id(self, conversation_id: str, limit: int) -> List[Message]:
+        """Get the latest messages in a conversation (oldest first)"""
+        messages = self.db.query(Message).filter(Message.conversation_id == conversation_id).order_by(
+            Message.created_at.desc()
+        ).limit(limit).all()
+        return list(reversed(messages))
+    
+    def get_range_by_conversation_id(self, conversation_id: str, start: int, end: int) -> List[Message]:
+        """Get messages [start, end) of a conversation in creation order"""
+        if end <= start:
+            return []
+        return self.db.query(Message).filter(Message.conversation_id == conversation_id).order_by(
+            Message.created_at
+        ).offset(start).limit(end - start).all()
+    
+    def count_by_conversation_id(self, conversation_id: str) -> int:
+        """Count messages in a conversation"""
+        return self.db.query(Message).filter(Message.conversation_id == conversation_id).count()
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Message]:
         """Get all messages"""
         return self.db.query(Message).offset(skip).limit(limit).all()
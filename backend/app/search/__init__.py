@@ -0,0 +1 @@
+"""Law search engine (inverted index, scoring)"""
@@ -0,0 +1,107 @@
+"""BM25F 관련도 점수 계산"""
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+from collections import Counter
+import heapq
+import math
+
+if TYPE_CHECKING:
+    from app.search.index import InvertedIndex
+
+# 법령 검색 기본 필드 가중치 (법령명 > 카테고리 > 조문)
+LAW_FIELD_WEIGHTS: Dict[str, float] = {
+    "name": 3.0,
+    "category": 2.0,
+    "article": 1.0,
+}
+
+
+class BM25FScorer:
+    """BM25F 점수 계산기
+
+    필드별 term 빈도를 가중치와 길이 정규화로 합산한 뒤 BM25 포화 함수를 적용합니다.
+    문서 길이/평균 길이 등 통계는 색인 시점에 저장된 값을 사용하며,
+    정규화 계수는 색인이 바뀔 때만 다시 계산합니다.
+    """
+
+    def __init__(
+        self,
+        index: "InvertedIndex",
+        field_weights: Dict[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.index = index
+        self.weights: Tuple[float, ...] = tuple(field_weights.get(name, 0.0) for name in index.fields)
+        self.k1 = k1
+        self.b = b
+        self._norms: List[Tuple[float, ...]] = []
+        self._norms_version = -1
+
+    def _length_norms(self) -> List[Tuple[float, ...]]:
+        """문서별 (필드 가중치 / 길이 정규화) 계수"""
+        if self._norms_version != self.index.version:
+            averages = self.index.average_lengths()
+            norms = []
+            for lengths in self.index.field_lengths():
+                norms.append(tuple(
+                    weight / (1 - self.b + self.b * (length / avg if avg else 0.0))
+                    if weight else 0.0
+                    for weight, length, avg in zip(self.weights, lengths, averages)
+                ))
+            self._norms = norms
+            self._norms_version = self.index.version
+        return self._norms
+
+    def idf(self, term: str) -> float:
+        """역문서 빈도 (Lucene 방식, 항상 양수)"""
+        n = len(self.index)
+        df = len(self.index.posting(term))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def score(self, terms: Sequence[str], docs: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        """
+        term 목록에 대한 문서별 점수 계산
+
+        Args:
+            terms: 질의 term 목록 (중복은 질의 내 가중치로 사용)
+            docs: 점수를 계산할 문서 번호 (None이면 term을 포함하는 모든 문서)
+
+        Returns:
+            문서 번호 -> 점수 (점수가 0인 문서는 제외)
+        """
+        norms = self._length_norms()
+        allowed = set(docs) if docs is not None else None
+        scores: Dict[int, float] = {}
+
+        for term, query_tf in Counter(terms).items():
+            posting = self.index.posting(term)
+            if not posting:
+                continue
+            idf = self.idf(term)
+            targets = allowed.intersection(posting) if allowed is not None else posting
+            for doc in targets:
+                weighted_tf = sum(tf * norm for tf, norm in zip(posting[doc], norms[doc]))
+                if weighted_tf <= 0:
+                    continue
+                scores[doc] = scores.get(doc, 0.0) + query_tf * idf * (
+                    weighted_tf * (self.k1 + 1) / (weighted_tf + self.k1)
+                )
+
+        return scores
+
+    @staticmethod
+    def top_k(scores: Dict[int, float], k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        점수 상위 k개 선택 (동점이면 색인 순서)
+
+        Args:
+            scores: 문서 번호 -> 점수
+            k: 선택 개수 (None이면 전체 정렬)
+
+        Returns:
+            (문서 번호, 점수) 리스트
+        """
+        key = lambda item: (-item[1], item[0])
+        if k is None or k >= len(scores):
+            return sorted(scores.items(), key=key)
+        return heapq.nsmallest(k, scores.items(), key=key)
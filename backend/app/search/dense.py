@@ -0,0 +1,446 @@
+"""로컬 dense 검색 (해싱 + TF-IDF + LSA 임베딩, memory-mapped 행렬)
+
+네트워크나 외부 모델 없이 CPU만으로 동작합니다.
+
+- 오프라인 작업(scripts/build_dense_index.py)에서 모든 조문 passage를 임베딩해
+  NumPy 행렬(.npy)로 저장
+- 서버는 np.load(mmap_mode="r")로 열기 때문에 같은 호스트의 uvicorn 워커들이
+  OS 페이지 캐시를 공유 (워커 수만큼 메모리가 늘지 않음)
+- passage가 많으면(IVF_MIN_PASSAGES 이상) 색인 생성 시 임베딩을 k-means로 약 sqrt(N)개 목록에
+  나누고 목록 순서대로 행을 정렬해 저장 (IVF). 질의는 중심 벡터와 가까운 n_probe개 목록의
+  연속 구간만 내적하므로 행렬 전체를 스캔하지 않음
+  (50만 x 128차원 float32, 1코어 측정: 전체 스캔은 256MB를 읽어 약 30ms,
+  IVF 707개 목록 중 32개 탐색은 약 2ms / recall@10 약 0.8, 64개는 약 3ms / 약 0.9.
+  근사 검색이라 놓친 passage는 sparse 결과와의 RRF 결합이 보완. scripts/bench_dense_search.py 참고)
+- passage가 적으면 행렬 전체와의 내적 한 번 + argpartition으로 정확한 top-k 선택
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from pathlib import Path
+import json
+import os
+import zlib
+
+import numpy as np
+
+from app.search.text import normalize_text, char_ngrams
+
+ENCODER_FILE = "encoder.npz"
+MATRIX_FILE = "passages.npy"
+META_FILE = "passages.json"
+IVF_FILE = "ivf.npz"
+
+# 해싱 공간 크기 / 임베딩 차원 기본값
+DEFAULT_FEATURES = 2 ** 14
+DEFAULT_DIM = 128
+
+# 이보다 passage가 적으면 전체 스캔 (1ms 미만이라 근사 검색이 필요 없음)
+IVF_MIN_PASSAGES = 20000
+# 질의마다 탐색할 IVF 목록 수 기본값
+DEFAULT_PROBES = 32
+_KMEANS_ITERATIONS = 10
+# k-means 학습 표본 (목록당 행 수)
+_KMEANS_SAMPLES_PER_LIST = 64
+_ASSIGN_BATCH = 65536
+
+
+class HashingEncoder:
+    """문자 n-gram 해싱 + TF-IDF + 절단 SVD(LSA) 임베딩
+
+    - 문자 2/3-gram을 고정 크기 공간으로 해싱 (어휘 사전 불필요)
+    - 코퍼스 문서 빈도로 IDF 가중
+    - 동시 출현 통계를 압축한 SVD 투영으로 "태양광 설치 허가" / "발전사업 신고" 처럼
+      표현이 다른 질문도 가까운 벡터가 되도록 함
+    """
+
+    def __init__(
+        self,
+        n_features: int = DEFAULT_FEATURES,
+        ngram_sizes: Sequence[int] = (2, 3),
+        idf: Optional[np.ndarray] = None,
+        components: Optional[np.ndarray] = None,
+    ):
+        self.n_features = n_features
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.idf = idf
+        self.components = components
+
+    @property
+    def dim(self) -> int:
+        """임베딩 차원"""
+        return 0 if self.components is None else self.components.shape[1]
+
+    def _features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """텍스트 -> (해시 feature 번호, 부호가 있는 log tf) 희소 표현"""
+        counts: Dict[int, float] = {}
+        normalized = normalize_text(text)
+        for n in self.ngram_sizes:
+            for gram in char_ngrams(normalized, n):
+                h = zlib.crc32(gram.encode("utf-8"))
+                index = h % self.n_features
+                sign = 1.0 if (h // self.n_features) % 2 == 0 else -1.0
+                counts[index] = counts.get(index, 0.0) + sign
+
+        if not counts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        # sublinear tf (부호 유지)
+        values = np.sign(values) * (1.0 + np.log(np.abs(values) + 1e-12))
+        return indices, values.astype(np.float32)
+
+    def _tfidf(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        indices, values = self._features(text)
+        if self.idf is not None and indices.size:
+            values = values * self.idf[indices]
+        return indices, values
+
+    def fit(self, texts: Sequence[str], dim: int = DEFAULT_DIM, max_fit_docs: int = 50000, seed: int = 42) -> "HashingEncoder":
+        """
+        IDF와 SVD 투영 학습 (오프라인 작업용)
+
+        희소 행렬을 밀집 행렬로 만들지 않고 randomized SVD를 행 단위로 누적합니다.
+
+        Args:
+            texts: 코퍼스 passage 텍스트
+            dim: 임베딩 차원
+            max_fit_docs: SVD 학습에 사용할 최대 문서 수 (초과 시 무작위 표본)
+            seed: 난수 시드
+
+        Returns:
+            self
+        """
+        rng = np.random.default_rng(seed)
+
+        # 1) 문서 빈도 -> IDF
+        df = np.zeros(self.n_features, dtype=np.float64)
+        for text in texts:
+            indices, _ = self._features(text)
+            df[indices] += 1
+        n_docs = max(len(texts), 1)
+        self.idf = (np.log((1 + n_docs) / (1 + df)) + 1.0).astype(np.float32)
+
+        # 2) 표본 TF-IDF 행 (희소)
+        sample = range(len(texts))
+        if len(texts) > max_fit_docs:
+            sample = sorted(rng.choice(len(texts), size=max_fit_docs, replace=False))
+        rows = [self._tfidf(texts[i]) for i in sample]
+        rows = [row for row in rows if row[0].size]
+        if not rows:
+            raise ValueError("임베딩을 학습할 텍스트가 없습니다.")
+
+        dim = min(dim, len(rows))
+        oversample = min(dim + 10, len(rows))
+
+        # 3) randomized SVD: Y = X @ Omega -> Q -> B = Q^T X -> svd(B)
+        omega = rng.standard_normal((self.n_features, oversample)).astype(np.float32)
+        y = np.stack([values @ omega[indices] for indices, values in rows])
+        q, _ = np.linalg.qr(y)
+        b = np.zeros((q.shape[1], self.n_features), dtype=np.float32)
+        for r, (indices, values) in enumerate(rows):
+            b[:, indices] += np.outer(q[r], values)
+        _, _, vt = np.linalg.svd(b, full_matrices=False)
+
+        self.components = np.ascontiguousarray(vt[:dim].T, dtype=np.float32)
+        return self
+
+    def encode(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        텍스트 -> L2 정규화된 임베딩 행렬
+
+        Args:
+            texts: 텍스트 목록
+
+        Returns:
+            (문서 수 x dim) float32 행렬
+        """
+        if self.components is None:
+            raise ValueError("학습되지 않은 encoder 입니다. fit() 또는 load()를 먼저 호출하세요.")
+
+        vectors = []
+        for text in texts:
+            indices, values = self._tfidf(text)
+            vector = values @ self.components[indices] if indices.size else np.zeros(self.dim, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm > 0 else vector)
+        if not vectors:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    def save(self, path: Path) -> None:
+        """encoder 파라미터 저장"""
+        np.savez(
+            path,
+            n_features=np.array(self.n_features),
+            ngram_sizes=np.array(self.ngram_sizes),
+            idf=self.idf,
+            components=self.components,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "HashingEncoder":
+        """encoder 파라미터 로드"""
+        with np.load(path) as data:
+            return cls(
+                n_features=int(data["n_features"]),
+                ngram_sizes=tuple(int(n) for n in data["ngram_sizes"]),
+                idf=data["idf"],
+                components=data["components"],
+            )
+
+
+def default_list_count(n_passages: int) -> int:
+    """IVF 목록 수 기본값 (passage가 적으면 0 = 전체 스캔)"""
+    if n_passages < IVF_MIN_PASSAGES:
+        return 0
+    return int(np.sqrt(n_passages))
+
+
+def _assign_lists(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """각 행과 내적이 가장 큰 중심 벡터 번호 (배치 단위로 계산)"""
+    assignments = np.empty(matrix.shape[0], dtype=np.int32)
+    for start in range(0, matrix.shape[0], _ASSIGN_BATCH):
+        block = np.asarray(matrix[start:start + _ASSIGN_BATCH])
+        assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def train_partition(matrix: np.ndarray, n_lists: int, seed: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IVF 분할 학습 (구면 k-means, 오프라인 작업용)
+
+    Args:
+        matrix: (passage 수 x dim) L2 정규화된 임베딩 행렬 (memmap 가능)
+        n_lists: 목록 수
+        seed: 난수 시드
+
+    Returns:
+        (중심 벡터 (n_lists x dim) float32,
+         목록 순서로 정렬한 행 번호 (passage 수,),
+         목록별 구간 시작 위치 (n_lists + 1,) - 정렬 후 목록 l 은 [offsets[l], offsets[l + 1]))
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = matrix.shape[0]
+    n_lists = max(1, min(n_lists, n_rows))
+    n_samples = min(n_rows, n_lists * _KMEANS_SAMPLES_PER_LIST)
+    sample = np.asarray(matrix[np.sort(rng.choice(n_rows, size=n_samples, replace=False))], dtype=np.float32)
+
+    centroids = sample[rng.choice(n_samples, size=n_lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        labels = _assign_lists(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # 빈 목록은 이전 중심을 유지
+        filled = norms[:, 0] > 0
+        centroids[filled] = sums[filled] / norms[filled]
+
+    assignments = _assign_lists(matrix, centroids)
+    order = np.argsort(assignments, kind="stable")
+    offsets = np.zeros(n_lists + 1, dtype=np.int64)
+    np.cumsum(np.bincount(assignments, minlength=n_lists), out=offsets[1:])
+    return centroids, order, offsets
+
+
+class DenseIndex:
+    """memory-mapped passage 임베딩 행렬 기반 최근접 검색
+
+    centroids/offsets 가 있으면 IVF 색인입니다. 행렬 행은 목록 순서로 정렬되어 있고
+    목록 l 의 행은 matrix[offsets[l]:offsets[l + 1]] 입니다.
+    """
+
+    def __init__(
+        self,
+        encoder: HashingEncoder,
+        matrix: np.ndarray,
+        ids: List[str],
+        law_ids: List[str],
+        source: Optional[str] = None,
+        centroids: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None,
+        n_probe: int = DEFAULT_PROBES,
+    ):
+        if matrix.shape[0] != len(ids):
+            raise ValueError("임베딩 행렬과 passage ID 수가 일치하지 않습니다.")
+        if centroids is not None and (offsets is None or len(offsets) != len(centroids) + 1 or offsets[-1] != len(ids)):
+            raise ValueError("IVF 목록 구간이 임베딩 행렬과 일치하지 않습니다.")
+        self.encoder = encoder
+        self.matrix = matrix
+        self.ids = ids
+        self.law_ids = law_ids
+        # 색인을 만든 법령 데이터 소스 (mock / local, 예전 색인은 None)
+        self.source = source
+        self.centroids = centroids
+        self.offsets = offsets
+        self.n_probe = max(1, n_probe)
+
+    @property
+    def n_lists(self) -> int:
+        """IVF 목록 수 (0 이면 전체 스캔)"""
+        return 0 if self.centroids is None else len(self.centroids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, directory: str | Path, n_probe: int = DEFAULT_PROBES) -> "DenseIndex":
+        """
+        오프라인 작업 결과 로드 (행렬은 mmap으로 열어 워커 간 페이지 캐시 공유)
+
+        Args:
+            directory: build_dense_index.py 출력 디렉터리
+            n_probe: IVF 색인에서 질의마다 탐색할 목록 수
+
+        Returns:
+            DenseIndex
+        """
+        directory = Path(directory)
+        encoder = HashingEncoder.load(directory / ENCODER_FILE)
+        matrix = np.load(directory / MATRIX_FILE, mmap_mode="r")
+        with open(directory / META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        centroids = offsets = None
+        if meta.get("n_lists"):
+            with np.load(directory / IVF_FILE) as data:
+                centroids, offsets = data["centroids"], data["offsets"]
+        return cls(encoder, matrix, meta["ids"], meta["law_ids"], meta.get("source"), centroids, offsets, n_probe)
+
+    @staticmethod
+    def build(
+        directory: str | Path,
+        passages: Sequence[Tuple[str, str, str]],
+        dim: int = DEFAULT_DIM,
+        n_features: int = DEFAULT_FEATURES,
+        source: str = "mock",
+        n_lists: Optional[int] = None,
+    ) -> "DenseIndex":
+        """
+        passage 임베딩 행렬 생성 및 저장 (오프라인 작업용)
+
+        서버가 읽는 중에도 안전하도록 임시 파일에 쓴 뒤 교체합니다.
+
+        Args:
+            directory: 출력 디렉터리
+            passages: (passage ID, 법령 ID, 텍스트) 목록
+            dim: 임베딩 차원
+            n_features: 해싱 공간 크기
+            source: passage 를 가져온 법령 데이터 소스 (mock / local, 검색 시 활성 소스와 같을 때만 사용)
+            n_lists: IVF 목록 수 (None 이면 passage 수로 결정, 0 이면 전체 스캔)
+
+        Returns:
+            저장된 결과를 mmap으로 다시 연 DenseIndex
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        texts = [text for _, _, text in passages]
+        encoder = HashingEncoder(n_features=n_features).fit(texts, dim=dim)
+
+        tmp_matrix = directory / f"{MATRIX_FILE}.tmp"
+        matrix = np.lib.format.open_memmap(
+            tmp_matrix, mode="w+", dtype=np.float32, shape=(len(texts), encoder.dim)
+        )
+        batch = 1024
+        for start in range(0, len(texts), batch):
+            matrix[start:start + batch] = encoder.encode(texts[start:start + batch])
+        matrix.flush()
+
+        ids = [pid for pid, _, _ in passages]
+        law_ids = [lid for _, lid, _ in passages]
+        if n_lists is None:
+            n_lists = default_list_count(len(texts))
+        if n_lists:
+            # 목록 순서로 행을 다시 써서 목록마다 연속 구간이 되도록 함
+            centroids, order, offsets = train_partition(matrix, n_lists)
+            tmp_sorted = directory / f"{MATRIX_FILE}.sorted.tmp"
+            sorted_matrix = np.lib.format.open_memmap(
+                tmp_sorted, mode="w+", dtype=np.float32, shape=matrix.shape
+            )
+            for start in range(0, len(order), _ASSIGN_BATCH):
+                sorted_matrix[start:start + _ASSIGN_BATCH] = matrix[order[start:start + _ASSIGN_BATCH]]
+            sorted_matrix.flush()
+            del matrix, sorted_matrix
+            os.replace(tmp_sorted, tmp_matrix)
+            ids = [ids[i] for i in order]
+            law_ids = [law_ids[i] for i in order]
+            n_lists = len(centroids)
+            tmp_ivf = directory / f"{IVF_FILE}.tmp.npz"
+            np.savez(tmp_ivf, centroids=centroids, offsets=offsets)
+            os.replace(tmp_ivf, directory / IVF_FILE)
+        else:
+            del matrix
+
+        tmp_encoder = directory / f"{ENCODER_FILE}.tmp.npz"
+        encoder.save(tmp_encoder)
+        tmp_meta = directory / f"{META_FILE}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(
+                {"ids": ids, "law_ids": law_ids, "source": source, "n_lists": n_lists},
+                f,
+                ensure_ascii=False,
+            )
+
+        os.replace(tmp_encoder, directory / ENCODER_FILE)
+        os.replace(tmp_meta, directory / META_FILE)
+        os.replace(tmp_matrix, directory / MATRIX_FILE)
+        return DenseIndex.load(directory)
+
+    def search(self, query: str, k: int = 20, min_score: float = 0.0) -> List[Tuple[str, str, float]]:
+        """
+        질의와 코사인 유사도가 높은 passage top-k
+
+        Args:
+            query: 질의 텍스트
+            k: 반환 개수
+            min_score: 최소 유사도
+
+        Returns:
+            (passage ID, 법령 ID, 유사도) 리스트 (유사도 내림차순)
+        """
+        if not len(self.ids) or k <= 0:
+            return []
+
+        return self.search_vector(self.encoder.encode([query])[0], k, min_score)
+
+    def search_vector(self, query_vector: np.ndarray, k: int = 20, min_score: float = 0.0) -> List[Tuple[str, str, float]]:
+        """
+        임베딩 벡터와 코사인 유사도가 높은 passage top-k (search() 참고)
+
+        Args:
+            query_vector: L2 정규화된 (dim,) 질의 벡터
+            k: 반환 개수
+            min_score: 최소 유사도
+
+        Returns:
+            (passage ID, 법령 ID, 유사도) 리스트 (유사도 내림차순)
+        """
+        if not len(self.ids) or k <= 0 or not query_vector.any():
+            return []
+
+        rows, scores = self._scan(query_vector)
+        if not len(scores):
+            return []
+        k = min(k, scores.shape[0])
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self.ids[rows[i]], self.law_ids[rows[i]], float(scores[i]))
+            for i in top
+            if scores[i] >= min_score
+        ]
+
+    def _scan(self, query_vector: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(행 번호, 유사도) - 전체 행 또는 질의와 가까운 n_probe개 IVF 목록의 행"""
+        if self.centroids is None or self.n_probe >= self.n_lists:
+            return np.arange(len(self.ids)), self.matrix @ query_vector
+
+        probe = np.argpartition(-(self.centroids @ query_vector), self.n_probe - 1)[:self.n_probe]
+        rows, scores = [], []
+        for list_id in probe:
+            start, end = int(self.offsets[list_id]), int(self.offsets[list_id + 1])
+            if start < end:
+                rows.append(np.arange(start, end))
+                scores.append(self.matrix[start:end] @ query_vector)
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(scores)
@@ -0,0 +1,33 @@
+"""sparse(BM25F) + dense 검색 결과 결합"""
+from typing import Dict, List, Optional, Sequence
+
+# Reciprocal Rank Fusion 상수 (순위가 낮은 결과의 영향 완화)
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    weights: Optional[Sequence[float]] = None,
+    k: int = RRF_K,
+) -> List[tuple]:
+    """
+    여러 순위 목록을 Reciprocal Rank Fusion으로 결합
+
+    점수 척도가 다른 BM25F 점수와 코사인 유사도를 직접 더하지 않고 순위만 사용합니다.
+
+    Args:
+        rankings: 키 목록들 (각각 관련도 내림차순)
+        weights: 목록별 가중치 (None이면 모두 1.0)
+        k: RRF 상수
+
+    Returns:
+        (키, 결합 점수) 리스트 (점수 내림차순, 동점이면 먼저 나온 순서)
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, key in enumerate(ranking):
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank + 1)
+
+    order = {key: i for i, key in enumerate(scores)}
+    return sorted(scores.items(), key=lambda item: (-item[1], order[item[0]]))
@@ -0,0 +1,270 @@
+"""법령 검색용 역색인"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from app.search.text import normalize_text, char_ngrams, index_terms
+from app.search.bm25 import BM25FScorer, LAW_FIELD_WEIGHTS
+
+# 필드 값: 단일 문자열 또는 (조문처럼) 여러 문단의 리스트
+FieldValue = Union[str, Sequence[str]]
+
+# 법령 단위 색인 필드
+LAW_FIELDS: Tuple[str, ...] = ("name", "category", "article")
+
+
+class InvertedIndex:
+    """필드별 문자 n-gram 역색인
+
+    - 문서마다 필드 텍스트를 정규화해서 보관 (부분 문자열 검증용)
+    - term(n-gram) -> {문서 번호: 필드별 등장 횟수} posting 유지
+    - 필드별 문서 길이(gram 수)를 함께 저장해 점수 계산에 재사용
+
+    색인은 생성 시 한 번만 만들고, 조회 시에는 텍스트를 다시 소문자화하거나
+    전체 문서를 순회하지 않습니다.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._keys: List[str] = []
+        self._doc_ids: Dict[str, int] = {}
+        self._texts: List[Tuple[str, ...]] = []
+        self._lengths: List[Tuple[int, ...]] = []
+        self._total_lengths: List[int] = [0] * len(self.fields)
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        # 문서가 추가될 때마다 증가 (점수 계산용 통계 캐시 무효화 기준)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc_ids
+
+    @staticmethod
+    def _normalize_field(value: FieldValue) -> str:
+        """필드 값을 정규화 (여러 문단은 줄바꿈으로 구분해 문단 간 오매칭 방지)"""
+        if isinstance(value, str):
+            return normalize_text(value)
+        return "\n".join(part for part in (normalize_text(v) for v in value) if part)
+
+    def add(self, key: str, fields: Dict[str, FieldValue]) -> int:
+        """
+        문서 추가
+
+        Args:
+            key: 문서 키 (법령 ID 등)
+            fields: 필드명 -> 텍스트
+
+        Returns:
+            내부 문서 번호
+        """
+        if key in self._doc_ids:
+            raise ValueError(f"이미 색인된 문서입니다: {key}")
+
+        doc = len(self._keys)
+        texts = tuple(self._normalize_field(fields.get(name, "")) for name in self.fields)
+        lengths = tuple(len(char_ngrams(text)) for text in texts)
+
+        for pos, text in enumerate(texts):
+            for term in index_terms(text):
+                posting = self._postings.setdefault(term, {})
+                tfs = posting.get(doc)
+                if tfs is None:
+                    tfs = posting[doc] = [0] * len(self.fields)
+                tfs[pos] += 1
+            self._total_lengths[pos] += lengths[pos]
+
+        self._keys.append(key)
+        self._doc_ids[key] = doc
+        self._texts.append(texts)
+        self._lengths.append(lengths)
+        self.version += 1
+        return doc
+
+    def doc_id(self, key: str) -> Optional[int]:
+        """문서 키 -> 내부 문서 번호"""
+        return self._doc_ids.get(key)
+
+    def key(self, doc: int) -> str:
+        """내부 문서 번호 -> 문서 키"""
+        return self._keys[doc]
+
+    def posting(self, term: str) -> Dict[int, List[int]]:
+        """term의 posting (문서 번호 -> 필드별 등장 횟수)"""
+        return self._postings.get(term, {})
+
+    def field_lengths(self) -> List[Tuple[int, ...]]:
+        """문서별 필드 길이 (gram 수)"""
+        return self._lengths
+
+    def average_lengths(self) -> Tuple[float, ...]:
+        """필드별 평균 길이"""
+        count = len(self._keys)
+        return tuple(total / count if count else 0.0 for total in self._total_lengths)
+
+    def candidates(self, terms: Iterable[str]) -> List[int]:
+        """
+        모든 term을 포함하는 문서 번호 (posting 교집합, 오름차순)
+
+        Args:
+            terms: 조회할 term 목록
+
+        Returns:
+            문서 번호 리스트
+        """
+        unique_terms = set(terms)
+        if not unique_terms:
+            return []
+
+        postings = []
+        for term in unique_terms:
+            posting = self._postings.get(term)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # 가장 짧은 posting부터 교집합을 좁혀감
+        postings.sort(key=len)
+        docs = set(postings[0])
+        for posting in postings[1:]:
+            docs.intersection_update(posting)
+            if not docs:
+                return []
+        return sorted(docs)
+
+    def lookup(self, query: str) -> List[int]:
+        """
+        부분 문자열 검색 (어느 필드든 query를 포함하는 문서)
+
+        n-gram 교집합으로 후보를 좁힌 뒤, 후보 문서에 대해서만 원문 포함 여부를 검증합니다.
+
+        Args:
+            query: 검색어
+
+        Returns:
+            문서 번호 리스트 (색인 순서)
+        """
+        normalized = normalize_text(query)
+        if not normalized:
+            return list(range(len(self._keys)))
+
+        return [
+            doc
+            for doc in self.candidates(char_ngrams(normalized))
+            if any(normalized in text for text in self._texts[doc])
+        ]
+
+
+class LawIndex(InvertedIndex):
+    """법령 단위 역색인 (법령명 / 카테고리 / 조문 제목·내용·항호목)"""
+
+    def __init__(self, laws: Iterable[Dict[str, Any]] = ()):
+        super().__init__(LAW_FIELDS)
+        self._laws: List[Dict[str, Any]] = []
+        self._scorer: Optional[BM25FScorer] = None
+        for law in laws:
+            self.add_law(law)
+
+    @staticmethod
+    def law_fields(law: Dict[str, Any]) -> Dict[str, FieldValue]:
+        """법령 데이터를 색인 필드로 변환"""
+        article_parts: List[str] = []
+        for article in law.get("articles", []):
+            article_parts.append(article.get("title", "") or "")
+            article_parts.append(article.get("content", "") or "")
+            for subp in article.get("subparagraphs", []):
+                article_parts.append(subp.get("content", "") or "")
+
+        return {
+            "name": law.get("name", "") or "",
+            "category": list(law.get("category", []) or []),
+            "article": article_parts,
+        }
+
+    def add_law(self, law: Dict[str, Any]) -> int:
+        """법령 추가"""
+        doc = self.add(law["id"], self.law_fields(law))
+        self._laws.append(law)
+        return doc
+
+    def law(self, doc: int) -> Dict[str, Any]:
+        """내부 문서 번호 -> 법령 데이터"""
+        return self._laws[doc]
+
+    def get(self, law_id: str) -> Optional[Dict[str, Any]]:
+        """법령 ID로 법령 조회 (O(1))"""
+        doc = self.doc_id(law_id)
+        return self._laws[doc] if doc is not None else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        """색인된 모든 법령"""
+        return list(self._laws)
+
+    def search(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        키워드로 법령 검색 (부분 문자열 일치)
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            키워드를 포함하는 법령 리스트 (색인 순서)
+        """
+        return [self._laws[doc] for doc in self.lookup(keyword)]
+
+    @property
+    def scorer(self) -> BM25FScorer:
+        """이 색인의 BM25F 점수 계산기 (필드 통계는 색인 시점에 계산된 값을 재사용)"""
+        if self._scorer is None:
+            self._scorer = BM25FScorer(self, LAW_FIELD_WEIGHTS)
+        return self._scorer
+
+    def rank(
+        self,
+        keyword: str,
+        law_ids: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        키워드 관련도(BM25F) 상위 법령 선택
+
+        Args:
+            keyword: 검색 키워드
+            law_ids: 점수를 계산할 법령 ID (None이면 키워드를 포함하는 모든 법령)
+            limit: 반환 개수 (None이면 전체)
+
+        Returns:
+            (법령, 점수) 리스트 (점수 내림차순)
+        """
+        docs = None
+        if law_ids is not None:
+            docs = [doc for doc in (self.doc_id(law_id) for law_id in law_ids) if doc is not None]
+
+        scores = self.scorer.score(char_ngrams(normalize_text(keyword)), docs)
+        return [(self._laws[doc], score) for doc, score in self.scorer.top_k(scores, limit)]
+
+    def search_any(
+        self,
+        terms: Sequence[str],
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        여러 검색어 중 하나라도 포함하는 법령을 BM25F 점수 순으로 검색 (OR 검색)
+
+        Args:
+            terms: 검색어 리스트 (analyze_query() 결과 등)
+            limit: 반환 개수 (None이면 전체)
+
+        Returns:
+            (법령, 점수) 리스트 (점수 내림차순)
+        """
+        grams: List[str] = []
+        docs = set()
+        for term in terms:
+            term_grams = char_ngrams(normalize_text(term))
+            grams.extend(term_grams)
+            docs.update(self.candidates(term_grams))
+
+        if not docs:
+            return []
+
+        scores = self.scorer.score(grams, docs)
+        return [(self._laws[doc], score) for doc, score in self.scorer.top_k(scores, limit)]
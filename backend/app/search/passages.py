@@ -0,0 +1,146 @@
+"""조문(조/항/호/목) 단위 passage 색인"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.search.index import InvertedIndex
+from app.search.bm25 import BM25FScorer
+from app.search.text import normalize_text, char_ngrams
+
+# passage 색인 필드: 소속 법령명 / 조문 제목 / 본문
+PASSAGE_FIELDS: Tuple[str, ...] = ("law", "title", "content")
+
+PASSAGE_FIELD_WEIGHTS: Dict[str, float] = {
+    "law": 1.5,
+    "title": 2.0,
+    "content": 1.0,
+}
+
+
+class PassageIndex(InvertedIndex):
+    """조문 및 항/호/목 단위 passage 역색인
+
+    - 조문 본문은 "조" passage, 항/호/목은 각각 별도 passage로 색인
+    - 조문/passage ID -> 데이터 해시맵으로 O(1) 조회
+    """
+
+    def __init__(self, laws: Iterable[Dict[str, Any]] = ()):
+        super().__init__(PASSAGE_FIELDS)
+        self._passages: List[Dict[str, Any]] = []
+        self._passage_ids: Dict[str, int] = {}
+        self._articles: Dict[str, Dict[str, Any]] = {}
+        self._article_laws: Dict[str, str] = {}
+        self._scorer: Optional[BM25FScorer] = None
+        for law in laws:
+            self.add_law(law)
+
+    def _add_passage(self, passage: Dict[str, Any], law_name: str, title: str) -> None:
+        key = f"{passage['law_id']}/{passage['id']}"
+        if key in self:
+            # 외부 API 응답에는 같은 조문번호가 반복되는 경우(장/절 제목 등)가 있음
+            return
+        doc = self.add(key, {"law": law_name, "title": title, "content": passage["content"]})
+        self._passages.append(passage)
+        self._passage_ids.setdefault(passage["id"], doc)
+
+    def add_law(self, law: Dict[str, Any]) -> None:
+        """법령의 조문/항/호/목을 passage로 색인"""
+        law_id = law["id"]
+        law_name = law.get("name", "") or ""
+
+        for article in law.get("articles", []):
+            article_id = article["id"]
+            title = article.get("title", "") or ""
+            self._articles[article_id] = article
+            self._article_laws[article_id] = law_id
+
+            self._add_passage(
+                {
+                    "id": article_id,
+                    "law_id": law_id,
+                    "article_id": article_id,
+                    "article_number": article.get("number", ""),
+                    "type": "조",
+                    "number": article.get("number", ""),
+                    "content": article.get("content", "") or "",
+                },
+                law_name,
+                title,
+            )
+            for subp in article.get("subparagraphs", []):
+                self._add_passage(
+                    {
+                        "id": subp["id"],
+                        "law_id": law_id,
+                        "article_id": article_id,
+                        "article_number": article.get("number", ""),
+                        "type": subp.get("type", ""),
+                        "number": subp.get("number", ""),
+                        "content": subp.get("content", "") or "",
+                    },
+                    law_name,
+                    title,
+                )
+
+    @property
+    def scorer(self) -> BM25FScorer:
+        """이 색인의 BM25F 점수 계산기"""
+        if self._scorer is None:
+            self._scorer = BM25FScorer(self, PASSAGE_FIELD_WEIGHTS)
+        return self._scorer
+
+    def get_article(self, article_id: str, law_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        조문 ID로 조문 조회 (O(1))
+
+        Args:
+            article_id: 조문 ID
+            law_id: 지정하면 해당 법령의 조문인 경우에만 반환
+
+        Returns:
+            조문 데이터 또는 None
+        """
+        article = self._articles.get(article_id)
+        if article is None or (law_id is not None and self._article_laws[article_id] != law_id):
+            return None
+        return article
+
+    def get_passage(self, passage_id: str) -> Optional[Dict[str, Any]]:
+        """passage(조문/항/호/목) ID로 조회 (O(1))"""
+        doc = self._passage_ids.get(passage_id)
+        return self._passages[doc] if doc is not None else None
+
+    def iter_passages(self) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """(passage, 법령명+제목+본문 텍스트) 순회 (dense 임베딩 생성용)"""
+        for passage, texts in zip(self._passages, self._texts):
+            yield passage, "\n".join(text for text in texts if text)
+
+    def search_any(
+        self,
+        terms: Sequence[str],
+        limit: Optional[int] = None,
+        law_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        여러 검색어 중 하나라도 포함하는 passage를 BM25F 점수 순으로 검색
+
+        Args:
+            terms: 검색어 리스트
+            limit: 반환 개수 (None이면 전체)
+            law_ids: 지정하면 해당 법령의 passage만 검색
+
+        Returns:
+            (passage, 점수) 리스트 (점수 내림차순)
+        """
+        allowed_laws = set(law_ids) if law_ids is not None else None
+        grams: List[str] = []
+        docs = set()
+        for term in terms:
+            term_grams = char_ngrams(normalize_text(term))
+            grams.extend(term_grams)
+            docs.update(self.candidates(term_grams))
+
+        if allowed_laws is not None:
+            docs = {doc for doc in docs if self._passages[doc]["law_id"] in allowed_laws}
+        if not docs:
+            return []
+
+        scores = self.scorer.score(grams, docs)
+        return [(self._passages[doc], score) for doc, score in self.scorer.top_k(scores, limit)]
@@ -0,0 +1,91 @@
+"""자연어 질문 분석 (검색어 분해 / 조사·어미 제거 / 불용어 제거)"""
+from typing import List
+import re
+from app.search.text import normalize_text
+
+# 한 질문에서 사용할 최대 검색어 수
+MAX_QUERY_TERMS = 8
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+
+# 길이가 긴 것부터 검사하는 조사/어미 목록
+_ENDINGS = sorted(
+    [
+        # 어미
+        "하려면", "하려는", "하는데", "하나요", "합니까", "습니까", "인가요", "한가요",
+        "되나요", "되는지", "됩니까", "되나", "된다",
+        "인가", "한가", "인지", "나요", "려면", "하는", "하면", "해야", "할", "한",
+        # 조사
+        "에서는", "으로는", "에서", "에게", "으로", "까지", "부터", "처럼", "보다",
+        "이나", "이란", "이라", "라는", "과의", "와의", "에는", "에도", "은", "는",
+        "이", "가", "을", "를", "에", "의", "로", "와", "과", "도", "만",
+    ],
+    key=len,
+    reverse=True,
+)
+
+_SINGLE_PARTICLES = frozenset(ending for ending in _ENDINGS if len(ending) == 1)
+
+# 조사처럼 보이는 글자로 끝나지만 떼면 안 되는 명사
+_PROTECTED_WORDS = (
+    "허가", "평가", "국가", "추가", "증가", "시가", "대가", "단가",
+    "제도", "용도", "정도", "한도", "지도", "시도", "자치도",
+    "높이", "길이", "넓이",
+)
+
+# 검색에 도움이 되지 않는 질문 표현
+STOPWORDS = frozenset({
+    "시", "때", "것", "수", "등", "및", "또는", "그", "이", "저",
+    "무엇", "무엇인", "뭐", "어떤", "어떻게", "어디", "언제", "누가", "왜",
+    "필요", "필요한", "있는", "있나", "있나요", "없는", "되는", "된",
+    "대해", "대한", "관해", "관한", "관련", "경우", "알려", "알려주세요", "주세요",
+    "방법", "내용", "설명", "차이", "해야", "하나", "어느",
+})
+
+
+def strip_particle(token: str) -> str:
+    """
+    어절 끝의 조사/어미를 한 번만 제거
+
+    Args:
+        token: 정규화된 어절
+
+    Returns:
+        조사/어미가 제거된 어간 (제거 후 2글자 미만이면 원래 어절)
+    """
+    if token.endswith(_PROTECTED_WORDS):
+        return token
+    for ending in _ENDINGS:
+        if token.endswith(ending) and len(token) - len(ending) >= 2:
+            return token[: -len(ending)]
+    return token
+
+
+def analyze_query(text: str, max_terms: int = MAX_QUERY_TERMS) -> List[str]:
+    """
+    자연어 질문을 검색어 목록으로 분해
+
+    예: "인천 서구에서 태양광 발전소 건설 시 필요한 인허가는?"
+        -> ["인천", "서구", "태양광", "발전소", "건설", "인허가"]
+
+    Args:
+        text: 사용자 질문
+        max_terms: 최대 검색어 수
+
+    Returns:
+        중복이 제거된 검색어 리스트 (등장 순서 유지)
+    """
+    terms: List[str] = []
+    for token in _TOKEN_RE.findall(normalize_text(text)):
+        # "것이", "수가" 처럼 불용어 + 조사로 된 어절
+        if token in STOPWORDS or (
+            len(token) == 2 and token[0] in STOPWORDS and token[1] in _SINGLE_PARTICLES
+        ):
+            continue
+        stem = strip_particle(token)
+        if len(stem) < 2 or stem in STOPWORDS or stem in terms:
+            continue
+        terms.append(stem)
+        if len(terms) >= max_terms:
+            break
+    return terms
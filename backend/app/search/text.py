@@ -0,0 +1,65 @@
+"""검색용 텍스트 정규화 및 문자 n-gram 분해"""
+from typing import List
+import unicodedata
+
+# 한글은 띄어쓰기/조사 때문에 단어 단위 색인이 잘 맞지 않으므로 문자 bigram을 기본 단위로 사용
+NGRAM_SIZE = 2
+
+
+def normalize_text(text: str) -> str:
+    """
+    검색용 텍스트 정규화 (NFC + 소문자 + 연속 공백 정리)
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> List[str]:
+    """
+    정규화된 텍스트를 어절 단위로 나눈 뒤 문자 n-gram 목록 생성
+
+    n보다 짧은 어절은 어절 자체를 하나의 gram으로 사용합니다.
+
+    Args:
+        text: normalize_text()를 거친 텍스트
+        n: gram 길이
+
+    Returns:
+        n-gram 리스트 (중복 포함, 등장 순서 유지)
+    """
+    grams: List[str] = []
+    for token in text.split():
+        if len(token) < n:
+            grams.append(token)
+            continue
+        grams.extend(token[i:i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+def index_terms(text: str, n: int = NGRAM_SIZE) -> List[str]:
+    """
+    색인용 term 목록 생성 (n-gram + 1글자 unigram)
+
+    1글자 검색어도 후보 조회가 가능하도록 unigram을 함께 색인합니다.
+
+    Args:
+        text: normalize_text()를 거친 텍스트
+        n: gram 길이
+
+    Returns:
+        term 리스트 (중복 포함)
+    """
+    terms = char_ngrams(text, n)
+    if n > 1:
+        for token in text.split():
+            # n보다 짧은 어절은 char_ngrams()에서 이미 그대로 포함됨
+            if len(token) >= n:
+                terms.extend(token)
+    return terms
@@ -0,0 +1,116 @@
+"""질문-답변 캐시 (같은 질문 + 같은 법령 컨텍스트 + 같은 모델이면 이전 답변 재사용)"""
+from typing import Any, Dict, List, Optional
+import hashlib
+import logging
+import re
+import unicodedata
+
+from app.corpus.law_xml import law_version
+from app.core.cache import aclear_cache, aget_cache, aset_cache, get_cache_key
+
+logger = logging.getLogger(__name__)
+
+# 질문 끝의 물음표/마침표 등 (있든 없든 같은 질문)
+_TRAILING_PUNCT = re.compile(r"[\s?？!！.。~]+$")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    캐시 키용 질문 정규화 (유니코드 NFKC, 공백 정리, 끝 문장부호 제거, 소문자)
+
+    Args:
+        question: 사용자 질문
+
+    Returns:
+        정규화된 질문
+    """
+    text = unicodedata.normalize("NFKC", question)
+    text = _SPACES.sub(" ", text).strip()
+    return _TRAILING_PUNCT.sub("", text).lower()
+
+
+def is_first_turn(question: str, conversation_history: Optional[List[dict]]) -> bool:
+    """대화 맥락이 없는 질문인지 (히스토리가 없거나 방금 저장한 현재 질문뿐)"""
+    return all(
+        msg.get("role") == "user" and msg.get("content") == question
+        for msg in conversation_history or []
+    )
+
+
+class AnswerCache:
+    """정확 일치 답변 캐시
+
+    - 키: 정규화된 질문 + 법령 컨텍스트 해시 + 모델 ID
+      (검색 결과나 조문이 바뀌면 컨텍스트 해시가 바뀌어서 자동으로 다른 키)
+    - 답변에 인용된 법령의 버전(최종 개정일)을 함께 저장하고, 조회 시 현재 버전과 다르면 버림
+    - 대화 맥락에 따라 답이 달라질 수 있으므로 첫 질문에만 사용
+    """
+
+    PREFIX = "answer"
+
+    def __init__(self, ttl: int = 86400):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.skipped = 0
+
+    def key(self, question: str, law_context: str, model: str) -> str:
+        """답변 캐시 키"""
+        context_hash = hashlib.blake2b(law_context.encode("utf-8"), digest_size=16).hexdigest()
+        return get_cache_key(self.PREFIX, model, normalize_question(question), context_hash)
+
+    async def get(self, key: str, laws: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        캐시된 답변 조회
+
+        Args:
+            key: 답변 캐시 키
+            laws: 이번 질문의 관련 법령 (인용 법령의 현재 버전 확인용)
+
+        Returns:
+            답변 또는 None (없거나 인용 법령이 개정된 경우)
+        """
+        entry = await aget_cache(key, self.ttl)
+        if entry is None:
+            self.misses += 1
+            return None
+        versions = {law["id"]: law_version(law) for law in laws}
+        if any(versions.get(law_id) != version for law_id, version in entry["cited"].items()):
+            # 인용한 법령이 개정됨 -> 다시 생성
+            self.invalidated += 1
+            self.misses += 1
+            await aclear_cache(key)
+            return None
+        self.hits += 1
+        return entry["answer"]
+
+    async def put(self, key: str, answer: str, cited_law_ids: List[str], laws: List[Dict[str, Any]]) -> None:
+        """
+        답변 저장
+
+        Args:
+            key: 답변 캐시 키
+            answer: 답변
+            cited_law_ids: 답변에 인용된 법령 ID
+            laws: 관련 법령 (인용 법령 버전 기록용)
+        """
+        versions = {law["id"]: law_version(law) for law in laws}
+        cited = {law_id: versions.get(law_id, "") for law_id in cited_law_ids}
+        await aset_cache(key, {"answer": answer, "cited": cited}, self.ttl)
+
+    def skip(self) -> None:
+        """캐시를 쓰지 않은 질문 (이어지는 대화)"""
+        self.skipped += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스/개정으로 버린 수/대상 외 질문 수와 적중률"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "skipped": self.skipped,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,229 @@
+"""토큰 예산 안에서 관련도 순으로 법령 컨텍스트 구성"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from app.core.tokens import count_tokens
+
+# 후보 블록 우선순위 (작을수록 먼저)
+_TIER_MATCHED = 0     # 질문과 일치한 passage 가 있는 조문 (passage 점수 순)
+_TIER_LEADING = 1     # 일치한 passage 가 없는 법령의 앞쪽 조문 (법령 순위, 조문 순서)
+_TIER_CHILDREN = 2    # 관련 하위 법령 이름
+
+# 일치한 passage 가 없는 법령에서 후보로 삼는 앞쪽 조문 수 (예산이 커도 목적/정의 조항 위주로 충분)
+_MAX_LEADING_ARTICLES = 10
+
+_CHILDREN_HEADING = "\n[관련 하위 법령]\n"
+
+
+class PackedContext(NamedTuple):
+    """컨텍스트 구성 결과"""
+
+    text: str
+    # 컨텍스트 토큰 수 (블록 토큰 수 합계)
+    tokens: int
+    budget: int
+    # 포함한 조문 수
+    articles: int
+    # 예산이 부족해서 뺀 블록 수
+    dropped: int
+    # 중복이라서 뺀 passage(조문/항/호/목) 수
+    duplicates: int
+
+
+class _Candidate(NamedTuple):
+    priority: Tuple
+    set_index: int
+    # 법령 세트 안에서의 출력 순서 (조문 위치, 하위 법령은 조문 뒤)
+    position: int
+    # 조문 후보: 조문과 포함할 항/호/목 (선택할 때 렌더링), 하위 법령 후보: 렌더링된 한 줄
+    article: Optional[Dict[str, Any]]
+    subparagraphs: List[Dict[str, Any]]
+    text: Optional[str] = None
+
+
+def _fingerprint(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def _render_header(law_set: Dict[str, Any]) -> str:
+    main = law_set["main"]
+    return "".join([
+        f"\n\n## {law_set['base_name']} (기본법: {main.get('name', '')} / {main.get('type', '')})\n",
+        f"최신 개정일: {main.get('amendment_date', 'N/A')}\n",
+    ])
+
+
+def _render_article(article: Dict[str, Any], subparagraphs: List[Dict[str, Any]]) -> str:
+    parts = [f"\n### {article.get('number', '')} {article.get('title', '')}\n", f"{article.get('content', '')}\n"]
+    parts.extend(
+        f"\n{subp.get('type', '')} {subp.get('number', '')}. {subp.get('content', '')}\n"
+        for subp in subparagraphs
+    )
+    return "".join(parts)
+
+
+def _matched_articles(passages: List[Dict[str, Any]]) -> Dict[str, Tuple[float, Optional[Set[str]]]]:
+    """
+    조문 ID -> (최고 passage 점수, 일치한 항/호/목 ID 집합)
+
+    조문 자체가 일치하면 항/호/목 집합은 None (전체 포함).
+    """
+    matched: Dict[str, Tuple[float, Optional[Set[str]]]] = {}
+    for passage in passages:
+        article_id = passage["article_id"]
+        score = float(passage.get("score") or 0.0)
+        best, subp_ids = matched.get(article_id, (score, set()))
+        if passage["id"] == article_id:
+            subp_ids = None
+        elif subp_ids is not None:
+            subp_ids.add(passage["id"])
+        matched[article_id] = (max(best, score), subp_ids)
+    return matched
+
+
+def pack_law_context(
+    law_sets: List[Dict[str, Any]],
+    passages: Optional[List[Dict[str, Any]]],
+    budget: int,
+    count: Callable[[str], int] = count_tokens,
+) -> PackedContext:
+    """
+    법령 세트들을 토큰 예산 안에서 관련도 순으로 채워 프롬프트의 [법령 컨텍스트] 생성
+
+    - 질문과 일치한 조문(passage 점수 순) -> 일치한 조문이 없는 법령의 앞쪽 조문(법령당 최대
+      _MAX_LEADING_ARTICLES개) -> 하위 법령 이름 순서로 예산에 들어가는 블록을 욕심쟁이 방식으로 선택
+      (법령 세트 헤더 토큰은 첫 블록을 넣을 때 함께 계산, 예산을 다 쓰면 나머지 후보는 렌더링하지 않음)
+    - 블록은 선택할 때 렌더링하고, 조문과 항/호/목 블록이 예산을 넘으면 조문만 넣어봄
+    - 같은 passage 가 여러 번 나오거나 이미 넣은 조문/항/호/목과 내용이 같으면 한 번만 포함
+      (예산이 부족해서 빠진 블록의 내용은 중복으로 치지 않음)
+    - 출력은 원래 순서(법령 세트 순위, 조문 순서)로 한 번에 join
+
+    Args:
+        law_sets: OpenAIService._build_law_sets() 결과 (관련도 순)
+        passages: 질문과 관련된 조문/항/호/목 passage (점수 순, 선택)
+        budget: 컨텍스트 토큰 예산
+        count: 토큰 수 계산 함수
+
+    Returns:
+        PackedContext
+    """
+    passages_by_law: Dict[str, List[Dict[str, Any]]] = {}
+    seen_passages: Set[str] = set()
+    duplicates = 0
+    for passage in passages or []:
+        if passage["id"] in seen_passages:
+            duplicates += 1
+            continue
+        seen_passages.add(passage["id"])
+        passages_by_law.setdefault(passage["law_id"], []).append(passage)
+
+    candidates: List[_Candidate] = []
+    for set_index, law_set in enumerate(law_sets):
+        main = law_set.get("main")
+        if not main:
+            continue
+        articles = main.get("articles", [])
+        matched = _matched_articles(passages_by_law.get(main.get("id"), []))
+
+        for position, article in enumerate(articles):
+            if matched:
+                if article.get("id") not in matched:
+                    continue
+                best, subp_ids = matched[article["id"]]
+                priority = (_TIER_MATCHED, -best, set_index, position)
+            elif position < _MAX_LEADING_ARTICLES:
+                subp_ids = None
+                priority = (_TIER_LEADING, set_index, position)
+            else:
+                break
+            subparagraphs = [
+                subp for subp in article.get("subparagraphs", [])
+                if subp_ids is None or subp["id"] in subp_ids
+            ]
+            candidates.append(_Candidate(priority, set_index, position, article, subparagraphs))
+
+        for child_index, child in enumerate(law_set.get("children", [])):
+            candidates.append(_Candidate(
+                (_TIER_CHILDREN, set_index, child_index),
+                set_index,
+                len(articles) + child_index,
+                None,
+                [],
+                f"- {child.get('name', '')} ({child.get('type', '')})\n",
+            ))
+
+    remaining = budget
+    opened: Set[int] = set()
+    header_tokens: Dict[int, int] = {}
+    with_children: Set[int] = set()
+    # 실제로 넣은 조문/항/호/목 내용 (빠진 후보의 내용은 뒤 후보에서 다시 쓸 수 있음)
+    seen_content: Set[str] = set()
+    selected: List[Tuple[int, int, bool, str]] = []
+    dropped = 0
+    ordered = sorted(candidates, key=lambda c: c.priority)
+    for index, candidate in enumerate(ordered):
+        if remaining <= 0:
+            # 예산을 다 썼으면 남은 후보는 렌더링하지 않고 뺌
+            dropped += len(ordered) - index
+            break
+        is_child = candidate.article is None
+        overhead = 0
+        if candidate.set_index not in opened:
+            if candidate.set_index not in header_tokens:
+                header_tokens[candidate.set_index] = count(_render_header(law_sets[candidate.set_index]))
+            overhead += header_tokens[candidate.set_index]
+        if is_child and candidate.set_index not in with_children:
+            overhead += count(_CHILDREN_HEADING)
+
+        emitted: List[str] = []
+        if is_child:
+            text = candidate.text
+        else:
+            content = _fingerprint(candidate.article.get("content", ""))
+            if content and content in seen_content:
+                duplicates += 1
+                continue
+            subparagraphs = []
+            subp_contents: List[str] = []
+            for subp in candidate.subparagraphs:
+                subp_content = _fingerprint(subp.get("content", ""))
+                # 조문 본문에 이미 들어있거나 앞에서 넣은 항/호/목
+                if subp_content and (subp_content in content or subp_content in seen_content or subp_content in subp_contents):
+                    duplicates += 1
+                    continue
+                subparagraphs.append(subp)
+                subp_contents.append(subp_content)
+            text = _render_article(candidate.article, subparagraphs)
+            emitted = [content] + subp_contents
+
+        cost = overhead + count(text)
+        if cost > remaining and not is_child and subparagraphs:
+            # 항/호/목을 빼고 조문만 넣어봄
+            text = _render_article(candidate.article, [])
+            cost = overhead + count(text)
+            emitted = [content]
+        if cost > remaining:
+            dropped += 1
+            continue
+
+        remaining -= cost
+        opened.add(candidate.set_index)
+        seen_content.update(fingerprint for fingerprint in emitted if fingerprint)
+        if is_child:
+            with_children.add(candidate.set_index)
+        selected.append((candidate.set_index, candidate.position, is_child, text))
+
+    # 원래 순서로 출력
+    parts: List[str] = []
+    current_set = None
+    children_started = False
+    for set_index, _, is_child, text in sorted(selected, key=lambda item: (item[0], item[1])):
+        if set_index != current_set:
+            current_set, children_started = set_index, False
+            parts.append(_render_header(law_sets[set_index]))
+        if is_child and not children_started:
+            children_started = True
+            parts.append(_CHILDREN_HEADING)
+        parts.append(text)
+
+    articles_included = sum(1 for _, _, is_child, _ in selected if not is_child)
+    return PackedContext("".join(parts), budget - remaining, budget, articles_included, dropped, duplicates)
@@ -0,0 +1,137 @@
+"""대화 누적 요약 (오래된 대화는 요약으로, 최근 대화만 원문으로 프롬프트에 포함)"""
+from typing import Awaitable, Callable, List, Optional, Set
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.singleflight import get_singleflight
+from app.core.tokens import message_tokens, truncate_to_tokens
+from app.db.database import SessionLocal
+from app.repositories.conversation_summary_repository import ConversationSummaryRepository
+from app.repositories.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_HEADER = "[이전 대화 요약]\n"
+
+# 원문 메시지를 자를 때 이보다 적게 남으면 아예 넣지 않음
+_MIN_TRUNCATED_TOKENS = 32
+
+# (이전 요약, 새로 요약할 메시지) -> 새 요약
+Summarize = Callable[[str, List[dict]], Awaitable[str]]
+
+_summary_flight = get_singleflight("conversation_summary")
+_summary_tasks: Set[asyncio.Task] = set()
+
+
+def recent_message_limit() -> int:
+    """프롬프트에 원문으로 넣는 최근 메시지 수 (현재 질문 제외)"""
+    return max(settings.conversation_recent_turns, 0) * 2
+
+
+def build_history_messages(
+    summary: Optional[str],
+    history: List[dict],
+    budget: int,
+    max_messages: Optional[int] = None,
+) -> List[dict]:
+    """
+    요약 + 최근 대화를 토큰 예산 안에서 chat 메시지로 구성
+
+    요약을 먼저 넣고(예산을 넘으면 자름), 남은 예산에 최근 메시지부터 거꾸로 채웁니다.
+    예산에 다 들어가지 않는 메시지는 잘라서 넣고 그보다 오래된 메시지는 버립니다.
+
+    Args:
+        summary: 대화 누적 요약 (없으면 None)
+        history: 최근 대화 메시지 (오래된 순, 현재 질문 제외)
+        budget: 요약 + 최근 대화 토큰 예산
+        max_messages: 원문으로 넣을 최대 메시지 수 (None 이면 recent_message_limit())
+
+    Returns:
+        chat 메시지 리스트 (요약은 system 메시지)
+    """
+    if max_messages is None:
+        max_messages = recent_message_limit()
+    remaining = budget
+    messages: List[dict] = []
+
+    if summary:
+        content = truncate_to_tokens(SUMMARY_HEADER + summary, remaining - message_tokens("system", ""))
+        if content:
+            messages.append({"role": "system", "content": content})
+            remaining -= message_tokens("system", content)
+
+    recent: List[dict] = []
+    for msg in reversed(history[-max_messages:] if max_messages > 0 else []):
+        role, content = msg.get("role", "user"), msg.get("content", "")
+        cost = message_tokens(role, content)
+        if cost > remaining:
+            available = remaining - message_tokens(role, "")
+            if available >= _MIN_TRUNCATED_TOKENS:
+                recent.append({"role": role, "content": truncate_to_tokens(content, available)})
+            break
+        recent.append({"role": role, "content": content})
+        remaining -= cost
+
+    messages.extend(reversed(recent))
+    return messages
+
+
+async def update_summary(
+    conversation_id: str,
+    summarize: Summarize,
+    session_factory: Callable = SessionLocal,
+) -> bool:
+    """
+    최근 대화 창 밖으로 밀려난 메시지를 누적 요약에 반영
+
+    Args:
+        conversation_id: 대화 세션 ID
+        summarize: (이전 요약, 새 메시지) -> 새 요약 코루틴 함수
+        session_factory: DB 세션 생성 함수
+
+    Returns:
+        요약을 갱신했으면 True (반영할 메시지가 없으면 False)
+    """
+    db = session_factory()
+    try:
+        summary_repo = ConversationSummaryRepository(db)
+        message_repo = MessageRepository(db)
+        row = summary_repo.get(conversation_id)
+        summary = row.summary if row else ""
+        summarized = row.summarized_count if row else 0
+
+        end = message_repo.count_by_conversation_id(conversation_id) - recent_message_limit()
+        if end <= summarized:
+            return False
+        new_messages = [
+            {"role": msg.role, "content": msg.content}
+            for msg in message_repo.get_range_by_conversation_id(conversation_id, summarized, end)
+        ]
+        new_summary = await summarize(summary, new_messages)
+        summary_repo.upsert(conversation_id, new_summary, end)
+        return True
+    finally:
+        db.close()
+
+
+def schedule_summary_update(conversation_id: str, summarize: Summarize) -> None:
+    """
+    응답 저장 후 누적 요약 갱신을 백그라운드로 예약
+
+    같은 대화의 갱신이 이미 진행 중이면 건너뜁니다 (다음 턴에서 밀린 메시지까지 함께 반영).
+    """
+    if not settings.conversation_summary_enabled or _summary_flight.is_running(conversation_id):
+        return
+    task = asyncio.ensure_future(
+        _summary_flight.do(conversation_id, lambda: update_summary(conversation_id, summarize))
+    )
+    _summary_tasks.add(task)
+    task.add_done_callback(lambda done: _summary_done(conversation_id, done))
+
+
+def _summary_done(conversation_id: str, task: asyncio.Task) -> None:
+    _summary_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # 요약 위치가 그대로이므로 다음 턴에서 다시 시도
+        logger.warning(f"대화 요약 갱신 실패 ({conversation_id}): {task.exception()}")
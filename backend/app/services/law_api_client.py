@@ -0,0 +1,188 @@
+"""법제처(law.go.kr) Open API 비동기 클라이언트"""
+from typing import Any, AsyncIterator, Dict, Optional
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용 가능 여부 (httpx[http2] 의 h2 패키지 필요)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class LawApiClient:
+    """공유 httpx.AsyncClient 기반 법제처 API 클라이언트
+
+    - 프로세스당 하나의 AsyncClient를 재사용해서 keep-alive 커넥션 풀로
+      요청마다 TCP/TLS 연결을 새로 맺지 않음
+    - h2 패키지가 설치되어 있으면 HTTP/2 로 한 커넥션에서 여러 요청을 다중화
+    - 이벤트 루프를 막지 않으므로 느린 외부 호출이 다른 요청을 지연시키지 않음
+    - 타임아웃/연결 오류/5xx 비율이 높으면 회로 차단기가 열려서 한동안 호출하지 않고
+      바로 CircuitOpenError를 던짐 (호출 측은 즉시 로컬/목업 데이터로 fallback)
+    """
+
+    # 검색용
+    SEARCH_URL = "https://www.law.go.kr/DRF/lawSearch.do"
+    # 상세(조문 포함) 조회용
+    DETAIL_URL = "https://www.law.go.kr/DRF/lawService.do"
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.warning("h2 패키지가 없어 HTTP/1.1 로 호출합니다 (pip install 'httpx[http2]').")
+        self.breaker = breaker or CircuitBreaker("law.go.kr")
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 AsyncClient (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    def _acquire(self) -> None:
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("law.go.kr")
+
+    def _record(self, resp: httpx.Response) -> None:
+        # 4xx는 요청 문제이므로 upstream 장애로 보지 않음
+        if resp.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _params(self, **params: Any) -> Dict[str, Any]:
+        """공통 쿼리 파라미터 (인증키, 대상, 응답 형식) + 요청별 파라미터"""
+        return {"OC": self.api_key, "target": "law", "type": "XML", **params}
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        self._acquire()
+        try:
+            resp = await self.client.get(url, params=self._params(**params))
+        except httpx.TransportError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self._record(resp)
+        resp.raise_for_status()
+        return resp
+
+    async def search(self, keyword: str) -> httpx.Response:
+        """
+        lawSearch.do 법령 검색
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            XML 응답
+
+        Raises:
+            httpx.HTTPError: 호출 실패
+            CircuitOpenError: 회로 차단 중
+        """
+        return await self._get(self.SEARCH_URL, {"query": keyword})
+
+    async def stream_law(self, law_id: str) -> AsyncIterator[bytes]:
+        """
+        lawService.do 법령 상세 조회 (응답 본문을 받는 대로 조각 단위로 반환)
+
+        조문이 많은 법령도 본문 전체를 메모리에 올리지 않고 증분 파서에 바로 넘길 수 있습니다.
+
+        Args:
+            law_id: 법령 ID
+
+        Yields:
+            응답 본문 바이트 조각
+
+        Raises:
+            httpx.HTTPError: 호출 실패
+            CircuitOpenError: 회로 차단 중
+        """
+        self._acquire()
+        recorded = False
+        try:
+            async with self.client.stream("GET", self.DETAIL_URL, params=self._params(ID=law_id)) as resp:
+                self._record(resp)
+                recorded = True
+                resp.raise_for_status()
+                async for chunk in resp.aiter_bytes():
+                    yield chunk
+        except httpx.TransportError:
+            if not recorded:
+                self.breaker.record_failure()
+            raise
+        except BaseException:
+            if not recorded:
+                self.breaker.release()
+            raise
+
+    async def aclose(self) -> None:
+        """커넥션 풀 정리 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 싱글톤 인스턴스
+_law_api_client: Optional[LawApiClient] = None
+
+
+def get_law_api_client() -> LawApiClient:
+    """법제처 API 클라이언트 인스턴스 가져오기"""
+    global _law_api_client
+    if _law_api_client is None:
+        _law_api_client = LawApiClient(
+            api_key=settings.law_api_key,
+            timeout=settings.law_api_timeout,
+            max_connections=settings.law_api_max_connections,
+            max_keepalive_connections=settings.law_api_max_keepalive,
+            keepalive_expiry=settings.law_api_keepalive_expiry,
+            http2=settings.law_api_http2,
+            breaker=CircuitBreaker(
+                "law.go.kr",
+                failure_rate_threshold=settings.law_api_breaker_failure_rate,
+                minimum_calls=settings.law_api_breaker_min_calls,
+                window_size=settings.law_api_breaker_window,
+                open_seconds=settings.law_api_breaker_open_seconds,
+            ),
+        )
+        logger.info(f"법제처 API 클라이언트 생성 (HTTP/2: {_law_api_client.http2})")
+    return _law_api_client
+
+
+async def close_law_api_client() -> None:
+    """법제처 API 클라이언트 종료"""
+    global _law_api_client
+    if _law_api_client is not None:
+        await _law_api_client.aclose()
+        _law_api_client = None
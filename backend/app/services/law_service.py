@@ -1,6 +1,10 @@
 """법령 검색 서비스"""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from contextlib import aclosing
+import asyncio
+import heapq
 import logging
+import os
 import xml.etree.ElementTree as ET
 
 import httpx
@@ -10,347 +14,630 @@ from app.mock.law_data import (
     get_law_by_id,
     search_laws_by_keyword,
     get_article_by_id,
+    get_law_index,
+    get_passage_index,
 )
-from app.core.cache import get_cache, set_cache, get_cache_key
+from app.corpus.law_xml import aparse_law_stream, parse_law_summary
+from app.corpus.store import get_law_store
+from app.corpus.sync import LawSource, RemoteLawSource, FixtureLawSource, SyncResult, sync_corpus
+from app.search.index import LawIndex
+from app.search.passages import PassageIndex
+from app.search.query import analyze_query
+from app.search.dense import DenseIndex
+from app.search.hybrid import reciprocal_rank_fusion
+from app.services.law_api_client import get_law_api_client
+from app.core.cache import aget_cache, aset_cache, get_cache_key, clear_cache, get_or_revalidate, memoize
+from app.core.singleflight import get_singleflight
+from app.core.exceptions import CircuitOpenError
 from app.core.config import settings
 
 
 logger = logging.getLogger(__name__)
 
+# 외부 API 장애로 보고 로컬/목업 데이터로 대체하는 오류
+UPSTREAM_ERRORS = (httpx.HTTPError, ET.ParseError, CircuitOpenError)
+
+# 존재하지 않는 법령의 negative 캐시 값 (get_cache의 "없음"(None)과 구분)
+LAW_NOT_FOUND = "__law_not_found__"
+
+
+
+class FallbackResults(list):
+    """외부 API 장애로 로컬 코퍼스/목업 데이터로 대체한 검색 결과 (HTTP 응답 캐시에 저장하지 않음)"""
+
+
+class FallbackLaw(dict):
+    """외부 API 장애로 로컬 코퍼스/목업 데이터로 대체한 법령 상세 (HTTP 응답 캐시에 저장하지 않음)"""
+
+
+def is_fallback(result: Any) -> bool:
+    """search_laws() / get_law() 결과가 외부 API 장애로 대체한 데이터인지 여부"""
+    return isinstance(result, (FallbackResults, FallbackLaw))
+
+
+# 동시 캐시 미스 병합 (stats()의 coalesced = 절약한 upstream 호출 수)
+_search_flight = get_singleflight("law_search")
+_detail_flight = get_singleflight("law_detail")
+
+
+class RetrievalResult(NamedTuple):
+    """질문 하나에 대한 검색 결과 (요청당 한 번 만들어 프롬프트 구성과 출처 추출에 함께 사용)"""
+
+    question: str
+    # 관련 법령 (관련도 순, score 포함)
+    laws: List[Dict[str, Any]]
+    # 관련 조문/항/호/목 passage (점수 순, score 포함)
+    passages: List[Dict[str, Any]]
+
+    @property
+    def scores(self) -> Dict[str, float]:
+        """법령 ID -> 관련도 점수"""
+        return {law["id"]: law.get("score", 0.0) for law in self.laws}
+
+    @property
+    def law_ids(self) -> List[str]:
+        """관련 법령 ID (관련도 순)"""
+        return [law["id"] for law in self.laws]
+
 
 class LawService:
     """법령 검색 및 조회 서비스
 
     기본적으로 목업 데이터를 사용하지만, .env에 LAW_API_KEY 가 설정되어 있으면
     국가법령정보센터(법제처) Open API를 통해 실제 법령/조문을 조회합니다.
+    LAW_SOURCE=local 이면 로컬 SQLite 코퍼스(scripts/load_law_corpus.py로 적재)에서
+    검색/조회하므로 외부 API 호출 없이 디스크 읽기만 합니다.
     """
 
-    # 검색용
-    LAW_API_BASE_URL = "https://www.law.go.kr/DRF/lawSearch.do"
-    # 상세(조문 포함) 조회용
-    LAW_DETAIL_BASE_URL = "https://www.law.go.kr/DRF/lawService.do"
+    # dense(임베딩) 색인 - DENSE_INDEX_DIR 설정 시 최초 1회 로드
+    _dense_index: Optional[DenseIndex] = None
+    _dense_index_loaded: bool = False
+
+    @staticmethod
+    def _data_source() -> str:
+        """법령 데이터 소스 (mock / external / local)"""
+        source = getattr(settings, "law_source", "auto")
+        if source != "auto":
+            return source
+        return "external" if getattr(settings, "law_api_key", "").strip() else "mock"
 
     @staticmethod
     def _use_external_api() -> bool:
         """외부 법령 API 사용 여부"""
-        return bool(getattr(settings, "law_api_key", "").strip())
+        return LawService._data_source() == "external"
 
-    @classmethod
-    def _search_laws_external(cls, keyword: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _use_local_corpus() -> bool:
+        """로컬 SQLite 코퍼스 사용 여부"""
+        return LawService._data_source() == "local"
+
+    @staticmethod
+    def data_version() -> Optional[str]:
+        """
+        응답 캐시 키/ETag 에 쓰는 법령 데이터 버전
+
+        Returns:
+            목업: "mock", 로컬 코퍼스: 코퍼스 버전(쓰기마다 증가), 외부 API: None (알 수 없음)
+        """
+        if LawService._use_external_api():
+            return None
+        if LawService._use_local_corpus():
+            return f"corpus-{get_law_store().corpus_version()}"
+        return "mock"
+
+    @staticmethod
+    async def _search_laws_external(keyword: str) -> List[Dict[str, Any]]:
         """법제처 Open API를 이용한 실제 법령 검색
 
         응답은 XML 이므로 최소한의 필드만 파싱해서 프론트에서 쓰는 형태로 변환합니다.
         (id, name, type, enactment_date, amendment_date, category, articles)
+
+        Raises:
+            httpx.HTTPError: API 호출 실패
+            ET.ParseError: XML 형식 오류
+            CircuitOpenError: 회로 차단 중
         """
-        params = {
-            "OC": settings.law_api_key,  # 발급받은 인증키
-            "target": "law",
-            "type": "XML",
-            "query": keyword,
-        }
-
-        try:
-            resp = httpx.get(cls.LAW_API_BASE_URL, params=params, timeout=10.0)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"법제처 API 호출 실패: {e}. 목업 데이터로 대체합니다.")
-            # 외부 API 실패 시 목업 검색으로 graceful fallback
-            return search_laws_by_keyword(keyword)
-
-        try:
-            root = ET.fromstring(resp.text)
-        except ET.ParseError as e:
-            logger.error(f"법제처 API XML 파싱 오류: {e}. 목업 데이터로 대체합니다.")
-            return search_laws_by_keyword(keyword)
+        resp = await get_law_api_client().search(keyword)
+        root = ET.fromstring(resp.text)
 
         laws: List[Dict[str, Any]] = []
 
         # DRF 응답에서 <law> 요소들을 찾아서 변환
         for law_el in root.findall("law"):
-            # 태그 이름은 공식 스펙에 따라 달라질 수 있어, 여러 후보를 순서대로 시도
-            law_id = (
-                law_el.findtext("법령ID")
-                or law_el.findtext("lawId")
-                or law_el.findtext("법령일련번호")
-                or ""
-            )
-            name = (
-                law_el.findtext("법령명한글")
-                or law_el.findtext("법령명_한글")
-                or law_el.findtext("법령명")
-                or ""
-            )
-            law_type = (
-                law_el.findtext("법령종류")
-                or law_el.findtext("법종류")
-                or law_el.findtext("법령종류코드")
-                or ""
-            )
-            # 날짜 정보는 API 스펙에 맞춰 보정 필요
-            enactment_date = (
-                law_el.findtext("시행일자")
-                or law_el.findtext("공포일자")
-                or ""
-            )
-            amendment_date = (
-                law_el.findtext("최종시행일자")
-                or law_el.findtext("개정일자")
-                or ""
-            )
-
-            laws.append(
-                {
-                    "id": law_id or name or keyword,
-                    "name": name or keyword,
-                    "type": law_type,
-                    "enactment_date": enactment_date,
-                    "amendment_date": amendment_date,
-                    "category": [],  # 외부 API에는 별도 카테고리 개념이 없으므로 비워둠
-                    "articles": [],  # 상세 조문은 별도 API를 통해 확장 가능
-                    "source": "law.go.kr",
-                }
-            )
+            law = parse_law_summary(law_el)
+            law["id"] = law["id"] or law["name"] or keyword
+            law["name"] = law["name"] or keyword
+            laws.append(law)
 
         return laws
 
-    @classmethod
-    def _get_law_external(cls, law_id: str) -> Dict[str, Any] | None:
+    @staticmethod
+    async def _get_law_external(law_id: str) -> Dict[str, Any] | None:
         """법제처 lawService.do 를 이용해 단일 법령 + 조문 목록 조회
 
-        NOTE: law.go.kr DRF 스펙에 따라 태그명이 조금씩 다를 수 있어서,
-        여러 후보 태그를 순서대로 시도하도록 구현합니다.
-        """
-        params = {
-            "OC": settings.law_api_key,
-            "target": "law",
-            "type": "XML",
-            "ID": law_id,
-        }
-
-        try:
-            resp = httpx.get(cls.LAW_DETAIL_BASE_URL, params=params, timeout=10.0)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"법제처 lawService.do 호출 실패: {e}")
-            return None
+        응답 본문을 받는 대로 증분 파싱(app.corpus.law_xml)하므로 조문이 많은 법령도
+        본문 전체나 전체 XML 트리를 메모리에 올리지 않습니다.
 
-        try:
-            root = ET.fromstring(resp.text)
-        except ET.ParseError as e:
-            logger.error(f"법제처 lawService.do XML 파싱 오류: {e}")
-            return None
+        Returns:
+            법령 데이터 또는 None (법령이 없는 경우)
+
+        Raises:
+            httpx.HTTPError: API 호출 실패
+            ET.ParseError: XML 형식 오류
+            CircuitOpenError: 회로 차단 중
+        """
+        # 파싱 오류로 중간에 멈춰도 응답 스트림(커넥션)은 바로 반환
+        async with aclosing(get_law_api_client().stream_law(law_id)) as chunks:
+            law = await aparse_law_stream(chunks, law_id)
 
-        # 최상위 law 요소 찾기
-        law_el = root.find("law")
-        if law_el is None:
-            # 일부 응답은 <Law> 대문자일 수도 있음
-            law_el = root.find("Law")
-        if law_el is None:
+        if law is None:
             logger.warning("lawService.do 응답에서 <law> 요소를 찾지 못했습니다.")
-            return None
+        return law
+
+    @staticmethod
+    def _log_upstream_error(action: str, error: Exception) -> None:
+        if isinstance(error, CircuitOpenError):
+            # 회로 차단 중에는 요청마다 로그를 남기지 않음
+            logger.debug(f"{action}: 회로 차단 중, 로컬 데이터로 대체합니다.")
+        else:
+            logger.error(f"{action} 실패: {error}. 로컬 데이터로 대체합니다.")
+
+    @staticmethod
+    def _fallback_store():
+        """외부 API 장애 시 사용할 로컬 코퍼스 (적재된 파일이 없으면 None -> 목업 데이터)"""
+        if os.path.exists(settings.law_corpus_path):
+            return get_law_store()
+        return None
+
+    @staticmethod
+    def build_search_index() -> LawIndex:
+        """
+        법령 역색인 생성 (앱 시작 시 한 번 호출)
+
+        외부 API 모드에서도 장애 시 목업 검색으로 fallback 하므로 항상 생성해 둡니다.
+
+        Returns:
+            생성된 법령 역색인
+        """
+        index = get_law_index()
+        passage_index = get_passage_index()
+        logger.info(f"법령 역색인 생성 완료: 법령 {len(index)}건, 조문 passage {len(passage_index)}건")
+        if LawService._use_local_corpus():
+            store = get_law_store()
+            logger.info(f"로컬 법령 코퍼스: {store.path} (법령 {store.count_laws()}건)")
+        LawService._get_dense_index()
+        return index
+
+    @staticmethod
+    def invalidate_laws(law_ids: List[str]) -> None:
+        """
+        법령이 바뀌었을 때 관련 캐시 무효화
+
+        상세(law_detail)는 해당 법령 키만 지우고, 검색 결과 캐시는 어떤 검색어에
+        포함됐는지 알 수 없으므로 로컬 코퍼스 검색 캐시와 질문 검색(_search_terms) 캐시 전체를 지웁니다.
+
+        Args:
+            law_ids: 바뀐 법령 ID 목록
+        """
+        if not law_ids:
+            return
+        for law_id in law_ids:
+            clear_cache(get_cache_key("law_detail", law_id))
+        clear_cache("law_search_local")
+        LawService._search_terms.cache_clear()
+        clear_cache("law_response")
+
+    @classmethod
+    def sync_corpus(cls, source: Optional[LawSource] = None, prune: bool = False) -> SyncResult:
+        """
+        로컬 코퍼스 증분 동기화 (최종시행일자가 바뀐 법령만 재적재/재색인)
 
-        # 법령 기본 정보
-        name = (
-            law_el.findtext("법령명한글")
-            or law_el.findtext("법령명_한글")
-            or law_el.findtext("법령명")
-            or ""
-        )
-        law_type = (
-            law_el.findtext("법령종류")
-            or law_el.findtext("법종류")
-            or law_el.findtext("법령종류코드")
-            or ""
-        )
-        enactment_date = (
-            law_el.findtext("시행일자")
-            or law_el.findtext("공포일자")
-            or ""
-        )
-        amendment_date = (
-            law_el.findtext("최종시행일자")
-            or law_el.findtext("개정일자")
-            or ""
-        )
-
-        # 조문 목록 파싱
-        articles: List[Dict[str, Any]] = []
-
-        # 일반적으로 lawService.do 응답에는 <조문> 리스트가 포함됨
-        for article_el in root.findall(".//조문"):
-            art_number = (
-                article_el.findtext("조문번호")
-                or article_el.findtext("조문번호_한글")
-                or ""
-            )
-            art_title = (
-                article_el.findtext("조문제목")
-                or article_el.findtext("조문명")
-                or ""
-            )
-            art_content = (
-                article_el.findtext("조문내용")
-                or article_el.findtext("조문내용_한글")
-                or ""
-            )
-
-            # 우리 앱의 타입에 맞게 변환
-            articles.append(
-                {
-                    "id": f"{law_id}-{art_number}" if art_number else f"{law_id}-article-{len(articles)+1}",
-                    "law_id": law_id,
-                    "number": art_number,
-                    "title": art_title,
-                    "content": art_content,
-                    "subparagraphs": [],
-                    "related_articles": [],
-                }
-            )
-
-        return {
-            "id": law_id,
-            "name": name or law_id,
-            "type": law_type,
-            "enactment_date": enactment_date,
-            "amendment_date": amendment_date,
-            "category": [],
-            "articles": articles,
-            "source": "law.go.kr",
-        }
+        원본은 LAW_SYNC_FIXTURE_DIR 이 설정되어 있으면 fixture 디렉터리,
+        아니면 법제처 Open API(LAW_API_KEY 필요) 입니다.
+
+        Args:
+            source: 동기화 원본 (None이면 설정에 따라 선택)
+            prune: 원본 목록에 없는 법령 삭제 여부
+
+        Returns:
+            SyncResult
+        """
+        if source is None:
+            if settings.law_sync_fixture_dir:
+                source = FixtureLawSource(settings.law_sync_fixture_dir)
+            elif settings.law_api_key.strip():
+                source = RemoteLawSource(settings.law_api_key)
+            else:
+                raise ValueError("동기화 원본이 없습니다. LAW_API_KEY 또는 LAW_SYNC_FIXTURE_DIR 을 설정하세요.")
+        return sync_corpus(get_law_store(), source, prune=prune, on_change=cls.invalidate_laws)
 
     @classmethod
-    def search_laws(cls, keyword: str) -> List[Dict[str, Any]]:
+    def _get_dense_index(cls) -> Optional[DenseIndex]:
+        """dense 색인 (설정되지 않았거나 로드 실패 시 None, sparse 검색만 사용)"""
+        if not cls._dense_index_loaded:
+            cls._dense_index_loaded = True
+            if settings.dense_index_dir:
+                try:
+                    cls._dense_index = DenseIndex.load(settings.dense_index_dir, settings.dense_probes)
+                    logger.info(
+                        f"dense 색인 로드 완료: passage {len(cls._dense_index)}건, IVF 목록 {cls._dense_index.n_lists}개 "
+                        f"(소스 {cls._dense_index.source})"
+                    )
+                    if cls._dense_index.source != cls._data_source():
+                        logger.warning(
+                            f"dense 색인 소스({cls._dense_index.source})가 현재 데이터 소스({cls._data_source()})와 "
+                            "달라서 사용하지 않습니다. 현재 소스로 색인을 다시 만드세요."
+                        )
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"dense 색인 로드 실패: {e}. sparse 검색만 사용합니다.")
+        return cls._dense_index
+
+    @classmethod
+    def _dense_hits(cls, query: str) -> List[Tuple[str, str, float]]:
+        """
+        dense top-k passage (passage ID, 법령 ID, 유사도)
+
+        색인을 만든 데이터 소스가 현재 소스와 같을 때만 사용합니다
+        (외부 API 결과에 목업/로컬 법령이 섞이지 않도록, 외부 API 모드에서는 항상 빈 목록).
+        """
+        dense_index = cls._get_dense_index()
+        if dense_index is None or dense_index.source != cls._data_source():
+            return []
+        return dense_index.search(query, settings.dense_top_k, settings.dense_min_score)
+
+    @staticmethod
+    def _fuse_laws(
+        sparse_laws: List[Dict[str, Any]],
+        dense_hits: List[Tuple[str, str, float]],
+        limit: Optional[int] = None,
+        with_articles: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        sparse 법령 순위와 dense passage 순위(법령 단위로 집계)를 RRF로 결합
+
+        dense 에만 있는 법령은 현재 데이터 소스에서만 찾습니다 - 로컬 코퍼스는 한 번에 조회하고
+        (with_articles=False 면 조문 제외), 외부 API 모드에서는 sparse 결과에 있는 법령만 남깁니다.
+        """
+        if not dense_hits:
+            return sparse_laws[:limit] if limit else sparse_laws
+
+        dense_law_ids = list(dict.fromkeys(law_id for _, law_id, _ in dense_hits))
+        fused = reciprocal_rank_fusion([[law["id"] for law in sparse_laws], dense_law_ids])
+
+        by_id = {law["id"]: law for law in sparse_laws}
+        if LawService._use_local_corpus():
+            store = get_law_store()
+            missing = [law_id for law_id, _ in fused if law_id not in by_id]
+            fetch = store.get_laws if with_articles else store.get_law_summaries
+            by_id.update((law["id"], law) for law in fetch(missing))
+        results: List[Dict[str, Any]] = []
+        for law_id, score in fused:
+            law = by_id.get(law_id)
+            if law is None and LawService._data_source() == "mock":
+                law = get_law_index().get(law_id)
+            if law is None:
+                continue
+            results.append({**law, "score": round(score, 6)})
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    @classmethod
+    async def search_laws(cls, keyword: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         키워드로 법령 검색 (캐싱 적용)
 
         - LAW_API_KEY 가 설정되어 있으면: 법제처 Open API 사용
-        - 아니면: 기존 목업 데이터 기반 검색
+        - LAW_SOURCE=local 이면: 로컬 SQLite 코퍼스 검색 (개수 제한은 SQL 에서, 조문 제외)
+        - 아니면: 목업 데이터 역색인 검색
+
+        Args:
+            keyword: 검색 키워드
+            limit: 최대 반환 개수 (None 이면 settings.law_search_max_results)
+
+        Returns:
+            법령 리스트 (최대 limit 개, 외부 API 장애로 대체한 결과는 FallbackResults)
         """
+        limit = min(limit or settings.law_search_max_results, settings.law_search_max_results)
         # 캐시 키 생성 (데이터 소스까지 포함해서 분리)
-        source = "external" if cls._use_external_api() else "mock"
-        cache_key = get_cache_key(f"law_search_{source}", keyword)
+        source = cls._data_source()
+        cache_key = get_cache_key(f"law_search_{source}", keyword, limit)
 
         # 캐시에서 가져오기
-        cached_result = get_cache(cache_key, ttl=1800)  # 30분 캐시
+        cached_result = await aget_cache(cache_key, ttl=1800)  # 30분 캐시
         if cached_result is not None:
             return cached_result
 
-        # 검색 실행
-        if cls._use_external_api():
-            results = cls._search_laws_external(keyword)
+        # 같은 키의 동시 캐시 미스는 하나의 검색으로 병합 (single-flight)
+        async def fetch() -> List[Dict[str, Any]]:
+            ttl = 1800
+            fallback = False
+            if source == "external":
+                try:
+                    results = await cls._search_laws_external(keyword)
+                except UPSTREAM_ERRORS as e:
+                    # 외부 API 장애 시 로컬 코퍼스/목업 검색으로 graceful fallback (짧게만 캐싱)
+                    cls._log_upstream_error("법제처 API 검색", e)
+                    store = cls._fallback_store()
+                    results = store.search_laws(keyword, limit) if store else search_laws_by_keyword(keyword)
+                    ttl = settings.law_not_found_ttl
+                    fallback = True
+            elif source == "local":
+                results = get_law_store().search_laws(keyword, limit)
+            else:
+                results = search_laws_by_keyword(keyword)
+
+            # dense 색인이 있으면 표현이 다른 관련 법령도 함께 반환 (RRF 결합)
+            dense_hits = cls._dense_hits(keyword)
+            if dense_hits:
+                results = cls._fuse_laws(
+                    cls.rank_search_results(results, keyword), dense_hits, limit, with_articles=False
+                )
+            elif len(results) > limit:
+                results = cls.rank_search_results(results, keyword, limit)
+            if fallback:
+                results = FallbackResults(results)
+
+            # 결과 캐싱
+            await aset_cache(cache_key, results, ttl=ttl)
+            return results
+
+        return await _search_flight.do(cache_key, fetch)
+    
+    @classmethod
+    async def search_relevant_laws(cls, question: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        자연어 질문으로 관련 법령 검색 (질문 분해 + OR 검색 + BM25F, 캐싱 적용)
+
+        질문 전체를 하나의 키워드로 쓰면 거의 일치하지 않으므로,
+        검색어로 분해한 뒤 하나라도 포함하는 법령을 관련도 순으로 반환합니다.
+        캐시 키는 정규화된 검색어 집합이라 표현만 다른 질문도 결과를 공유합니다.
+
+        Args:
+            question: 사용자 질문
+            limit: 최대 반환 개수
+
+        Returns:
+            점수(score)가 포함된 관련 법령 리스트
+        """
+        terms = analyze_query(question)
+        if not terms:
+            return []
+        return await cls._search_terms(cls._data_source(), tuple(sorted(terms)), limit)
+
+    @staticmethod
+    @memoize(ttl=1800, prefix="law_query")  # 30분 캐시, 같은 검색어 동시 요청은 한 번만 검색
+    async def _search_terms(source: str, terms: Tuple[str, ...], limit: int) -> List[Dict[str, Any]]:
+        """
+        검색어 집합으로 관련 법령 검색 (search_relevant_laws 참고)
+
+        결과가 인자로만 정해지도록 dense 검색도 질문 원문 대신 검색어로 합니다.
+        """
+        if source == "external":
+            # 외부 API는 검색어별로 동시에 조회(각각 캐싱됨)한 뒤 합쳐서 한 번에 정렬
+            merged: Dict[str, Dict[str, Any]] = {}
+            for term_results in await asyncio.gather(*(LawService.search_laws(term) for term in terms)):
+                for law in term_results:
+                    merged.setdefault(law["id"], law)
+            results = LawService.rank_search_results(list(merged.values()), " ".join(terms), limit)
+        elif source == "local":
+            results = get_law_store().search_any(list(terms), limit)
         else:
-            results = search_laws_by_keyword(keyword)
+            results = [
+                {**law, "score": round(score, 4)}
+                for law, score in get_law_index().search_any(list(terms), limit)
+            ]
 
-        # 결과 캐싱
-        set_cache(cache_key, results, ttl=1800)
+        return LawService._fuse_laws(results, LawService._dense_hits(" ".join(terms)), limit)
+
+    @classmethod
+    async def retrieve(cls, question: str, limit: int = 5) -> RetrievalResult:
+        """
+        질문 관련 법령과 조문/항/호/목 passage 를 한 번에 검색
+
+        Args:
+            question: 사용자 질문
+            limit: 최대 관련 법령 수
+
+        Returns:
+            RetrievalResult
+        """
+        laws = await cls.search_relevant_laws(question, limit)
+        passages = cls.search_relevant_passages(question, laws)
+        return RetrievalResult(question, laws, passages)
 
-        return results
-    
     @staticmethod
-    def get_law(law_id: str) -> Dict[str, Any] | None:
+    async def get_law(law_id: str) -> Dict[str, Any] | None:
         """
         법령 ID로 법령 조회 (캐싱 적용)
 
         - LAW_API_KEY 가 설정되어 있으면: 법제처 lawService.do 로 상세 + 조문까지 조회
+        - LAW_SOURCE=local 이면: 로컬 SQLite 코퍼스에서 조회
         - 아니면: 기존 목업 데이터에서 조회
         
         Args:
             law_id: 법령 ID
         
         Returns:
-            법령 데이터 또는 None
+            법령 데이터 또는 None (외부 API 장애로 대체한 법령은 FallbackLaw)
         """
         # 캐시 키 생성
         cache_key = get_cache_key("law_detail", law_id)
         
-        # 캐시에서 가져오기
-        cached_result = get_cache(cache_key, ttl=3600)  # 1시간 캐시
-        if cached_result is not None:
-            return cached_result
-        
-        # 조회 실행
-        if LawService._use_external_api():
-            law = LawService._get_law_external(law_id)
-        else:
-            law = get_law_by_id(law_id)
-
-        # 결과 캐싱 (None이 아닌 경우만)
-        if law is not None:
-            set_cache(cache_key, law, ttl=3600)
-
-        return law
+        # 원본 조회 (없는 법령도 짧게 캐싱해서 반복 조회를 막음)
+        async def fetch() -> Dict[str, Any] | None:
+            if LawService._use_external_api():
+                try:
+                    law = await LawService._get_law_external(law_id)
+                except UPSTREAM_ERRORS as e:
+                    # 외부 API 장애 시 로컬 코퍼스/목업 데이터로 대체 (장애 결과는 캐싱하지 않음)
+                    LawService._log_upstream_error("법제처 lawService.do 조회", e)
+                    store = LawService._fallback_store()
+                    law = store.get_law(law_id) if store else get_law_by_id(law_id)
+                    return None if law is None else FallbackLaw(law)
+            elif LawService._use_local_corpus():
+                law = get_law_store().get_law(law_id)
+            else:
+                law = get_law_by_id(law_id)
+
+            # 결과 캐싱 (없는 법령은 짧은 TTL로 negative 캐싱)
+            if law is None:
+                await aset_cache(cache_key, LAW_NOT_FOUND, ttl=settings.law_not_found_ttl)
+            else:
+                await aset_cache(cache_key, law, ttl=3600)  # 1시간 캐시
+            return law
+
+        # 1시간이 지나도 캐시된 법령을 바로 반환하고 백그라운드에서 갱신 (stale-while-revalidate),
+        # 같은 법령의 동시 캐시 미스는 하나의 조회로 병합 (single-flight)
+        law = await get_or_revalidate(cache_key, _detail_flight, fetch)
+        return None if law == LAW_NOT_FOUND else law
     
     @staticmethod
     def get_all_laws() -> List[Dict[str, Any]]:
         """
         모든 법령 조회
         
+        로컬 코퍼스는 법령 수가 많으므로 조문을 제외한 기본 정보만 반환합니다.
+        
         Returns:
             모든 법령 리스트
         """
+        if LawService._use_local_corpus():
+            return get_law_store().list_laws()
         return get_all_laws()
     
-    @staticmethod
-    def get_article(article_id: str) -> Dict[str, Any] | None:
+    @classmethod
+    async def get_article(cls, article_id: str, law_id: Optional[str] = None) -> Dict[str, Any] | None:
         """
         조문 ID로 조문 조회
-        
+
+        목업 조문은 passage 색인의 해시맵으로 바로 찾고, 외부 API 법령은
+        (캐싱된) get_law(law_id) 결과의 조문 중에서 찾습니다.
+
         Args:
             article_id: 조문 ID
-        
+            law_id: 법령 ID (지정하면 해당 법령 소속 조문만 반환)
+
         Returns:
             조문 데이터 또는 None
         """
-        # 외부 API를 쓰는 경우, 조문 단독 조회보다는 get_law(law_id) 결과의 articles 중에서
-        # 필터링해서 사용하는 것을 권장하지만,
-        # 여기서는 기존 목업용 조문 조회만 그대로 유지합니다.
-        return get_article_by_id(article_id)
-    
+        if cls._use_local_corpus():
+            return get_law_store().get_article(article_id, law_id)
+
+        article = get_article_by_id(article_id, law_id)
+        if article is not None or law_id is None or not cls._use_external_api():
+            return article
+
+        law = await cls.get_law(law_id)
+        if law is None:
+            return None
+        return next((a for a in law.get("articles", []) if a.get("id") == article_id), None)
+
+    @classmethod
+    def search_relevant_passages(
+        cls,
+        question: str,
+        laws: List[Dict[str, Any]],
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        질문과 관련된 조문/항/호/목 passage 검색 (BM25F)
+
+        Args:
+            question: 사용자 질문
+            laws: 검색 대상 법령 (search_relevant_laws() 결과 등)
+            limit: 최대 반환 개수
+
+        Returns:
+            점수(score)가 포함된 passage 리스트 (점수 내림차순)
+        """
+        terms = analyze_query(question)
+        if not terms or not laws:
+            return []
+
+        law_ids = [law["id"] for law in laws]
+        if cls._use_local_corpus():
+            store = get_law_store()
+            passages = store.search_passages(terms, law_ids, limit)
+            lookup_passage = store.get_passage
+        else:
+            index = get_passage_index()
+            if any(get_law_index().get(law_id) is None for law_id in law_ids):
+                # 색인에 없는 법령(외부 API 상세 조회 결과 등)은 임시 passage 색인으로 검색
+                index = PassageIndex(laws)
+            passages = [
+                {**passage, "score": round(score, 4)}
+                for passage, score in index.search_any(terms, limit, law_ids)
+            ]
+            lookup_passage = index.get_passage
+
+        # dense passage 결과를 RRF로 결합 (같은 법령 범위 안에서만)
+        allowed = set(law_ids)
+        dense_ids = [pid for pid, law_id, _ in cls._dense_hits(question) if law_id in allowed]
+        if not dense_ids:
+            return passages
+
+        by_id = {passage["id"]: passage for passage in passages}
+        fused_passages: List[Dict[str, Any]] = []
+        for passage_id, score in reciprocal_rank_fusion([list(by_id), dense_ids]):
+            passage = by_id.get(passage_id) or lookup_passage(passage_id)
+            if passage is None:
+                continue
+            fused_passages.append({**passage, "score": round(score, 6)})
+            if len(fused_passages) >= limit:
+                break
+        return fused_passages
+
     @staticmethod
     def rank_search_results(
         results: List[Dict[str, Any]],
-        keyword: str
+        keyword: str,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        검색 결과를 관련도 순으로 정렬
-        
+        검색 결과를 BM25F 관련도 순으로 정렬
+
+        목업 법령은 앱 시작 시 만든 역색인의 통계를 그대로 사용하고,
+        색인에 없는 결과(외부 API 검색 결과 등)는 결과 목록만으로 임시 색인을 만들어 점수를 계산합니다.
+
         Args:
             results: 검색 결과 리스트
             keyword: 검색 키워드
-        
+            limit: 상위 몇 개만 선택할지 (None이면 전체)
+
         Returns:
-            정렬된 검색 결과 리스트
+            점수(score)가 포함된 정렬된 검색 결과 리스트
         """
-        keyword_lower = keyword.lower()
-        
-        def calculate_score(law: Dict[str, Any]) -> int:
-            """법령의 관련도 점수 계산"""
-            score = 0
-            
-            # 법령명에 키워드가 포함되면 높은 점수
-            if keyword_lower in law["name"].lower():
-                score += 10
-            
-            # 카테고리에 키워드가 포함되면 점수 추가
-            for cat in law.get("category", []):
-                if keyword_lower in cat.lower():
-                    score += 5
-                    break
-            
-            # 조문 내용에 키워드가 포함되면 점수 추가
-            for article in law.get("articles", []):
-                if keyword_lower in article.get("content", "").lower():
-                    score += 2
+        if not results:
+            return []
+
+        # 이미 점수가 계산된 결과(로컬 코퍼스 FTS5 bm25, dense 결합)는 그 점수를 그대로 사용
+        if all("score" in law for law in results):
+            if limit is None:
+                return sorted(results, key=lambda law: -law["score"])
+            return heapq.nlargest(limit, results, key=lambda law: law["score"])
+
+        index = get_law_index()
+        if any(law.get("id") not in index for law in results):
+            index = LawIndex()
+            for law in results:
+                if law.get("id") not in index:
+                    index.add_law(law)
+
+        ranked = index.rank(keyword, (law["id"] for law in results), limit)
+        ranked_ids = {law["id"] for law, _ in ranked}
+
+        # 원본(공유) 데이터를 수정하지 않도록 얕은 복사본에 점수를 추가
+        ranked_results = [{**law, "score": round(score, 4)} for law, score in ranked]
+
+        # 점수가 0인 결과는 원래 순서대로 뒤에 붙임
+        if limit is None or len(ranked_results) < limit:
+            for law in results:
+                if law["id"] in ranked_ids:
+                    continue
+                ranked_results.append({**law, "score": 0.0})
+                ranked_ids.add(law["id"])
+                if limit is not None and len(ranked_results) >= limit:
                     break
-            
-            return score
-        
-        # 점수 순으로 정렬
-        sorted_results = sorted(
-            results,
-            key=calculate_score,
-            reverse=True
-        )
-        
-        return sorted_results
 
+        return ranked_results
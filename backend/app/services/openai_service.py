@@ -1,15 +1,73 @@
 """OpenAI API 연동 서비스"""
-from typing import List, Optional, Dict, Any
-from openai import OpenAI
+from typing import AsyncIterator, List, NamedTuple, Optional, Dict, Any
+import logging
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from app.core.concurrency import ConcurrencyLimiter
+from app.core.config import settings
+from app.core.metrics import TOKEN_BUCKETS, get_histogram
 from app.core.security import get_openai_api_key
-from app.services.law_service import LawService
+from app.core.tokens import count_message_tokens, token_counts_exact, truncate_to_tokens
+from app.mock.qa_scenarios import MOCK_QA_SCENARIOS
+from app.services.answer_cache import AnswerCache, is_first_turn
+from app.services.context_packer import PackedContext, pack_law_context
+from app.services.conversation_summary import build_history_messages
+from app.services.law_service import LawService, RetrievalResult
+from app.services.semantic_cache import SemanticAnswerCache
+
+logger = logging.getLogger(__name__)
+
+# 요청별 프롬프트 입력 토큰 수 분포 (/api/admin/metrics)
+_prompt_tokens_histogram = get_histogram("prompt_tokens", TOKEN_BUCKETS)
+
+
+class PreparedQuestion(NamedTuple):
+    """OpenAI 호출 준비 결과"""
+
+    question: str
+    messages: List[dict]
+    # 프롬프트에 사용한 검색 결과 (관련 법령/passage/점수)
+    retrieval: RetrievalResult
+    # 답변 캐시 키 (첫 질문이 아니거나 캐시를 끈 경우 None)
+    cache_key: Optional[str]
+    # 대화 맥락이 없는 첫 질문인지 (답변 캐시 대상)
+    first_turn: bool
+    # OpenAI 요청 입력 토큰 수 (메시지 형식 토큰 포함)
+    prompt_tokens: int
 
 
 class OpenAIService:
     """OpenAI API 서비스"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=get_openai_api_key())
+        # 프로세스당 하나의 AsyncOpenAI (keep-alive 커넥션 풀 공유, 이벤트 루프를 막지 않음)
+        self.client = AsyncOpenAI(
+            api_key=get_openai_api_key(),
+            timeout=settings.openai_timeout,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=settings.openai_max_connections,
+                ),
+            ),
+        )
+        # 동시 호출 제한 - 대기열이 차면 타임아웃까지 쌓지 않고 바로 503 + Retry-After
+        self.limiter = ConcurrencyLimiter(
+            "openai",
+            max_concurrency=settings.openai_max_concurrency,
+            max_queue=settings.openai_max_queue,
+            queue_timeout=settings.openai_queue_timeout,
+            retry_after=settings.openai_retry_after,
+        )
+        self.answer_cache = AnswerCache(ttl=settings.answer_cache_ttl)
+        # 표현만 다른 질문용 의미 캐시 (워커 메모리)
+        self.semantic_cache: Optional[SemanticAnswerCache] = None
+        if settings.semantic_cache_enabled:
+            self.semantic_cache = SemanticAnswerCache(
+                threshold=settings.semantic_cache_threshold,
+                max_entries=settings.semantic_cache_max_entries,
+                ttl=settings.answer_cache_ttl,
+            )
         # 최신 OpenAI 모델 (사용 가능 여부는 계정/시점에 따라 다를 수 있음)
         self.model = "gpt-5.1-2025-11-13"
     
@@ -69,46 +127,68 @@ class OpenAIService:
         # 리스트로 변환
         return list(groups.values())
     
-    def create_law_prompt(self, question: str, laws: List[dict]) -> str:
+    def create_law_prompt(
+        self,
+        question: str,
+        laws: List[dict],
+        passages: Optional[List[dict]] = None,
+    ) -> str:
         """
         법령 컨텍스트를 포함한 프롬프트 생성
         
         Args:
             question: 사용자 질문
             laws: 관련 법령 데이터 리스트
+            passages: 질문과 관련된 조문/항/호/목 passage (점수 순, 선택)
         
         Returns:
             프롬프트 문자열
         """
-        # 법률 + 시행령 + 시행규칙 + 조례를 세트로 구성
-        law_sets = self._build_law_sets(laws)
-
-        law_context = ""
+        return self.format_prompt(question, self.build_law_context(laws, passages))
+    
+    def build_law_context(
+        self,
+        laws: List[dict],
+        passages: Optional[List[dict]] = None,
+    ) -> str:
+        """
+        프롬프트의 [법령 컨텍스트] 부분 생성
         
-        for law_set in law_sets[:5]:  # 최대 5개 세트만 사용
-            main = law_set.get("main")
-            children = law_set.get("children", [])
-            if not main:
-                continue
-
-            law_context += f"\n\n## {law_set['base_name']} (기본법: {main.get('name', '')} / {main.get('type', '')})\n"
-            law_context += f"최신 개정일: {main.get('amendment_date', 'N/A')}\n"
-
-            # 기본법 조문
-            for article in main.get("articles", [])[:3]:  # 각 법령의 최대 3개 조문
-                law_context += f"\n### {article.get('number', '')} {article.get('title', '')}\n"
-                law_context += f"{article.get('content', '')}\n"
-                
-                # 항/호/목이 있으면 추가
-                for subp in article.get("subparagraphs", [])[:2]:
-                    law_context += f"\n{subp.get('type', '')} {subp.get('number', '')}. {subp.get('content', '')}\n"
-
-            # 관련 시행령/시행규칙/조례 요약
-            if children:
-                law_context += "\n[관련 하위 법령]\n"
-                for child in children[:3]:  # 최대 3개만 노출
-                    law_context += f"- {child.get('name', '')} ({child.get('type', '')})\n"
+        Args:
+            laws: 관련 법령 데이터 리스트
+            passages: 질문과 관련된 조문/항/호/목 passage (점수 순, 선택)
         
+        Returns:
+            법령 컨텍스트 문자열
+        """
+        return self.pack_law_context(laws, passages).text
+    
+    def pack_law_context(
+        self,
+        laws: List[dict],
+        passages: Optional[List[dict]] = None,
+        budget: Optional[int] = None,
+    ) -> PackedContext:
+        """
+        토큰 예산 안에서 관련도 순으로 법령 컨텍스트 구성
+        
+        Args:
+            laws: 관련 법령 데이터 리스트 (관련도 순)
+            passages: 질문과 관련된 조문/항/호/목 passage (점수 순, 선택)
+            budget: 컨텍스트 토큰 예산 (None 이면 settings.prompt_context_token_budget)
+        
+        Returns:
+            PackedContext (컨텍스트 문자열, 토큰 수, 포함/제외 블록 수)
+        """
+        # 법률 + 시행령 + 시행규칙 + 조례를 세트로 구성
+        law_sets = self._build_law_sets(laws)
+        if budget is None:
+            budget = settings.prompt_context_token_budget
+        return pack_law_context(law_sets, passages, budget)
+    
+    @staticmethod
+    def format_prompt(question: str, law_context: str) -> str:
+        """법령 컨텍스트와 질문으로 프롬프트 완성"""
         prompt = f"""당신은 법령 전문가 AI 비서입니다. 다음 법령 정보를 바탕으로 사용자의 질문에 정확하게 답변해주세요.
 
 [법령 컨텍스트]
@@ -128,26 +208,31 @@ class OpenAIService:
         
         return prompt
     
-    def ask_question(
+    async def _prepare(
         self,
         question: str,
-        conversation_history: Optional[List[dict]] = None
-    ) -> str:
-        """
-        사용자 질문에 대한 답변 생성
+        conversation_history: Optional[List[dict]] = None,
+        conversation_summary: Optional[str] = None,
+        retrieval: Optional[RetrievalResult] = None
+    ) -> PreparedQuestion:
+        """관련 법령/조문 검색(호출자가 이미 검색했으면 재사용) 후 OpenAI 요청 메시지와 답변 캐시 키 구성"""
+        if retrieval is None:
+            # 관련 법령 + 조문(조/항/호/목) 검색 (질문을 검색어로 분해해서 OR 검색, 실제 API + 목업 fallback)
+            retrieval = await LawService.retrieve(question)
         
-        Args:
-            question: 사용자 질문
-            conversation_history: 대화 히스토리 (선택)
+        # 프롬프트 생성 (토큰 예산 안에서 관련도 순으로 조문 선택)
+        packed = self.pack_law_context(retrieval.laws, retrieval.passages)
+        law_context = packed.text
+        prompt = self.format_prompt(question, law_context)
         
-        Returns:
-            GPT 응답 텍스트
-        """
-        # 관련 법령 검색 (실제 API + 목업 fallback)
-        related_laws = LawService.search_laws(question)
-        
-        # 프롬프트 생성
-        prompt = self.create_law_prompt(question, related_laws)
+        # 답변 캐시는 대화 맥락이 없는 첫 질문에만 사용
+        first_turn = is_first_turn(question, conversation_history) and not conversation_summary
+        cache_key = None
+        if settings.answer_cache_enabled:
+            if first_turn:
+                cache_key = self.answer_cache.key(question, law_context, self.model)
+            else:
+                self.answer_cache.skip()
         
         # 대화 히스토리 구성
         messages = []
@@ -158,13 +243,16 @@ class OpenAIService:
             "content": "당신은 법령 전문가 AI 비서입니다. 제공된 법령 정보를 바탕으로 정확하고 명확한 답변을 제공합니다."
         })
         
-        # 대화 히스토리 추가 (최근 5개만)
-        if conversation_history:
-            for msg in conversation_history[-5:]:
-                messages.append({
-                    "role": msg.get("role", "user"),
-                    "content": msg.get("content", "")
-                })
+        # 대화 히스토리 추가 (누적 요약 + 최근 대화, 토큰 예산 안에서)
+        history = list(conversation_history or [])
+        if history and history[-1].get("role") == "user" and history[-1].get("content") == question:
+            # 방금 저장한 현재 질문은 아래 프롬프트에 들어가므로 제외
+            history.pop()
+        messages.extend(build_history_messages(
+            conversation_summary,
+            history,
+            settings.conversation_history_token_budget,
+        ))
         
         # 현재 질문
         messages.append({
@@ -172,54 +260,250 @@ class OpenAIService:
             "content": prompt
         })
         
-        try:
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2000
+        prompt_tokens = count_message_tokens(messages)
+        _prompt_tokens_histogram.observe(prompt_tokens)
+        logger.info(
+            "프롬프트 %d 토큰%s (법령 컨텍스트 %d/%d, 조문 %d개, 예산 초과 제외 %d, 중복 제외 %d)",
+            prompt_tokens, "" if token_counts_exact() else "(근사치)",
+            packed.tokens, packed.budget, packed.articles, packed.dropped, packed.duplicates,
+        )
+        return PreparedQuestion(question, messages, retrieval, cache_key, first_turn, prompt_tokens)
+    
+    async def _cached_answer(self, prepared: PreparedQuestion) -> Optional[str]:
+        """정확 일치 답변 캐시 -> 의미 캐시 순서로 이전 답변 조회"""
+        if prepared.cache_key is not None:
+            cached_answer = await self.answer_cache.get(prepared.cache_key, prepared.retrieval.laws)
+            if cached_answer is not None:
+                return cached_answer
+        if prepared.first_turn and self.semantic_cache is not None:
+            match = self.semantic_cache.lookup(prepared.question, prepared.retrieval.laws, self.model)
+            if match is not None:
+                return match.answer
+        return None
+    
+    async def _cache_answer(self, prepared: PreparedQuestion, answer: str, canonical: bool = False) -> None:
+        """첫 질문 답변을 인용 법령 버전과 함께 캐싱 (canonical: 의미 캐시 기준 항목으로 등록)"""
+        if not answer:
+            return
+        if prepared.cache_key is not None:
+            cited = [ref["law_id"] for ref in self.extract_law_references(answer, prepared.retrieval)]
+            await self.answer_cache.put(prepared.cache_key, answer, cited, prepared.retrieval.laws)
+        if prepared.first_turn and self.semantic_cache is not None:
+            self.semantic_cache.put(
+                prepared.question, answer, prepared.retrieval.laws, self.model, canonical=canonical
             )
+    
+    async def seed_semantic_cache(self) -> int:
+        """
+        MOCK_QA_SCENARIOS 질문의 실제 답변을 의미 캐시 기준 항목으로 등록
+        
+        질문마다 평소와 같은 프롬프트로 답변을 생성하고 (정확 일치 캐시에 있으면 재사용),
+        현재 모델/검색 법령 집합과 함께 만료 없이 저장합니다.
+        
+        Returns:
+            등록한 질문 수
+        """
+        if self.semantic_cache is None:
+            return 0
+        count = 0
+        for scenario in MOCK_QA_SCENARIOS:
+            question = scenario.get("question")
+            if not question:
+                continue
+            try:
+                prepared = await self._prepare(question)
+                answer = None
+                if prepared.cache_key is not None:
+                    answer = await self.answer_cache.get(prepared.cache_key, prepared.retrieval.laws)
+                if answer is None:
+                    answer = await self._complete(prepared)
+            except Exception as e:
+                logger.warning("의미 캐시 시드 실패 (%s): %s", question, e)
+                continue
+            await self._cache_answer(prepared, answer, canonical=True)
+            count += 1
+        logger.info("의미 캐시 시드 %d건 등록", count)
+        return count
+    
+    async def _complete(self, prepared: PreparedQuestion) -> str:
+        """OpenAI 로 답변 한 번 생성 (동시 호출 제한 적용)"""
+        async with self.limiter.slot():
+            try:
+                # OpenAI API 호출
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=prepared.messages,
+                    temperature=0.7,
+                    max_tokens=2000
+                )
+                
+                return response.choices[0].message.content.strip()
+            
+            except Exception as e:
+                raise Exception(f"OpenAI API 호출 실패: {str(e)}")
+    
+    async def ask_question(
+        self,
+        question: str,
+        conversation_history: Optional[List[dict]] = None,
+        conversation_summary: Optional[str] = None,
+        retrieval: Optional[RetrievalResult] = None
+    ) -> str:
+        """
+        사용자 질문에 대한 답변 생성
+        
+        Args:
+            question: 사용자 질문
+            conversation_history: 대화 히스토리 (선택)
+            conversation_summary: 최근 대화 이전의 누적 요약 (선택)
+            retrieval: 이 질문의 검색 결과 (선택, 없으면 직접 검색 - 출처 추출에도 같은 결과를 쓰려면 전달)
+        
+        Returns:
+            GPT 응답 텍스트
+        
+        Raises:
+            ServiceOverloadedError: 동시 호출 대기열이 가득 참
+        """
+        prepared = await self._prepare(question, conversation_history, conversation_summary, retrieval)
+        cached_answer = await self._cached_answer(prepared)
+        if cached_answer is not None:
+            return cached_answer
+        
+        answer = await self._complete(prepared)
+        await self._cache_answer(prepared, answer)
+        return answer
+    
+    async def stream_answer(
+        self,
+        question: str,
+        conversation_history: Optional[List[dict]] = None,
+        conversation_summary: Optional[str] = None,
+        retrieval: Optional[RetrievalResult] = None
+    ) -> AsyncIterator[str]:
+        """
+        사용자 질문에 대한 답변을 토큰(조각) 단위로 생성
+        
+        Args:
+            question: 사용자 질문
+            conversation_history: 대화 히스토리 (선택)
+            conversation_summary: 최근 대화 이전의 누적 요약 (선택)
+            retrieval: 이 질문의 검색 결과 (선택, 없으면 직접 검색 - 출처 추출에도 같은 결과를 쓰려면 전달)
+        
+        Yields:
+            응답 텍스트 조각 (도착하는 대로)
+        
+        Raises:
+            ServiceOverloadedError: 동시 호출 대기열이 가득 참
+        """
+        prepared = await self._prepare(question, conversation_history, conversation_summary, retrieval)
+        cached_answer = await self._cached_answer(prepared)
+        if cached_answer is not None:
+            yield cached_answer
+            return
+        
+        chunks: List[str] = []
+        # 스트림이 끝날 때까지 슬롯을 잡고 있음
+        async with self.limiter.slot():
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=prepared.messages,
+                    temperature=0.7,
+                    max_tokens=2000,
+                    stream=True
+                )
+            except Exception as e:
+                raise Exception(f"OpenAI API 호출 실패: {str(e)}")
             
-            return response.choices[0].message.content.strip()
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+                        yield chunk.choices[0].delta.content
+            finally:
+                # 클라이언트 연결 종료 등으로 중간에 끝나면 OpenAI 응답도 닫음
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    await close()
         
-        except Exception as e:
-            raise Exception(f"OpenAI API 호출 실패: {str(e)}")
+        # 끝까지 받은 답변만 캐싱
+        await self._cache_answer(prepared, "".join(chunks).strip())
     
-    def extract_law_references(self, response_text: str, laws: List[dict]) -> List[dict]:
+    async def summarize_conversation(self, previous_summary: str, messages: List[dict]) -> str:
+        """
+        이전 요약과 새 대화 메시지를 합쳐 누적 요약 생성
+        
+        Args:
+            previous_summary: 이전 누적 요약 (없으면 빈 문자열)
+            messages: 새로 요약에 반영할 메시지 (오래된 순)
+        
+        Returns:
+            conversation_summary_max_tokens 이하의 새 요약
+        
+        Raises:
+            ServiceOverloadedError: 동시 호출 대기열이 가득 참
+        """
+        max_tokens = settings.conversation_summary_max_tokens
+        transcript = "\n".join(
+            f"{'사용자' if msg.get('role') == 'user' else 'AI'}: {truncate_to_tokens(msg.get('content', ''), 1000)}"
+            for msg in messages
+        )
+        prompt = "".join([
+            "다음은 법령 상담 대화입니다. 이전 요약과 새 대화를 합쳐 이후 질문에 답할 때 필요한 내용만 한국어로 요약해주세요.\n",
+            "사용자의 상황(지역, 사업 종류 등), 질문 요지, 언급된 법령과 조문, 안내한 결론을 남기고 ",
+            f"{max_tokens}토큰 이내로 작성해주세요.\n\n",
+            f"[이전 요약]\n{previous_summary or '(없음)'}\n\n",
+            f"[새 대화]\n{transcript}\n\n요약:",
+        ])
+        async with self.limiter.slot():
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.2,
+                max_tokens=max_tokens
+            )
+        return truncate_to_tokens((response.choices[0].message.content or "").strip(), max_tokens)
+    
+    def extract_law_references(self, response_text: str, retrieval: RetrievalResult) -> List[dict]:
         """
         응답 텍스트에서 법령 출처 추출
         
+        프롬프트를 만든 것과 같은 검색 결과에서만 찾으므로 출처가 컨텍스트와 어긋나지 않습니다.
+        
         Args:
             response_text: GPT 응답 텍스트
-            laws: 관련 법령 리스트
+            retrieval: 프롬프트에 사용한 검색 결과
         
         Returns:
-            법령 출처 리스트
+            법령 출처 리스트 (관련도 순)
         """
         references = []
         
+        # 법령별로 검색된 passage 의 조문 번호를 먼저 확인
+        passage_articles: Dict[str, List[str]] = {}
+        for passage in retrieval.passages:
+            numbers = passage_articles.setdefault(passage["law_id"], [])
+            if passage.get("article_number") and passage["article_number"] not in numbers:
+                numbers.append(passage["article_number"])
+        
         # 법령명으로 출처 찾기
-        for law in laws:
-            if law["name"] in response_text:
-                # 조문 번호 찾기 (예: "제11조", "제1조" 등)
-                for article in law.get("articles", []):
-                    article_number = article.get("number", "")
-                    if article_number in response_text:
-                        references.append({
-                            "law_id": law["id"],
-                            "title": law["name"],
-                            "article": article_number
-                        })
-                        break
-                
-                # 조문을 찾지 못했으면 법령만 추가
-                if not any(ref["law_id"] == law["id"] for ref in references):
-                    references.append({
-                        "law_id": law["id"],
-                        "title": law["name"],
-                        "article": None
-                    })
+        for law in retrieval.laws:
+            if law["name"] not in response_text:
+                continue
+            # 조문 번호 찾기 (예: "제11조", "제1조" 등)
+            article_numbers = passage_articles.get(law["id"], []) + [
+                article.get("number", "") for article in law.get("articles", [])
+            ]
+            article_number = next(
+                (number for number in article_numbers if number and number in response_text),
+                None,
+            )
+            # 조문을 찾지 못했으면 법령만 추가
+            references.append({
+                "law_id": law["id"],
+                "title": law["name"],
+                "article": article_number
+            })
         
         return references[:5]  # 최대 5개만 반환
 
@@ -235,3 +519,11 @@ def get_openai_service() -> OpenAIService:
         _openai_service = OpenAIService()
     return _openai_service
 
+
+async def close_openai_service() -> None:
+    """OpenAI 커넥션 풀 정리 (앱 종료 시)"""
+    global _openai_service
+    if _openai_service is not None:
+        await _openai_service.client.close()
+        _openai_service = None
+
@@ -0,0 +1,288 @@
+"""의미 기반 답변 캐시 (표현만 다른 같은 질문이면 이전 답변 재사용)"""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import re
+import time
+import zlib
+
+import numpy as np
+
+from app.corpus.law_xml import law_version
+from app.search.query import analyze_query
+from app.search.text import char_ngrams
+
+# 질문 벡터 차원 (문자 n-gram 해싱)
+QUESTION_VECTOR_DIM = 1024
+_NGRAM_SIZES = (2, 3)
+_MAX_QUESTION_TERMS = 32
+
+# 질문 비교에서 빼는 요청 표현 (검색 불용어에 없는 것)
+_FILLER_TERMS = frozenset({
+    "알려줘", "알려줄래", "알려주십시오", "궁금합니다", "궁금해요", "궁금해",
+    "설명해줘", "설명해주세요", "뭔가요", "무엇인가요", "뭐야",
+})
+_ARTICLE_PREFIX = re.compile(r"^제(?=\d)")
+_ARTICLE_TERM = re.compile(r"^\d+(?:조|항|호)(?:의\d+)?$")
+_LAW_NAME_SUFFIXES = ("법", "령", "규칙", "조례")
+# 법령명처럼 끝나지만 법령명이 아닌 검색어
+_NOT_LAW_NAMES = frozenset({"방법", "불법", "위법", "적법", "합법", "편법", "입법", "법령"})
+# 한 단어로 답이 달라지는 처분/사항 어간 ("허가 절차" / "허가 취소 절차" / "허가 요건")
+_KEY_STEMS = (
+    "허가", "인가", "승인", "신고", "등록", "취소", "철회", "변경", "폐지", "정지", "연장", "갱신",
+    "승계", "양도", "면제", "예외", "해제", "절차", "요건", "기준", "기간", "서류", "비용", "수수료",
+    "대상", "자격", "처벌", "벌칙", "벌금", "과태료", "과징금", "보상",
+)
+
+
+def question_terms(question: str) -> Tuple[str, ...]:
+    """
+    질문 비교용 검색어 (등장 순서 유지)
+
+    조사를 떼어낸 검색어에서 "알려줘" 같은 요청 표현을 빼고, "제11조" 는 "11조" 로 맞춥니다.
+    """
+    terms: List[str] = []
+    for term in analyze_query(question, _MAX_QUESTION_TERMS):
+        term = _ARTICLE_PREFIX.sub("", term)
+        if term not in _FILLER_TERMS and term not in terms:
+            terms.append(term)
+    return tuple(terms)
+
+
+def key_terms(terms: Sequence[str]) -> frozenset:
+    """
+    답을 바꾸는 핵심 검색어 집합
+
+    법령명("건축법", "시행령"), 조문 번호("11조"), 그리고 검색어 안에 들어 있는 처분/사항 어간
+    ("건축허가" → "허가", "취소하는" → "취소") 입니다. 나머지 검색어("받는", "신청" 등)는
+    질문 벡터 유사도로만 비교합니다.
+    """
+    keys = set()
+    for term in terms:
+        if _ARTICLE_TERM.match(term) or (term.endswith(_LAW_NAME_SUFFIXES) and term not in _NOT_LAW_NAMES):
+            keys.add(term)
+        keys.update(stem for stem in _KEY_STEMS if stem in term)
+    return frozenset(keys)
+
+
+def embed_question(question: str, dim: int = QUESTION_VECTOR_DIM) -> np.ndarray:
+    """
+    질문을 해싱 벡터로 변환 (외부 모델 없이 CPU 에서 계산)
+
+    question_terms() 검색어와 검색어의 문자 2/3-gram 을 해싱해서 센 뒤
+    log(1 + tf) 로 완만하게 만들고 L2 정규화합니다. 내적이 곧 코사인 유사도입니다.
+
+    Args:
+        question: 사용자 질문
+        dim: 벡터 차원
+
+    Returns:
+        (dim,) float32 벡터 (검색어가 없으면 0 벡터)
+    """
+    terms = question_terms(question)
+    text = " ".join(terms)
+    features = list(terms)
+    for n in _NGRAM_SIZES:
+        features.extend(char_ngrams(text, n))
+
+    vector = np.zeros(dim, dtype=np.float32)
+    if not features:
+        return vector
+    indices = [zlib.crc32(feature.encode("utf-8")) % dim for feature in features]
+    np.add.at(vector, indices, 1.0)
+    np.log1p(vector, out=vector)
+    vector /= np.linalg.norm(vector)
+    return vector
+
+
+def law_set_of(laws: Iterable[Dict[str, Any]]) -> frozenset:
+    """검색된 법령 집합 ((법령 ID, 버전) 쌍, 순서 무관)"""
+    return frozenset((law["id"], law_version(law)) for law in laws)
+
+
+class SemanticMatch(NamedTuple):
+    """의미 캐시 적중 결과"""
+
+    answer: str
+    # 저장되어 있던 질문
+    question: str
+    similarity: float
+
+
+class _Entry(NamedTuple):
+    question: str
+    keys: frozenset
+    answer: str
+    laws: frozenset
+    model: Optional[str]
+    # None 이면 만료 없음 (기준 항목)
+    expires_at: Optional[float]
+
+
+class SemanticAnswerCache:
+    """질문 임베딩 최근접 이웃 답변 캐시
+
+    - 질문 벡터를 (max_entries, dim) NumPy 행렬에 쌓고, 조회는 행렬-벡터 곱 한 번으로 전체 유사도 계산
+    - 유사도가 threshold 이상이고, 핵심 검색어(법령명, 조문 번호, 처분/사항 어간)가 같고,
+      이번 질문에서 검색된 법령 집합(ID + 버전)이 저장 당시와 같을 때만 재사용
+      ("건축허가 절차" / "건축허가 받는 절차" 는 유사도로 같은 질문으로 보지만,
+      "건축허가 절차" / "건축허가 취소 절차" 는 유사도가 높아도 핵심 검색어가 달라 다른 질문으로 봄.
+      다른 법령이 검색되면 답이 달라질 수 있고, 법령이 개정되면 버전이 달라짐)
+    - 가득 차면 가장 오래된 항목부터 덮어씀 (링 버퍼)
+    - 기준 항목(시드 답변)은 링 버퍼와 따로 보관하므로 덮어쓰이지 않음
+    - 프로세스 메모리에만 저장 (워커별)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        max_entries: int = 2000,
+        ttl: int = 86400,
+        dim: int = QUESTION_VECTOR_DIM,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.dim = dim
+        self._clock = clock
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._entries: List[Optional[_Entry]] = [None] * max_entries
+        self._next = 0
+        self._size = 0
+        self._canonical_vectors = np.zeros((0, dim), dtype=np.float32)
+        self._canonical_entries: List[_Entry] = []
+        self.hits = 0
+        self.misses = 0
+        self.below_threshold = 0
+        self.term_mismatches = 0
+        self.law_mismatches = 0
+
+    def __len__(self) -> int:
+        return self._size + len(self._canonical_entries)
+
+    def _candidates(self, vector: np.ndarray) -> List[Tuple[float, _Entry]]:
+        """유사도가 threshold 이상인 (유사도, 항목) 목록 (유사도 높은 순)"""
+        candidates: List[Tuple[float, _Entry]] = []
+        for vectors, entries in (
+            (self._vectors[:self._size], self._entries),
+            (self._canonical_vectors, self._canonical_entries),
+        ):
+            if len(vectors) == 0:
+                continue
+            similarities = vectors @ vector
+            for index in np.flatnonzero(similarities >= self.threshold):
+                candidates.append((float(similarities[index]), entries[index]))
+        candidates.sort(key=lambda candidate: -candidate[0])
+        return candidates
+
+    def lookup(
+        self,
+        question: str,
+        laws: List[Dict[str, Any]],
+        model: Optional[str] = None,
+    ) -> Optional[SemanticMatch]:
+        """
+        비슷한 질문의 답변 조회
+
+        Args:
+            question: 사용자 질문
+            laws: 이번 질문에서 검색된 관련 법령
+            model: 답변 모델 ID
+
+        Returns:
+            SemanticMatch 또는 None (비슷한 질문이 없거나 핵심 검색어/검색 법령이 다른 경우)
+        """
+        if len(self) == 0:
+            self.misses += 1
+            return None
+        candidates = self._candidates(embed_question(question, self.dim))
+        if not candidates:
+            self.below_threshold += 1
+            self.misses += 1
+            return None
+
+        keys = key_terms(question_terms(question))
+        current_laws = law_set_of(laws)
+        now = self._clock()
+        # 유사도가 높은 순서로 조건을 만족하는 첫 항목
+        for similarity, entry in candidates:
+            if entry is None or (entry.expires_at is not None and entry.expires_at <= now):
+                continue
+            if entry.model is not None and entry.model != model:
+                continue
+            if entry.keys != keys:
+                self.term_mismatches += 1
+                continue
+            if entry.laws != current_laws:
+                self.law_mismatches += 1
+                continue
+            self.hits += 1
+            return SemanticMatch(entry.answer, entry.question, similarity)
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        question: str,
+        answer: str,
+        laws: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        canonical: bool = False,
+    ) -> None:
+        """
+        답변 저장
+
+        Args:
+            question: 사용자 질문
+            answer: 답변
+            laws: 답변 생성에 사용한 관련 법령
+            model: 답변 모델 ID
+            canonical: 기준 항목 여부 (만료 없음, 링 버퍼에서 밀려나지 않음, 같은 질문이면 교체)
+        """
+        vector = embed_question(question, self.dim)
+        if not vector.any():
+            return
+        entry = _Entry(
+            question,
+            key_terms(question_terms(question)),
+            answer,
+            law_set_of(laws),
+            model,
+            None if canonical else self._clock() + self.ttl,
+        )
+        if canonical:
+            for index, existing in enumerate(self._canonical_entries):
+                if existing.question == question and existing.model == model:
+                    self._canonical_entries[index] = entry
+                    return
+            self._canonical_vectors = np.vstack([self._canonical_vectors, vector[np.newaxis, :]])
+            self._canonical_entries.append(entry)
+            return
+        self._vectors[self._next] = vector
+        self._entries[self._next] = entry
+        self._next = (self._next + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        self._vectors[:] = 0.0
+        self._entries = [None] * self.max_entries
+        self._next = 0
+        self._size = 0
+        self._canonical_vectors = np.zeros((0, self.dim), dtype=np.float32)
+        self._canonical_entries = []
+
+    def stats(self) -> Dict[str, Any]:
+        """항목 수와 적중/미스/유사도 미달/핵심 검색어 불일치/법령 불일치 수, 적중률"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._size,
+            "max_entries": self.max_entries,
+            "canonical_entries": len(self._canonical_entries),
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "below_threshold": self.below_threshold,
+            "term_mismatches": self.term_mismatches,
+            "law_mismatches": self.law_mismatches,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,84 @@
+"""dense 검색 지연 측정 스크립트 (전체 스캔 vs IVF)
+
+사용법:
+    python scripts/bench_dense_search.py [--passages 500000] [--dim 128] [--probes 16]
+
+텍스트 임베딩 대신 주제 군집이 있는 무작위 단위 벡터로 행렬을 만들어
+DenseIndex.search_vector() 만 측정합니다 (질의 임베딩 시간 제외).
+IVF recall@10 은 전체 스캔 top-10 중 IVF 결과에 포함된 비율입니다.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.search.dense import DEFAULT_PROBES, DenseIndex, HashingEncoder, default_list_count, train_partition
+
+
+def _unit(rows: np.ndarray) -> np.ndarray:
+    return (rows / np.linalg.norm(rows, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _median_ms(index: DenseIndex, queries: np.ndarray) -> float:
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search_vector(query, k=10)
+        timings.append((time.perf_counter() - started) * 1000)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dense 검색 지연 측정")
+    parser.add_argument("--passages", type=int, default=500000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--probes", type=int, default=DEFAULT_PROBES)
+    parser.add_argument("--topics", type=int, default=5000, help="무작위 주제 군집 수")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    topics = _unit(rng.standard_normal((args.topics, args.dim)))
+    noise = 1.0 / np.sqrt(args.dim)
+
+    def sample(n):
+        return _unit(topics[rng.integers(0, args.topics, size=n)] + noise * rng.standard_normal((n, args.dim)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        matrix = np.lib.format.open_memmap(
+            Path(directory) / "passages.npy", mode="w+", dtype=np.float32, shape=(args.passages, args.dim)
+        )
+        for start in range(0, args.passages, 65536):
+            matrix[start:start + 65536] = sample(min(65536, args.passages - start))
+        queries = sample(args.queries)
+        ids = [str(i) for i in range(args.passages)]
+
+        started = time.perf_counter()
+        centroids, order, offsets = train_partition(matrix, default_list_count(args.passages) or 1)
+        print(f"IVF 학습: 목록 {len(centroids)}개, {time.perf_counter() - started:.1f}초")
+
+        encoder = HashingEncoder()
+        exhaustive = DenseIndex(encoder, matrix, ids, ids)
+        ivf = DenseIndex(
+            encoder, np.ascontiguousarray(matrix[order]), [ids[i] for i in order], [ids[i] for i in order],
+            centroids=centroids, offsets=offsets, n_probe=args.probes,
+        )
+
+        recall = np.mean([
+            len({hit[0] for hit in exhaustive.search_vector(q, k=10)} & {hit[0] for hit in ivf.search_vector(q, k=10)}) / 10
+            for q in queries[:50]
+        ])
+        print(f"{args.passages} x {args.dim} float32")
+        print(f"  전체 스캔: {_median_ms(exhaustive, queries):.2f} ms (중앙값)")
+        print(f"  IVF (탐색 목록 {args.probes}개): {_median_ms(ivf, queries):.2f} ms (중앙값), recall@10 {recall:.3f}")
+        del matrix, exhaustive
+
+
+if __name__ == "__main__":
+    main()
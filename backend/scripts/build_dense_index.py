@@ -0,0 +1,42 @@
+"""조문 passage dense 임베딩 색인 생성 스크립트 (오프라인 작업)
+
+사용법:
+    python scripts/build_dense_index.py [출력 디렉터리] [--dim 128] [--lists N] [--db law_corpus.db]
+
+생성된 디렉터리를 .env 의 DENSE_INDEX_DIR 로 지정하면 서버가 mmap으로 읽어서
+sparse(BM25F) 검색 결과와 결합합니다. 색인을 만든 데이터 소스(--db 지정 시 local, 아니면 mock)와
+서버의 LAW_SOURCE 가 같을 때만 결합합니다 (외부 API 모드에서는 사용하지 않음).
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.search.dense import DenseIndex, DEFAULT_DIM
+from app.mock.law_data import get_passage_index
+from app.corpus.store import LawStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조문 passage dense 색인 생성")
+    parser.add_argument("output", nargs="?", default="data/dense_index", help="출력 디렉터리")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="임베딩 차원")
+    parser.add_argument("--lists", type=int, help="IVF 목록 수 (기본: passage 2만 건 이상이면 sqrt(N), 0 이면 전체 스캔)")
+    parser.add_argument("--db", help="로컬 코퍼스 DB (지정하지 않으면 Mock 데이터 사용)")
+    args = parser.parse_args()
+
+    source = LawStore(args.db).iter_passages() if args.db else get_passage_index().iter_passages()
+    passages = [(passage["id"], passage["law_id"], text) for passage, text in source]
+    print(f"임베딩할 passage 수: {len(passages)}")
+
+    started = time.perf_counter()
+    index = DenseIndex.build(args.output, passages, dim=args.dim, source="local" if args.db else "mock", n_lists=args.lists)
+    elapsed = time.perf_counter() - started
+    print(f"✓ dense 색인 생성 완료: {args.output} ({len(index)}건, {index.encoder.dim}차원, IVF 목록 {index.n_lists}개, {elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
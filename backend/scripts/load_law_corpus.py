@@ -0,0 +1,82 @@
+"""법제처 lawService.do XML을 로컬 SQLite 코퍼스로 일괄 적재하는 스크립트
+
+사용법:
+    python scripts/load_law_corpus.py <XML 파일 또는 디렉터리>... [--db law_corpus.db] [--batch 200]
+    python scripts/load_law_corpus.py --mock   # 목업 법령을 적재 (개발용)
+
+적재 후 .env 에 LAW_SOURCE=local (필요 시 LAW_CORPUS_PATH) 를 설정하면
+검색/상세 조회가 외부 API 호출 없이 로컬 디스크에서 처리됩니다.
+"""
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterator, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.corpus.law_xml import parse_law_file
+from app.corpus.store import LawStore
+from app.mock.law_data import MOCK_LAWS
+
+
+def iter_xml_files(paths: List[str]) -> Iterator[Path]:
+    """입력 경로에서 XML 파일 순회 (디렉터리는 재귀 탐색)"""
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(path.rglob("*.xml"))
+        elif path.suffix.lower() == ".xml":
+            yield path
+
+
+def iter_laws(paths: List[str]) -> Iterator[dict]:
+    """XML 파일 -> 법령 데이터 (파싱 실패 파일은 건너뜀)"""
+    for xml_path in iter_xml_files(paths):
+        try:
+            # 응답에 법령ID가 없으면 파일명을 법령 ID로 사용
+            law = parse_law_file(xml_path, fallback_id=xml_path.stem)
+        except ET.ParseError as e:
+            print(f"  ✗ XML 파싱 오류: {xml_path} ({e})")
+            continue
+        if law is None:
+            print(f"  ✗ <law> 요소 없음: {xml_path}")
+            continue
+        yield law
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 XML 로컬 코퍼스 적재")
+    parser.add_argument("paths", nargs="*", help="lawService.do XML 파일 또는 디렉터리")
+    parser.add_argument("--db", default=settings.law_corpus_path, help="SQLite 코퍼스 경로")
+    parser.add_argument("--batch", type=int, default=200, help="트랜잭션당 법령 수")
+    parser.add_argument("--mock", action="store_true", help="목업 법령 적재")
+    args = parser.parse_args()
+
+    if not args.paths and not args.mock:
+        parser.error("XML 경로 또는 --mock 을 지정하세요.")
+
+    store = LawStore(args.db)
+    source = iter(MOCK_LAWS) if args.mock else iter_laws(args.paths)
+
+    started = time.perf_counter()
+    total = 0
+    batch: List[dict] = []
+    for law in source:
+        batch.append(law)
+        if len(batch) >= args.batch:
+            total += store.upsert_laws(batch)
+            print(f"  ✓ {total}건 적재")
+            batch = []
+    if batch:
+        total += store.upsert_laws(batch)
+
+    elapsed = time.perf_counter() - started
+    print(f"✓ 적재 완료: {total}건 ({elapsed:.1f}초) -> {args.db} (전체 {store.count_laws()}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""로컬 SQLite 코퍼스 증분 동기화 스크립트 (야간 배치용)
+
+법제처 lawSearch.do 목록의 최종시행일자를 저장된 값과 비교해서
+바뀐 법령만 lawService.do 로 다시 받아 재색인합니다.
+
+사용법:
+    python scripts/sync_law_corpus.py [--db law_corpus.db] [--fixture 디렉터리] [--prune]
+
+NOTE: 실행 중인 서버의 메모리 캐시는 별도 프로세스에서 지울 수 없으므로
+서버 안에서 주기적으로 돌리려면 .env 에 LAW_SYNC_INTERVAL_HOURS 를 설정하세요.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.corpus.store import LawStore
+from app.corpus.sync import FixtureLawSource, RemoteLawSource, sync_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 법령 코퍼스 증분 동기화")
+    parser.add_argument("--db", default=settings.law_corpus_path, help="SQLite 코퍼스 경로")
+    parser.add_argument(
+        "--fixture",
+        default=settings.law_sync_fixture_dir,
+        help="lawSearch*.xml / <법령ID>.xml fixture 디렉터리 (지정하지 않으면 법제처 API)",
+    )
+    parser.add_argument("--prune", action="store_true", help="목록에 없는 법령 삭제")
+    args = parser.parse_args()
+
+    if args.fixture:
+        source = FixtureLawSource(args.fixture)
+    elif settings.law_api_key.strip():
+        source = RemoteLawSource(settings.law_api_key)
+    else:
+        parser.error("LAW_API_KEY 를 설정하거나 --fixture 를 지정하세요.")
+
+    started = time.perf_counter()
+    result = sync_corpus(LawStore(args.db), source, prune=args.prune)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"✓ 동기화 완료 ({elapsed:.1f}초): 확인 {result.checked}건, 추가 {len(result.added)}건, "
+        f"갱신 {len(result.updated)}건, 삭제 {len(result.removed)}건, 실패 {len(result.failed)}건"
+    )
+    for law_id in result.failed:
+        print(f"  ✗ 상세 조회 실패: {law_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -55,6 +55,87 @@ def test_get_law_not_found():
     assert response.status_code == 404
 
 
+def test_get_law_conditional_request_returns_304():
+    """법령 상세 ETag / Last-Modified 조건부 요청 테스트"""
+    response = client.get("/api/laws/law-001")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"] == "Sun, 11 Jun 2023 00:00:00 GMT"
+    assert "max-age" in response.headers["cache-control"]
+
+    response = client.get("/api/laws/law-001", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get("/api/laws/law-001", headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert response.status_code == 304
+    response = client.get("/api/laws/law-001", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200 and response.json()["law"]["id"] == "law-001"
+
+
+def test_law_list_and_search_revalidate_with_etag_only():
+    """목록/검색 응답은 Last-Modified 없이 ETag 로만 재검증하는지 테스트 (If-Modified-Since 만으로는 304 아님)"""
+    for path, params in (("/api/laws/", None), ("/api/laws/search", {"keyword": "건축"})):
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        assert "last-modified" not in response.headers
+        etag = response.headers["etag"]
+
+        response = client.get(path, params=params, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+        assert response.status_code == 200
+        response = client.get(path, params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+def test_external_fallback_responses_are_not_cached(monkeypatch):
+    """외부 API 장애로 대체한 검색/상세 응답은 응답 캐시에 남지 않아 복구 후 바로 실제 데이터를 주는지 테스트"""
+    import httpx
+    from app.core.cache import clear_cache
+    from app.core.config import settings
+    from app.services.law_service import LawService
+
+    # 목업 모드에서 캐싱된 상세/응답이 남아 있지 않도록
+    clear_cache("law_detail")
+    clear_cache("law_response")
+    healthy = [False]
+
+    async def get_law_external(law_id):
+        if not healthy[0]:
+            raise httpx.ConnectError("upstream down")
+        return {"id": law_id, "name": "외부건축법", "amendment_date": "20240101"}
+
+    async def search_laws_external(keyword):
+        if not healthy[0]:
+            raise httpx.ConnectError("upstream down")
+        return [{"id": "ext-1", "name": "외부건축법"}]
+
+    monkeypatch.setattr(settings, "law_source", "external")
+    monkeypatch.setattr(LawService, "_fallback_store", staticmethod(lambda: None))
+    monkeypatch.setattr(LawService, "_get_law_external", staticmethod(get_law_external))
+    monkeypatch.setattr(LawService, "_search_laws_external", staticmethod(search_laws_external))
+
+    detail = client.get("/api/laws/law-001")
+    assert detail.status_code == 200 and detail.headers["cache-control"] == "no-cache"
+    search = client.get("/api/laws/search", params={"keyword": "장애중검색"})
+    assert search.status_code == 200 and search.headers["cache-control"] == "no-cache"
+
+    healthy[0] = True
+    detail = client.get("/api/laws/law-001")
+    assert detail.json()["law"]["name"] == "외부건축법"
+    assert "max-age" in detail.headers["cache-control"]
+
+
+def test_get_article_checks_law_id():
+    """조문 조회 시 법령 ID 일치 여부 확인 테스트"""
+    response = client.get("/api/laws/law-001/articles/art-001-011")
+    assert response.status_code == 200
+    assert response.json()["article"]["number"] == "제11조"
+
+    response = client.get("/api/laws/law-002/articles/art-001-011")
+    assert response.status_code == 404
+
+
 def test_chat_message_empty():
     """빈 메시지로 채팅 테스트"""
     response = client.post("/api/chat/", json={"message": ""})
@@ -101,3 +182,32 @@ def test_get_conversation_not_found():
     response = client.get("/api/conversations/non-existent-id")
     assert response.status_code == 404
 
+
+
+def test_admin_cache_metrics_and_clear():
+    """관리자 캐시 지표/삭제 API 테스트"""
+    client.get("/api/laws/law-002")
+    client.get("/api/laws/law-002")
+
+    response = client.get("/api/admin/cache")
+    assert response.status_code == 200
+    data = response.json()
+    detail = data["prefixes"]["law_response_detail"]
+    assert detail["hits"] >= 1 and detail["entries"] >= 1 and detail["bytes"] > 0
+    assert detail["hit_latency"]["count"] >= 1
+    assert "law_detail" in data["segments"]
+
+    response = client.delete("/api/admin/cache", params={"prefix": "law_response_detail"})
+    assert response.status_code == 200
+    assert response.json()["cleared"] >= 1
+
+
+def test_admin_metrics_reports_token_counting_method():
+    """관리자 지표가 프롬프트 토큰 수가 근사치인지 알려주는지 테스트"""
+    from app.core.tokens import token_counts_exact
+
+    response = client.get("/api/admin/metrics")
+    assert response.status_code == 200
+    counting = response.json()["token_counting"]
+    assert counting["exact"] == token_counts_exact()
+    assert counting["method"] == ("tiktoken" if counting["exact"] else "estimate")
@@ -0,0 +1,542 @@
+"""채팅 / OpenAI 서비스 테스트"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeCompletions:
+    """chat.completions.create 대역 (stream=True 면 조각 목록 반환)"""
+
+    def __init__(self, text="건축법 제11조에 따라 허가를 받아야 합니다."):
+        self.text = text
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("stream"):
+            return self._stream()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.text))])
+
+    async def _stream(self):
+        for i in range(0, len(self.text), 5):
+            yield _chunk(self.text[i:i + 5])
+        yield _chunk(None)
+
+
+def test_stream_answer_yields_tokens_in_order():
+    """OpenAI 스트리밍 응답을 조각 단위로 전달하는지 테스트"""
+    from app.services.openai_service import OpenAIService
+
+    service = OpenAIService()
+    completions = FakeCompletions()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    async def run():
+        return [token async for token in service.stream_answer("건축법 제11조의 건축허가 절차는?")]
+
+    tokens = asyncio.run(run())
+    assert len(tokens) > 1
+    assert "".join(tokens) == completions.text
+    assert completions.calls[0]["stream"] is True
+
+
+def test_chat_stream_endpoint_sends_tokens_then_done(monkeypatch):
+    """/api/chat/stream 이 token 이벤트 후 done(메시지 ID, 법령 출처) 이벤트를 보내는지 테스트"""
+    from app.api import chat as chat_module
+    from app.core.metrics import get_histogram
+    from app.services.openai_service import OpenAIService
+
+    service = OpenAIService()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    saved = []
+    monkeypatch.setattr(chat_module, "get_openai_service", lambda: service)
+    monkeypatch.setattr(chat_module, "_start_turn", lambda db, request: ("conv-1", [], None))
+    monkeypatch.setattr(chat_module, "SessionLocal", lambda: SimpleNamespace(close=lambda: None))
+    monkeypatch.setattr(
+        chat_module,
+        "_finish_turn",
+        lambda db, conversation_id, content, refs: saved.append(content) or SimpleNamespace(id="msg-1"),
+    )
+    ttft_before = get_histogram("chat_ttft").count
+
+    with client.stream("POST", "/api/chat/stream", json={"message": "건축법"}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    events = [block.split("\n")[0] for block in body.strip().split("\n\n")]
+    assert events[0] == "event: token" and events[-1] == "event: done"
+    assert '"id": "msg-1"' in body and '"law_id": "law-001"' in body
+    assert saved == [service.client.chat.completions.text]
+    assert get_histogram("chat_ttft").count == ttft_before + 1
+
+
+def test_chat_stream_sends_error_event_when_saving_fails(monkeypatch):
+    """토큰 전송 후 응답 저장에 실패하면 스트림을 끊지 않고 error 이벤트로 끝나는지 테스트"""
+    from app.api import chat as chat_module
+    from app.services.openai_service import OpenAIService
+
+    service = OpenAIService()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(chat_module, "get_openai_service", lambda: service)
+    monkeypatch.setattr(chat_module, "_start_turn", lambda db, request: ("conv-1", [], None))
+    monkeypatch.setattr(chat_module, "SessionLocal", lambda: SimpleNamespace(close=lambda: None))
+
+    def fail(db, conversation_id, content, refs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(chat_module, "_finish_turn", fail)
+
+    with client.stream("POST", "/api/chat/stream", json={"message": "건축법"}) as response:
+        body = "".join(response.iter_text())
+
+    events = [block.split("\n")[0] for block in body.strip().split("\n\n")]
+    assert events[0] == "event: token" and events[-1] == "event: error"
+    assert "event: done" not in body
+
+
+def test_chat_stream_saves_answer_with_real_session(monkeypatch):
+    """실제 DB 세션으로 응답을 저장한 뒤 done 이벤트에 저장된 메시지 ID를 담는지 테스트"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.api import chat as chat_module
+    from app.db.database import Base
+    from app.repositories.conversation_repository import ConversationRepository
+    from app.repositories.message_repository import MessageRepository
+    from app.schemas.chat import ConversationCreate
+    from app.services import conversation_summary as summary_module
+    from app.services.openai_service import OpenAIService
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = session_factory()
+    conversation_id = ConversationRepository(db).create(ConversationCreate(title="건축법")).id
+    db.close()
+
+    service = OpenAIService()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(chat_module, "get_openai_service", lambda: service)
+    monkeypatch.setattr(chat_module, "_start_turn", lambda db, request: (conversation_id, [], None))
+    monkeypatch.setattr(chat_module, "SessionLocal", session_factory)
+    monkeypatch.setattr(summary_module.settings, "conversation_summary_enabled", False)
+
+    with client.stream("POST", "/api/chat/stream", json={"message": "건축법"}) as response:
+        body = "".join(response.iter_text())
+
+    events = [block.split("\n")[0] for block in body.strip().split("\n\n")]
+    assert events[-1] == "event: done"
+    done = json.loads(body.strip().split("\n\n")[-1].split("data: ", 1)[1])
+    db = session_factory()
+    saved = MessageRepository(db).get_recent_by_conversation_id(conversation_id, 10)
+    db.close()
+    assert [msg.id for msg in saved] == [done["id"]]
+    assert done["conversation_id"] == conversation_id
+
+
+def test_chat_stream_rejects_empty_message():
+    """스트리밍 채팅 빈 메시지 검증 테스트"""
+    response = client.post("/api/chat/stream", json={"message": " "})
+    assert response.status_code == 400
+
+
+def test_concurrency_limiter_rejects_when_queue_is_full():
+    """동시 실행/대기열 한도를 넘으면 기다리지 않고 바로 거절하는지 테스트"""
+    from app.core.concurrency import ConcurrencyLimiter
+    from app.core.exceptions import ServiceOverloadedError
+
+    async def run():
+        limiter = ConcurrencyLimiter("test", max_concurrency=1, max_queue=1, queue_timeout=1.0, retry_after=7)
+        release = asyncio.Event()
+        order = []
+
+        async def call(name):
+            async with limiter.slot():
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(call("first"))
+        second = asyncio.create_task(call("second"))  # 대기열에서 기다림
+        await asyncio.sleep(0.01)
+        try:
+            await call("third")
+        except ServiceOverloadedError as e:
+            rejected = e.retry_after
+        release.set()
+        await asyncio.gather(first, second)
+        return order, rejected, limiter.stats()
+
+    order, retry_after, stats = asyncio.run(run())
+    assert order == ["first", "second"]
+    assert retry_after == 7
+    assert (stats["rejected"], stats["completed"], stats["active"]) == (1, 2, 0)
+
+
+def test_chat_returns_503_with_retry_after_when_overloaded(monkeypatch):
+    """OpenAI 대기열이 가득 차면 채팅 API가 503 + Retry-After 를 반환하는지 테스트"""
+    from app.api import chat as chat_module
+    from app.core.concurrency import ConcurrencyLimiter
+    from app.services.openai_service import OpenAIService
+
+    service = OpenAIService()
+    service.limiter = ConcurrencyLimiter("openai", max_concurrency=0, max_queue=0, retry_after=3)
+    monkeypatch.setattr(chat_module, "get_openai_service", lambda: service)
+
+    response = client.post("/api/chat/stream", json={"message": "건축법"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
+
+
+def test_answer_cache_reuses_first_turn_answers():
+    """같은 첫 질문은 OpenAI 호출 없이 캐시된 답변을 쓰고, 이어지는 대화는 캐시하지 않는지 테스트"""
+    from app.services.openai_service import OpenAIService
+
+    service = OpenAIService()
+    completions = FakeCompletions()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    question = "전기사업법의 발전사업 허가 기준은?"
+
+    async def run():
+        first = await service.ask_question(question, [{"role": "user", "content": question}])
+        # 공백/물음표만 다른 같은 질문
+        second = await service.ask_question("  전기사업법의   발전사업 허가 기준은 ")
+        followup = await service.ask_question(question, [
+            {"role": "user", "content": "이전 질문"},
+            {"role": "assistant", "content": "이전 답변"},
+            {"role": "user", "content": question},
+        ])
+        return first, second, followup
+
+    first, second, followup = asyncio.run(run())
+    assert first == second == followup == completions.text
+    assert len(completions.calls) == 2
+    stats = service.answer_cache.stats()
+    assert (stats["hits"], stats["skipped"]) == (1, 1)
+
+
+def test_answer_cache_drops_answers_when_cited_law_is_amended():
+    """인용 법령의 개정일이 바뀌면 캐시된 답변을 버리는지 테스트"""
+    from app.services.answer_cache import AnswerCache, normalize_question
+
+    assert normalize_question("건축법  제11조는？") == normalize_question("건축법 제11조는")
+
+    cache = AnswerCache(ttl=60)
+    laws = [{"id": "amend-1", "amendment_date": "2023-06-11"}, {"id": "amend-2", "amendment_date": "2020-01-01"}]
+    key = cache.key("질문", "컨텍스트", "model")
+    asyncio.run(cache.put(key, "답변", ["amend-1"], laws))
+
+    # 인용하지 않은 법령의 개정은 무관
+    assert asyncio.run(cache.get(key, [laws[0], {"id": "amend-2", "amendment_date": "2024-01-01"}])) == "답변"
+    assert asyncio.run(cache.get(key, [{"id": "amend-1", "amendment_date": "2024-03-01"}, laws[1]])) is None
+    assert asyncio.run(cache.get(key, laws)) is None
+    assert cache.stats()["invalidated"] == 1
+
+
+def test_semantic_cache_reuses_answers_for_paraphrased_questions():
+    """표현만 다른 질문은 같은 법령이 검색될 때만 저장된 답변을 쓰는지 테스트"""
+    from app.services.semantic_cache import SemanticAnswerCache
+
+    cache = SemanticAnswerCache(threshold=0.8, max_entries=4)
+    laws = [{"id": "law-001", "amendment_date": "2023-06-11"}]
+    cache.put("건축법 제11조의 건축허가 절차는?", "답변", laws, "model")
+
+    match = cache.lookup("건축법 11조 건축허가 절차 알려줘", laws, "model")
+    assert match is not None and match.answer == "답변" and match.similarity >= 0.8
+    # 다른 질문 / 다른 법령 집합 / 개정된 법령 / 다른 모델
+    assert cache.lookup("풍력 발전사업 인허가 절차는?", laws, "model") is None
+    assert cache.lookup("건축법 11조 건축허가 절차 알려줘", laws + [{"id": "law-002"}], "model") is None
+    assert cache.lookup("건축법 11조 건축허가 절차 알려줘", [{"id": "law-001", "amendment_date": "2024-01-01"}], "model") is None
+    assert cache.lookup("건축법 11조 건축허가 절차 알려줘", laws, "other-model") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["below_threshold"], stats["law_mismatches"]) == (1, 1, 2)
+
+    # 가득 차면 오래된 항목부터 덮어씀
+    for i in range(4):
+        cache.put(f"농지법 전용허가 {i}번 질문", "다른 답변", laws, "model")
+    assert len(cache) == 4
+    assert cache.lookup("건축법 11조 건축허가 절차 알려줘", laws, "model") is None
+
+
+def test_semantic_cache_rejects_questions_with_different_key_terms():
+    """유사도가 높아도 핵심 검색어가 다르면 (예: 절차 / 취소 절차) 재사용하지 않는지 테스트"""
+    from app.services.semantic_cache import SemanticAnswerCache, embed_question
+
+    cache = SemanticAnswerCache(threshold=0.8, max_entries=8)
+    laws = [{"id": "law-001", "amendment_date": "2023-06-11"}]
+    cache.put("건축허가 절차는?", "허가 절차 답변", laws, "model")
+    cache.put("태양광 발전소 허가", "발전소 허가 답변", laws, "model")
+
+    pairs = [("건축허가 취소 절차는?", "건축허가 절차는?"), ("태양광 발전소 허가 취소", "태양광 발전소 허가")]
+    for question, stored in pairs:
+        # 벡터 유사도만으로는 임계값을 넘는 쌍
+        assert float(embed_question(question) @ embed_question(stored)) >= 0.8
+        assert cache.lookup(question, laws, "model") is None
+    assert cache.stats()["term_mismatches"] == 2
+
+
+def test_semantic_cache_matches_paraphrases_by_similarity():
+    """핵심 검색어가 같으면 나머지 검색어가 달라도 유사도로 재사용하는지 테스트"""
+    from app.services.semantic_cache import SemanticAnswerCache
+
+    cache = SemanticAnswerCache(threshold=0.8, max_entries=8)
+    laws = [{"id": "law-001", "amendment_date": "2023-06-11"}]
+    cache.put("건축허가 절차는?", "허가 절차 답변", laws, "model")
+
+    # 조사/요청 표현만 다른 질문
+    match = cache.lookup("건축허가 절차를 알려주세요", laws, "model")
+    assert match is not None and match.similarity == pytest.approx(1.0)
+    # 검색어가 하나 더 있지만 뜻이 같은 질문은 유사도로 판단
+    for question in ("건축허가 받는 절차는?", "건축허가 신청 절차"):
+        match = cache.lookup(question, laws, "model")
+        assert match is not None and match.answer == "허가 절차 답변"
+        assert 0.8 <= match.similarity < 1.0
+    # 유사도 미달
+    assert cache.lookup("건축허가 받는 절차와 기한, 담당 기관", laws, "model") is None
+    assert cache.stats()["below_threshold"] == 1
+
+
+def test_semantic_cache_seeds_mock_scenarios():
+    """MOCK_QA_SCENARIOS 질문의 실제 답변을 기준 항목으로 등록하면 비슷한 첫 질문에 OpenAI 를 다시 호출하지 않는지 테스트"""
+    from app.core.cache import clear_cache
+    from app.mock.qa_scenarios import MOCK_QA_SCENARIOS
+    from app.services.openai_service import OpenAIService
+    from app.services.semantic_cache import SemanticAnswerCache
+
+    clear_cache("answer")
+    service = OpenAIService()
+    service.semantic_cache = SemanticAnswerCache(max_entries=2)
+    completions = FakeCompletions()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    async def run():
+        seeded = await service.seed_semantic_cache()
+        # 링 버퍼가 가득 차도 기준 항목은 남음
+        for i in range(4):
+            service.semantic_cache.put(f"농지법 전용허가 {i}번 질문", "다른 답변", [], service.model)
+        answer = await service.ask_question("건축법 11조 건축허가 절차 알려줘")
+        return seeded, answer
+
+    seeded, answer = asyncio.run(run())
+    assert seeded == len(MOCK_QA_SCENARIOS)
+    # 시드 답변은 요약이 아니라 평소 프롬프트로 생성한 답변
+    assert len(completions.calls) == len(MOCK_QA_SCENARIOS)
+    assert answer == completions.text
+    stats = service.semantic_cache.stats()
+    assert (stats["canonical_entries"], stats["hits"]) == (len(MOCK_QA_SCENARIOS), 1)
+
+    # 다른 모델에는 쓰지 않음
+    service.model = "other-model"
+    asyncio.run(service.ask_question("건축법 11조 건축허가 절차 알려줘"))
+    assert len(completions.calls) == len(MOCK_QA_SCENARIOS) + 1
+
+
+def test_context_packer_fills_token_budget_by_relevance():
+    """컨텍스트가 예산을 넘지 않고, 점수 높은 조문부터 넣으며, 중복 passage 는 한 번만 넣는지 테스트"""
+    from app.core.tokens import count_tokens
+    from app.services.context_packer import _MAX_LEADING_ARTICLES, pack_law_context
+
+    def article(number, content, subparagraphs=()):
+        return {
+            "id": f"art-{number}",
+            "number": f"제{number}조",
+            "title": f"조문{number}",
+            "content": content,
+            "subparagraphs": [
+                {"id": f"subp-{number}-{i}", "type": "호", "number": str(i), "content": text}
+                for i, text in enumerate(subparagraphs, 1)
+            ],
+        }
+
+    law = {
+        "id": "law-x", "name": "테스트법", "type": "법률", "amendment_date": "2024-01-01",
+        "articles": [
+            article(1, "목적 조항입니다. " * 40),
+            article(2, "허가를 받아야 한다.", ["발전소 건설사업", "허가를 받아야 한다."]),
+            article(3, "신고하여야 한다."),
+        ],
+    }
+    law_sets = [{"base_name": "테스트법", "main": law, "children": [{"name": "테스트법 시행령", "type": "대통령령"}]}]
+    passages = [
+        {"id": "subp-2-1", "law_id": "law-x", "article_id": "art-2", "score": 5.0},
+        {"id": "subp-2-1", "law_id": "law-x", "article_id": "art-2", "score": 5.0},
+        {"id": "subp-2-2", "law_id": "law-x", "article_id": "art-2", "score": 4.0},
+        {"id": "art-3", "law_id": "law-x", "article_id": "art-3", "score": 1.0},
+    ]
+
+    packed = pack_law_context(law_sets, passages, budget=10000)
+    # 일치한 조문만, 원래 조문 순서로 / 조문 본문과 같은 호는 제외
+    assert "제1조" not in packed.text
+    assert packed.text.index("제2조") < packed.text.index("제3조") < packed.text.index("테스트법 시행령")
+    assert "호 1. 발전소 건설사업" in packed.text and "호 2." not in packed.text
+    assert packed.duplicates == 2 and packed.articles == 2
+
+    small = pack_law_context(law_sets, passages, budget=packed.tokens - 5)
+    assert small.tokens <= small.budget and small.dropped >= 1
+    assert "제2조" in small.text
+    assert count_tokens(small.text) <= small.budget + 5
+
+    # 예산이 부족해서 빠진 조문의 호는 중복으로 치지 않고 뒤 조문에서 넣음
+    law["articles"] = [
+        article(1, "목적 조항입니다. " * 400, ["허가 기준"]),
+        article(3, "신고하여야 한다.", ["허가 기준"]),
+    ]
+    passages = [
+        {"id": "art-1", "law_id": "law-x", "article_id": "art-1", "score": 9.0},
+        {"id": "art-3", "law_id": "law-x", "article_id": "art-3", "score": 1.0},
+    ]
+    packed = pack_law_context(law_sets, passages, budget=200)
+    assert "제1조" not in packed.text and "호 1. 허가 기준" in packed.text
+    assert packed.duplicates == 0
+
+    # 일치한 조문이 없는 법령은 앞쪽 조문 몇 개만 후보
+    law["articles"] = [article(i, f"{i}번째 조문 내용") for i in range(1, 31)]
+    packed = pack_law_context(law_sets, [], budget=100000)
+    assert packed.articles == _MAX_LEADING_ARTICLES and "제11조" not in packed.text
+
+
+def test_prepare_reports_prompt_tokens():
+    """OpenAI 요청 준비 시 프롬프트 토큰 수를 계산하고 히스토그램에 기록하는지 테스트"""
+    from app.core.metrics import get_histogram
+    from app.core.tokens import count_message_tokens, estimate_tokens
+    from app.services.openai_service import OpenAIService
+
+    assert estimate_tokens("건축법 permit 11") == 3 + 2 + 1
+    before = get_histogram("prompt_tokens").count
+    prepared = asyncio.run(OpenAIService()._prepare("건축법 제11조의 건축허가 절차는?"))
+    assert prepared.prompt_tokens == count_message_tokens(prepared.messages) > 0
+    assert get_histogram("prompt_tokens").count == before + 1
+
+
+def test_history_messages_fit_summary_and_recent_turns_in_budget():
+    """누적 요약 + 최근 대화가 토큰 예산 안에 들어가고, 오래된 메시지부터 버려지는지 테스트"""
+    from app.core.tokens import count_message_tokens
+    from app.services.conversation_summary import SUMMARY_HEADER, build_history_messages
+
+    history = [
+        {"role": "user", "content": "첫 질문"},
+        {"role": "assistant", "content": "아주 긴 답변입니다. " * 200},
+        {"role": "user", "content": "두 번째 질문"},
+        {"role": "assistant", "content": "두 번째 답변"},
+    ]
+    messages = build_history_messages("태양광 발전소 인허가 상담 중", history, budget=300, max_messages=4)
+
+    assert messages[0] == {"role": "system", "content": SUMMARY_HEADER + "태양광 발전소 인허가 상담 중"}
+    assert [msg["content"] for msg in messages[-2:]] == ["두 번째 질문", "두 번째 답변"]
+    # 긴 답변은 잘리고, 그보다 오래된 질문은 빠짐
+    assert len(messages) == 4 and len(messages[1]["content"]) < len(history[1]["content"])
+    assert count_message_tokens(messages) <= 300 + 3
+    assert build_history_messages(None, history, budget=1000, max_messages=2) == history[-2:]
+
+
+def test_update_summary_folds_messages_outside_recent_window(monkeypatch):
+    """최근 대화 창 밖으로 밀려난 메시지만 누적 요약에 반영하는지 테스트"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.db.database import Base
+    from app.repositories.conversation_summary_repository import ConversationSummaryRepository
+    from app.repositories.message_repository import MessageRepository
+    from app.schemas.chat import MessageCreate
+    from app.services import conversation_summary as summary_module
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(summary_module.settings, "conversation_recent_turns", 1)
+
+    db = session_factory()
+    for i in range(6):
+        role = "user" if i % 2 == 0 else "assistant"
+        MessageRepository(db).create(MessageCreate(role=role, content=f"메시지 {i}", conversation_id="conv-s"))
+    db.close()
+
+    calls = []
+
+    async def summarize(previous, messages):
+        calls.append((previous, [msg["content"] for msg in messages]))
+        return f"{previous}+{len(messages)}"
+
+    async def run():
+        first = await summary_module.update_summary("conv-s", summarize, session_factory)
+        second = await summary_module.update_summary("conv-s", summarize, session_factory)
+        return first, second
+
+    assert asyncio.run(run()) == (True, False)
+    assert calls == [("", ["메시지 0", "메시지 1", "메시지 2", "메시지 3"])]
+    row = ConversationSummaryRepository(session_factory()).get("conv-s")
+    assert (row.summary, row.summarized_count) == ("+4", 4)
+
+
+def test_prepare_sends_summary_instead_of_old_turns():
+    """요약이 있으면 system 메시지로 넣고, 현재 질문은 중복 없이 프롬프트로만 보내는지 테스트"""
+    from app.services.openai_service import OpenAIService
+
+    question = "그럼 건축신고 대상은?"
+    history = [
+        {"role": "user", "content": "건축허가 절차는?"},
+        {"role": "assistant", "content": "건축법 제11조에 따라 허가를 받아야 합니다."},
+        {"role": "user", "content": question},
+    ]
+    prepared = asyncio.run(OpenAIService()._prepare(question, history, "인천 서구 태양광 발전소 상담"))
+
+    roles = [msg["role"] for msg in prepared.messages]
+    assert roles == ["system", "system", "user", "assistant", "user"]
+    assert "인천 서구 태양광 발전소 상담" in prepared.messages[1]["content"]
+    assert prepared.messages[-1]["content"].endswith("답변:") and question in prepared.messages[-1]["content"]
+    assert prepared.first_turn is False and prepared.cache_key is None
+
+
+def test_chat_stream_retrieves_once_for_prompt_and_references(monkeypatch):
+    """요청당 검색을 한 번만 하고, 같은 검색 결과로 프롬프트와 법령 출처를 만드는지 테스트"""
+    from app.api import chat as chat_module
+    from app.services.law_service import LawService, RetrievalResult
+    from app.services.openai_service import OpenAIService
+
+    law = {
+        "id": "law-r", "name": "검색전용법", "type": "법률", "amendment_date": "2024-01-01",
+        "articles": [
+            {"id": "art-r-1", "number": "제1조", "title": "목적", "content": "목적", "subparagraphs": []},
+            {"id": "art-r-11", "number": "제11조", "title": "허가", "content": "허가 요건", "subparagraphs": []},
+        ],
+    }
+    retrieval = RetrievalResult("질문", [{**law, "score": 2.0}], [
+        {"id": "art-r-11", "law_id": "law-r", "article_id": "art-r-11", "article_number": "제11조", "score": 3.0},
+    ])
+    calls = []
+
+    async def retrieve(question, limit=5):
+        calls.append(question)
+        return retrieval
+
+    service = OpenAIService()
+    completions = FakeCompletions("검색전용법 제11조에 따라 허가를 받아야 합니다.")
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(LawService, "retrieve", retrieve)
+    monkeypatch.setattr(chat_module, "get_openai_service", lambda: service)
+    monkeypatch.setattr(chat_module, "_start_turn", lambda db, request: ("conv-r", [], None))
+    monkeypatch.setattr(chat_module, "SessionLocal", lambda: SimpleNamespace(close=lambda: None))
+    monkeypatch.setattr(
+        chat_module, "_finish_turn", lambda db, conversation_id, content, refs: SimpleNamespace(id="msg-r"),
+    )
+
+    with client.stream("POST", "/api/chat/stream", json={"message": "검색 결과 공유 확인용 질문"}) as response:
+        body = "".join(response.iter_text())
+
+    assert calls == ["검색 결과 공유 확인용 질문"]
+    assert "허가 요건" in completions.calls[0]["messages"][-1]["content"]
+    assert '"law_id": "law-r"' in body and '"article": "제11조"' in body
+    assert retrieval.scores == {"law-r": 2.0} and retrieval.law_ids == ["law-r"]
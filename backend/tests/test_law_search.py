@@ -0,0 +1,721 @@
+"""법령 검색 색인 테스트"""
+import asyncio
+
+import pytest
+
+from app.mock.law_data import MOCK_LAWS, search_laws_by_keyword
+from app.search.index import LawIndex
+
+
+def test_search_matches_substring_in_name_category_and_article():
+    """법령명/카테고리/조문 부분 문자열 검색 테스트"""
+    assert [law["id"] for law in search_laws_by_keyword("건축")][0] == "law-001"
+    assert [law["id"] for law in search_laws_by_keyword("신재생")] == ["law-004"]
+    assert [law["id"] for law in search_laws_by_keyword("형질변경")] == ["law-002"]
+
+
+def test_search_includes_subparagraphs_and_titles():
+    """항/호/목 및 조문 제목 검색 테스트"""
+    assert [law["id"] for law in search_laws_by_keyword("발전소 건설사업")] == ["law-005"]
+    assert [law["id"] for law in search_laws_by_keyword("산지전용허가")] == ["law-006"]
+
+
+def test_search_single_character_and_no_match():
+    """1글자 검색 및 결과 없음 테스트"""
+    assert len(search_laws_by_keyword("법")) == len(MOCK_LAWS)
+    assert search_laws_by_keyword("태양광") == []
+
+
+def test_law_index_lookup_by_id():
+    """법령 ID 조회 테스트"""
+    index = LawIndex(MOCK_LAWS)
+    assert index.get("law-003")["name"] == "전기사업법"
+    assert index.get("law-999") is None
+
+
+def test_rank_search_results_bm25_order_and_limit():
+    """BM25F 관련도 정렬 및 상위 k개 선택 테스트"""
+    from app.services.law_service import LawService
+
+    results = search_laws_by_keyword("건축")
+    ranked = LawService.rank_search_results(results, "건축")
+    assert ranked[0]["id"] == "law-001"
+    assert [law["score"] for law in ranked] == sorted((law["score"] for law in ranked), reverse=True)
+    assert "score" not in MOCK_LAWS[0]
+
+    top = LawService.rank_search_results(results, "건축", limit=1)
+    assert [law["id"] for law in top] == ["law-001"]
+
+
+def test_rank_search_results_outside_index():
+    """색인에 없는 결과(외부 API 결과) 정렬 테스트"""
+    from app.services.law_service import LawService
+
+    external = [
+        {"id": "ext-1", "name": "건축물관리법", "category": [], "articles": []},
+        {"id": "ext-2", "name": "주택법", "category": [], "articles": []},
+    ]
+    ranked = LawService.rank_search_results(external, "건축")
+    assert [law["id"] for law in ranked] == ["ext-1", "ext-2"]
+    assert ranked[1]["score"] == 0.0
+
+
+def test_analyze_query_strips_particles_and_stopwords():
+    """질문 분해 (조사/어미/불용어 제거) 테스트"""
+    from app.search.query import analyze_query
+
+    assert analyze_query("인천 서구에서 태양광 발전소 건설 시 필요한 인허가는?") == [
+        "인천", "서구", "태양광", "발전소", "건설", "인허가"
+    ]
+    assert analyze_query("건축법 제11조의 건축허가 절차는?") == ["건축법", "제11조", "건축허가", "절차"]
+
+
+def test_search_relevant_laws_for_full_sentence_question():
+    """문장형 질문 관련 법령 검색 테스트"""
+    from app.services.law_service import LawService
+
+    laws = asyncio.run(LawService.search_relevant_laws("태양광 발전소 건설 시 환경영향평가가 필요한가?"))
+    assert laws[0]["id"] == "law-005"
+    # 표현만 다른 질문은 같은 캐시 결과를 공유
+    assert asyncio.run(LawService.search_relevant_laws("환경영향평가 태양광 발전소 건설")) is laws
+
+
+def test_passage_index_article_lookup():
+    """조문/항호목 O(1) 조회 테스트"""
+    from app.mock.law_data import get_article_by_id, get_passage_index
+
+    assert get_article_by_id("art-001-011")["title"] == "건축허가"
+    assert get_article_by_id("art-001-011", "law-001") is not None
+    assert get_article_by_id("art-001-011", "law-002") is None
+    assert get_passage_index().get_passage("subp-005-004-001")["article_id"] == "art-005-004"
+
+
+def test_search_relevant_passages_prefers_matching_article():
+    """passage 단위 관련 조문 검색 테스트"""
+    from app.services.law_service import LawService
+
+    question = "발전소 건설 시 환경영향평가 대상사업인가?"
+    laws = asyncio.run(LawService.search_relevant_laws(question))
+    passages = LawService.search_relevant_passages(question, laws)
+    assert passages[0]["article_id"] == "art-005-004"
+
+
+def test_dense_index_build_and_hybrid_fusion(tmp_path):
+    """dense 색인 생성(mmap 로드) 및 RRF 결합 테스트"""
+    import numpy as np
+    from app.mock.law_data import get_passage_index
+    from app.search.dense import DenseIndex
+    from app.search.hybrid import reciprocal_rank_fusion
+
+    passages = [(p["id"], p["law_id"], text) for p, text in get_passage_index().iter_passages()]
+    index = DenseIndex.build(tmp_path, passages, dim=16)
+    assert isinstance(index.matrix, np.memmap)
+    assert len(index) == len(passages)
+
+    hits = index.search("발전사업의 신고", k=3)
+    assert hits and hits[0][1] == "law-003"
+
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]])
+    assert [key for key, _ in fused] == ["b", "a", "c"]
+
+
+def test_dense_ivf_index_scans_only_probed_lists(tmp_path):
+    """IVF 색인: 목록 순서로 정렬되어 저장되고, 모든 목록을 탐색하면 전체 스캔과 결과가 같은지 테스트"""
+    from app.mock.law_data import get_passage_index
+    from app.search.dense import DenseIndex
+
+    passages = [(p["id"], p["law_id"], text) for p, text in get_passage_index().iter_passages()]
+    exhaustive = DenseIndex.build(tmp_path / "flat", passages, dim=16)
+    assert exhaustive.n_lists == 0
+
+    index = DenseIndex.build(tmp_path / "ivf", passages, dim=16, n_lists=3)
+    assert index.n_lists == 3 and index.offsets[-1] == len(passages)
+    assert sorted(index.ids) == sorted(pid for pid, _, _ in passages)
+
+    loaded = DenseIndex.load(tmp_path / "ivf", n_probe=3)
+    assert loaded.search("발전사업의 신고", k=5) == exhaustive.search("발전사업의 신고", k=5)
+    # 한 목록만 탐색하면 그 목록의 passage 만 후보
+    loaded.n_probe = 1
+    rows, _ = loaded._scan(loaded.encoder.encode(["발전사업의 신고"])[0])
+    list_sizes = set(int(n) for n in loaded.offsets[1:] - loaded.offsets[:-1])
+    assert len(rows) in list_sizes and len(rows) < len(passages)
+
+
+def test_dense_fusion_only_uses_index_built_from_active_source(monkeypatch, tmp_path):
+    """다른 데이터 소스로 만든 dense 색인은 결합하지 않는지 (외부 API 결과에 목업 법령이 섞이지 않는지) 테스트"""
+    from app.core.config import settings
+    from app.mock.law_data import get_passage_index
+    from app.search.dense import DenseIndex
+    from app.services.law_service import LawService
+
+    passages = [(p["id"], p["law_id"], text) for p, text in get_passage_index().iter_passages()]
+    index = DenseIndex.build(tmp_path, passages, dim=16, source="mock")
+    assert index.source == "mock"
+    monkeypatch.setattr(LawService, "_dense_index", index)
+    monkeypatch.setattr(LawService, "_dense_index_loaded", True)
+
+    monkeypatch.setattr(settings, "law_source", "mock")
+    assert LawService._dense_hits("발전사업의 신고")
+
+    monkeypatch.setattr(settings, "law_source", "external")
+    assert LawService._dense_hits("발전사업의 신고") == []
+    external = [{"id": "ext-1", "name": "전기사업법", "score": 1.0}]
+    dense_hits = [("p-1", "law-003", 0.9)]
+    assert [law["id"] for law in LawService._fuse_laws(external, dense_hits)] == ["ext-1"]
+
+
+def test_local_corpus_store_round_trip(tmp_path):
+    """로컬 코퍼스(SQLite FTS5) 저장/검색 테스트"""
+    from app.corpus.store import LawStore
+
+    store = LawStore(str(tmp_path / "corpus.db"))
+    assert store.upsert_laws(MOCK_LAWS) == len(MOCK_LAWS)
+    assert store.count_laws() == len(MOCK_LAWS)
+
+    assert [law["id"] for law in store.search_laws("발전소 건설사업")] == ["law-005"]
+    assert len(store.search_laws("법")) == len(MOCK_LAWS)
+    assert store.search_laws("태양광") == []
+    # 검색 목록은 SQL 에서 개수를 자르고 조문은 빼고 반환, 질문 검색(search_any)은 조문 포함
+    assert len(store.search_laws("법", limit=2)) == 2
+    assert all(law["articles"] == [] for law in store.search_laws("건축", limit=3))
+    assert store.search_any(["발전소"], limit=1)[0]["articles"] == MOCK_LAWS[4]["articles"]
+    assert [law["id"] for law in store.get_laws(["law-002", "missing", "law-001"])] == ["law-002", "law-001"]
+
+    assert store.get_law("law-001")["articles"] == MOCK_LAWS[0]["articles"]
+    assert store.get_article("art-001-011", "law-001") is not None
+    assert store.get_article("art-001-011", "law-002") is None
+
+    passages = store.search_passages(["발전소", "1만킬로와트"], law_ids=["law-005"], limit=3)
+    assert passages[0]["id"] == "subp-005-004-001"
+
+    # 같은 법령을 다시 적재하면 교체되고 버전이 올라감
+    version = store.corpus_version()
+    store.upsert_law(MOCK_LAWS[0])
+    assert store.count_laws() == len(MOCK_LAWS)
+    assert store.corpus_version() == version + 1
+
+
+def _write_law_xml(directory, law_id, name, date, content):
+    (directory / f"{law_id}.xml").write_text(
+        f"<법령><law><법령ID>{law_id}</법령ID><법령명한글>{name}</법령명한글>"
+        f"<최종시행일자>{date}</최종시행일자></law>"
+        f"<조문><조문단위><조문번호>1</조문번호><조문제목>목적</조문제목>"
+        f"<조문내용>{content}</조문내용></조문단위></조문></법령>",
+        encoding="utf-8",
+    )
+
+
+def test_corpus_sync_refetches_only_changed_laws(tmp_path):
+    """최종시행일자가 바뀐 법령만 재적재하고 상세 캐시를 무효화하는지 테스트"""
+    from app.core.cache import get_cache, set_cache, get_cache_key
+    from app.corpus.store import LawStore
+    from app.corpus.sync import FixtureLawSource, sync_corpus
+    from app.services.law_service import LawService
+
+    fixture = tmp_path / "fixture"
+    fixture.mkdir()
+
+    def write_list(versions):
+        items = "".join(
+            f"<law><법령ID>{law_id}</법령ID><최종시행일자>{date}</최종시행일자></law>"
+            for law_id, date in versions.items()
+        )
+        (fixture / "lawSearch.xml").write_text(f"<LawSearch>{items}</LawSearch>", encoding="utf-8")
+
+    _write_law_xml(fixture, "L1", "가나법", "20240101", "가나 조문")
+    _write_law_xml(fixture, "L2", "다라법", "20240101", "다라 조문")
+    write_list({"L1": "20240101", "L2": "20240101"})
+
+    store = LawStore(str(tmp_path / "corpus.db"))
+    first = sync_corpus(store, FixtureLawSource(fixture))
+    assert sorted(first.added) == ["L1", "L2"]
+
+    # L2만 개정
+    _write_law_xml(fixture, "L2", "다라법", "20250301", "다라 개정 조문")
+    write_list({"L1": "20240101", "L2": "20250301"})
+    detail_key = get_cache_key("law_detail", "L2")
+    other_key = get_cache_key("law_detail", "L1")
+    set_cache(detail_key, {"id": "L2"})
+    set_cache(other_key, {"id": "L1"})
+
+    changed = []
+    second = sync_corpus(
+        store,
+        FixtureLawSource(fixture),
+        on_change=lambda ids: (changed.extend(ids), LawService.invalidate_laws(ids)),
+    )
+    assert second.added == [] and second.updated == ["L2"] and changed == ["L2"]
+    assert store.get_law("L2")["amendment_date"] == "20250301"
+    assert [law["id"] for law in store.search_laws("개정")] == ["L2"]
+    assert get_cache(detail_key) is None
+    assert get_cache(other_key) == {"id": "L1"}
+
+    # 변경이 없으면 아무것도 다시 받지 않음
+    assert sync_corpus(store, FixtureLawSource(fixture)).changed == []
+
+
+def test_external_search_and_detail_use_shared_async_client(monkeypatch):
+    """외부 API 검색/상세 조회가 공유 AsyncClient로 비동기 호출되는지 테스트"""
+    import httpx
+    from app.core.config import settings
+    from app.services.law_api_client import LawApiClient
+    from app.services import law_service as law_service_module
+    from app.services.law_service import LawService
+
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path.endswith("lawSearch.do"):
+            body = "<LawSearch><law><법령ID>EXT-1</법령ID><법령명한글>외부비동기법</법령명한글></law></LawSearch>"
+        else:
+            body = "<법령><law><법령ID>EXT-1</법령ID><법령명한글>외부비동기법</법령명한글></law></법령>"
+        return httpx.Response(200, text=body)
+
+    api_client = LawApiClient(api_key="test")
+    api_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(law_service_module, "get_law_api_client", lambda: api_client)
+    monkeypatch.setattr(settings, "law_source", "external")
+
+    async def run():
+        results = await LawService.search_laws("외부비동기")
+        law = await LawService.get_law("EXT-1")
+        await api_client.aclose()
+        return results, law
+
+    results, law = asyncio.run(run())
+    assert [r["id"] for r in results] == ["EXT-1"]
+    assert law["name"] == "외부비동기법"
+    assert requested == ["/DRF/lawSearch.do", "/DRF/lawService.do"]
+
+
+def test_concurrent_law_lookups_are_coalesced(monkeypatch):
+    """같은 법령의 동시 캐시 미스가 외부 호출 한 번으로 병합되는지 테스트"""
+    import httpx
+    from app.core.config import settings
+    from app.services.law_api_client import LawApiClient
+    from app.services import law_service as law_service_module
+    from app.services.law_service import LawService
+
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["ID"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text="<법령><law><법령ID>SF-1</법령ID><법령명한글>병합법</법령명한글></law></법령>")
+
+    api_client = LawApiClient(api_key="test")
+    api_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(law_service_module, "get_law_api_client", lambda: api_client)
+    monkeypatch.setattr(settings, "law_source", "external")
+    flight = law_service_module._detail_flight
+    coalesced_before = flight.coalesced
+
+    async def run():
+        laws = await asyncio.gather(*(LawService.get_law("SF-1") for _ in range(5)))
+        await api_client.aclose()
+        return laws
+
+    laws = asyncio.run(run())
+    assert all(law is laws[0] for law in laws)
+    assert requested == ["SF-1"]
+    assert flight.coalesced - coalesced_before == 4
+    assert flight.in_flight() == 0
+
+
+def test_streaming_law_xml_parser_handles_chunks():
+    """lawService.do XML을 작은 조각으로 나눠 넣어도 같은 결과가 나오는지 테스트"""
+    from app.corpus.law_xml import parse_law_stream, parse_law_xml
+
+    xml = (
+        "<법령><기본정보><법령ID>001</법령ID><법령명_한글>예시법</법령명_한글><법령명한글>예시법</법령명한글>"
+        "<최종시행일자>20250101</최종시행일자></기본정보><조문>"
+        "<조문단위><조문번호>1</조문번호><조문제목>목적</조문제목><조문내용>목적 조문</조문내용></조문단위>"
+        "<조문단위><조문번호>2</조문번호><조문내용>허가 조문</조문내용>"
+        "<항><항번호>①</항번호><항내용>허가를 받아야 한다</항내용>"
+        "<호><호번호>1</호번호><호내용>첫째 호</호내용></호></항></조문단위>"
+        "</조문><부칙><부칙내용>부칙</부칙내용></부칙></법령>"
+    ).encode("utf-8")
+
+    law = parse_law_stream(xml[i:i + 5] for i in range(0, len(xml), 5))
+    assert law == parse_law_xml(xml)
+    assert law["id"] == "001" and law["amendment_date"] == "20250101"
+    assert [a["id"] for a in law["articles"]] == ["001-1", "001-2"]
+    assert [s["id"] for s in law["articles"][1]["subparagraphs"]] == ["001-2-항①", "001-2-항①-호1"]
+    assert parse_law_xml("<응답><결과>없음</결과></응답>") is None
+
+
+def test_circuit_breaker_opens_and_falls_back_to_mock(monkeypatch):
+    """외부 API 장애 시 회로가 열려 호출 없이 바로 목업 검색으로 대체되는지 테스트"""
+    import httpx
+    from app.core.circuit_breaker import CircuitBreaker, OPEN, HALF_OPEN, CLOSED
+    from app.core.config import settings
+    from app.services.law_api_client import LawApiClient
+    from app.services import law_service as law_service_module
+    from app.services.law_service import LawService
+
+    now = [0.0]
+    attempts = []
+    healthy = [False]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.params["query"])
+        if not healthy[0]:
+            raise httpx.ConnectError("upstream down", request=request)
+        return httpx.Response(200, text="<LawSearch></LawSearch>")
+
+    breaker = CircuitBreaker("test", minimum_calls=3, window_size=10, open_seconds=30, clock=lambda: now[0])
+    api_client = LawApiClient(api_key="test", breaker=breaker)
+    api_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(law_service_module, "get_law_api_client", lambda: api_client)
+    monkeypatch.setattr(law_service_module.LawService, "_fallback_store", staticmethod(lambda: None))
+    monkeypatch.setattr(settings, "law_source", "external")
+
+    async def search_all(keywords):
+        return [await LawService.search_laws(keyword) for keyword in keywords]
+
+    results = asyncio.run(search_all([f"건축{i}" for i in range(3)] + ["건축"]))
+    assert breaker.state == OPEN
+    # 세 번 실패 후에는 upstream을 호출하지 않고 바로 목업 검색
+    assert len(attempts) == 3
+    assert [law["id"] for law in results[-1]] == [law["id"] for law in search_laws_by_keyword("건축")]
+
+    # open 시간이 지나면 시험 호출 한 번으로 복구
+    now[0] = 31.0
+    healthy[0] = True
+    assert breaker.state == HALF_OPEN
+    asyncio.run(search_all(["복구확인"]))
+    assert breaker.state == CLOSED
+    asyncio.run(api_client.aclose())
+
+
+def test_get_law_negative_caches_not_found(monkeypatch):
+    """없는 법령 결과를 짧게 캐싱해서 upstream을 반복 호출하지 않는지 테스트"""
+    import httpx
+    from app.core.config import settings
+    from app.services.law_api_client import LawApiClient
+    from app.services import law_service as law_service_module
+    from app.services.law_service import LawService
+
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["ID"])
+        return httpx.Response(200, text="<Law><결과>일치하는 법령이 없습니다.</결과></Law>")
+
+    api_client = LawApiClient(api_key="test")
+    api_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(law_service_module, "get_law_api_client", lambda: api_client)
+    monkeypatch.setattr(settings, "law_source", "external")
+
+    async def run():
+        return [await LawService.get_law("NO-SUCH-LAW") for _ in range(3)]
+
+    assert asyncio.run(run()) == [None, None, None]
+    assert requested == ["NO-SUCH-LAW"]
+    asyncio.run(api_client.aclose())
+
+
+def test_bounded_cache_lru_quota_and_sweep():
+    """캐시 LRU 제거, 접두사별 구역 분리, 만료 정리 테스트"""
+    from app.core.cache import BoundedCache
+
+    now = [0.0]
+    cache = BoundedCache(max_entries=10, max_bytes=10 ** 6, prefix_quotas={"law_detail": 0.5}, clock=lambda: now[0])
+
+    for i in range(5):
+        cache.set(f"law_detail:{i}", {"id": i}, ttl=60)
+    cache.get("law_detail:0")  # 최근 사용 -> 제거 대상에서 뒤로
+
+    # 검색 결과가 아무리 많아도 law_detail 구역은 밀려나지 않음
+    for i in range(50):
+        cache.set(f"law_search_mock:{i}", [i], ttl=60)
+    assert all(f"law_detail:{i}" in cache for i in range(5))
+    assert len(cache) == 10
+
+    # 구역이 가득 차면 가장 오래 사용되지 않은 항목부터 제거
+    cache.set("law_detail:5", {"id": 5}, ttl=60)
+    assert "law_detail:1" not in cache and "law_detail:0" in cache
+    assert cache.stats()["law_detail"]["evictions"] == 1
+
+    # 만료 항목은 조회하지 않아도 sweep 으로 정리
+    cache.set("law_detail:short", {"id": "short"}, ttl=1)
+    now[0] = 2.0
+    assert cache.sweep() == 1
+    assert cache.get("law_detail:0") == {"id": 0}
+
+
+def test_sqlite_cache_backend_shared_between_instances(tmp_path):
+    """SQLite 캐시 백엔드: 같은 파일을 쓰는 두 인스턴스(워커) 간 공유, 만료, 접두사 삭제 테스트"""
+    from app.core.cache_backends import SQLiteBackend
+
+    now = [1000.0]
+    path = str(tmp_path / "cache.db")
+    worker_a = SQLiteBackend(path, clock=lambda: now[0])
+    worker_b = SQLiteBackend(path, clock=lambda: now[0])
+
+    worker_a.set("law_detail:1", {"id": "1", "articles": [1, 2]}, ttl=60)
+    worker_a.set("law_search_local:x", [], ttl=10)
+    assert worker_b.get("law_detail:1") == {"id": "1", "articles": [1, 2]}
+    assert worker_b.get("law_search_local:x") == []
+
+    now[0] += 30
+    assert worker_b.get("law_search_local:x") is None
+    assert worker_b.sweep() == 1
+    assert worker_a.clear("law_detail") == 1
+    assert worker_b.get("law_detail:1") is None
+    assert worker_b.stats()["law_detail"]["hits"] == 1
+
+
+def test_redis_cache_backend_speaks_resp():
+    """Redis 캐시 백엔드: RESP 명령(SET PX/GET/DEL/SCAN) 테스트 (테스트용 RESP 서버 사용)"""
+    import socketserver
+    import threading
+    from app.core.cache_backends import RedisBackend
+
+    store = {}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def read_command(self):
+            line = self.rfile.readline()
+            if not line:
+                return None
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            return args
+
+        def reply(self, value):
+            if value is None:
+                self.wfile.write(b"$-1\r\n")
+            elif isinstance(value, int):
+                self.wfile.write(b":%d\r\n" % value)
+            elif isinstance(value, list):
+                self.wfile.write(b"*%d\r\n" % len(value))
+                for item in value:
+                    self.reply(item)
+            else:
+                self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+
+        def handle(self):
+            while (args := self.read_command()) is not None:
+                command = args[0].upper()
+                if command == b"SET":
+                    assert args[3] == b"PX"
+                    store[args[1]] = args[2]
+                    self.wfile.write(b"+OK\r\n")
+                elif command == b"GET":
+                    self.reply(store.get(args[1]))
+                elif command == b"DEL":
+                    self.reply(sum(store.pop(key, None) is not None for key in args[1:]))
+                elif command == b"SCAN":
+                    prefix = args[3].rstrip(b"*").replace(b"\\", b"")
+                    self.reply([b"0", [key for key in store if key.startswith(prefix)]])
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        cache = RedisBackend(f"redis://127.0.0.1:{server.server_address[1]}/0", b"test-key")
+        cache.set("law_detail:1", {"id": "1"}, ttl=60)
+        cache.set("law_search_local:x", ["a"], ttl=60)
+        assert set(store) == {b"lawchat:law_detail:1", b"lawchat:law_search_local:x"}
+        assert cache.get("law_detail:1") == {"id": "1"}
+        assert cache.get("law_detail:2") is None
+        assert cache.clear("law_search") == 1
+        assert cache.get("law_search_local:x") is None
+        assert cache.stats()["law_detail"] == {"hits": 1, "misses": 1}
+        cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cache_backend_errors_degrade_to_misses(monkeypatch, tmp_path):
+    """백엔드 장애/서명이 맞지 않는 값은 미스로 처리하고 저장은 건너뛰며 errors 로 세는지 테스트"""
+    from app.core import cache as cache_module
+    from app.core.cache_backends import CacheBackend, CacheValueError, SQLiteBackend
+
+    class DownBackend(CacheBackend):
+        name = "down"
+
+        def get(self, key):
+            raise ConnectionError("연결 거부")
+
+        def set(self, key, value, ttl):
+            raise ConnectionError("연결 거부")
+
+        def delete(self, key):
+            raise ConnectionError("연결 거부")
+
+        def clear(self, prefix=None):
+            raise ConnectionError("연결 거부")
+
+        def stats(self):
+            return {}
+
+    monkeypatch.setattr(cache_module, "_cache", DownBackend())
+    before = cache_module.cache_metrics()["errors"]
+    cache_module.set_cache("err_test:1", "값", ttl=60)
+    assert cache_module.get_cache("err_test:1") is None
+    assert cache_module.clear_cache("err_test") == 0
+    asyncio.run(cache_module.aset_cache("err_test:2", "값", ttl=60))
+    assert asyncio.run(cache_module.aget_cache("err_test:2")) is None
+    metrics = cache_module.cache_metrics()
+    assert metrics["errors"] - before == 5
+    assert metrics["prefixes"]["err_test"]["misses"] == 2
+
+    # 다른 키로 서명된(위조된) 값은 복원하지 않음
+    path = str(tmp_path / "cache.db")
+    SQLiteBackend(path, signing_key=b"other-key").set("err_test:3", {"x": 1}, ttl=60)
+    reader = SQLiteBackend(path, signing_key=b"app-key")
+    with pytest.raises(CacheValueError):
+        reader.get("err_test:3")
+    monkeypatch.setattr(cache_module, "_cache", reader)
+    assert cache_module.get_cache("err_test:3") is None
+
+
+def test_tiered_cache_promotes_and_warms_from_disk(tmp_path):
+    """2단 캐시: L2 승격(남은 TTL 유지), 재시작 후 L2로 L1 워밍 테스트"""
+    from app.core.cache_backends import BoundedCache, SQLiteBackend, TieredCache
+
+    now = [1000.0]
+    clock = lambda: now[0]
+    path = str(tmp_path / "cache.db")
+
+    def start():
+        return TieredCache(BoundedCache(max_entries=10, clock=clock), SQLiteBackend(path, clock=clock))
+
+    cache = start()
+    cache.set("law_detail:1", {"id": "1"}, ttl=100)
+    cache.set("law_detail:2", {"id": "2"}, ttl=100)
+
+    # 재시작: L1은 비어 있지만 L2에서 승격
+    cache = start()
+    assert "law_detail:1" not in cache.l1
+    assert cache.get("law_detail:1") == {"id": "1"}
+    assert "law_detail:1" in cache.l1 and cache.promotions == 1
+
+    # 승격된 항목도 원래 만료 시각에 만료
+    now[0] += 101
+    assert cache.get("law_detail:1") is None
+
+    # 워밍은 만료되지 않은 항목만
+    now[0] = 1000.0
+    cache = start()
+    assert cache.warm() == 2
+    assert cache.get("law_detail:2") == {"id": "2"} and cache.promotions == 0
+
+
+def test_get_law_serves_stale_and_refreshes_in_background(monkeypatch):
+    """법령 상세 TTL 만료 후 stale 값을 바로 반환하고 백그라운드에서 갱신하는지 테스트"""
+    import httpx
+    from app.core import cache as cache_module
+    from app.core.config import settings
+    from app.services.law_api_client import LawApiClient
+    from app.services import law_service as law_service_module
+    from app.services.law_service import LawService
+
+    names = ["첫판법", "개정법"]
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["ID"])
+        name = names[min(len(requested), 2) - 1]
+        return httpx.Response(200, text=f"<법령><law><법령ID>SWR-1</법령ID><법령명한글>{name}</법령명한글></law></법령>")
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module, "_clock", lambda: now[0])
+    api_client = LawApiClient(api_key="test")
+    api_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(law_service_module, "get_law_api_client", lambda: api_client)
+    monkeypatch.setattr(settings, "law_source", "external")
+
+    async def run():
+        first = await LawService.get_law("SWR-1")
+        now[0] += 3000  # 아직 신선함
+        fresh = await LawService.get_law("SWR-1")
+        now[0] += 700  # TTL(1시간) 지남 -> stale 즉시 반환 + 백그라운드 갱신
+        stale = await LawService.get_law("SWR-1")
+        await asyncio.gather(*cache_module._refresh_tasks)
+        refreshed = await LawService.get_law("SWR-1")
+        await api_client.aclose()
+        return first, fresh, stale, refreshed
+
+    first, fresh, stale, refreshed = asyncio.run(run())
+    assert [law["name"] for law in (first, fresh, stale, refreshed)] == ["첫판법", "첫판법", "첫판법", "개정법"]
+    assert requested == ["SWR-1", "SWR-1"]
+    assert cache_module.refresh_stats()["law_detail"]["stale"] >= 1
+
+
+class ReprOnlyQuery:
+    """repr 에 내용이 드러나지 않는 인자 (make_fast_key 테스트용)"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return "ReprOnlyQuery"
+
+
+def test_memoize_sync_and_async_with_falsy_results():
+    """memoize: def/async def 지원, None 결과 캐싱, 동시 호출 병합, 함수별 통계 테스트"""
+    import numpy as np
+    from app.core.cache import memoize, make_fast_key, memoize_stats
+
+    calls = []
+
+    @memoize(ttl=60, prefix="memo_test")
+    def lookup(law_id, article=None):
+        calls.append(law_id)
+        return None
+
+    assert lookup("A") is None and lookup("A") is None
+    assert lookup("A", article=1) is None
+    assert calls == ["A", "A"]
+    assert lookup.cache_stats()["hits"] == 1
+    assert lookup.cache_stats()["misses"] == 2
+
+    # 타입이 다른 인자는 다른 키, JSON 으로 만들 수 없는 인자도 가능
+    assert make_fast_key((1,), {}) != make_fast_key((1.0,), {}) != make_fast_key(("1",), {})
+    assert make_fast_key((True,), {}) != make_fast_key((1,), {})
+    assert make_fast_key((frozenset({"a", "b"}),), {}) == make_fast_key((frozenset({"b", "a"}),), {})
+    assert len(make_fast_key(({"x" * 500},), {})) == 32
+
+    # repr 가 같아도 내용이 다르면 다른 키 (내용이 빠진 repr, 생략된 NumPy repr)
+    assert make_fast_key((ReprOnlyQuery("a"),), {}) != make_fast_key((ReprOnlyQuery("b"),), {})
+    a, b = np.zeros(2000), np.zeros(2000)
+    b[1000] = 1.0
+    assert repr(a) == repr(b) and make_fast_key((a,), {}) != make_fast_key((b,), {})
+    # 직렬화할 수 없는 인자는 캐싱하지 않음
+    with pytest.raises(TypeError):
+        make_fast_key((lambda: None,), {})
+
+    async_calls = []
+
+    @memoize(ttl=60, prefix="memo_test")
+    async def fetch(law_id):
+        async_calls.append(law_id)
+        await asyncio.sleep(0.01)
+        return 0
+
+    async def run():
+        return await asyncio.gather(*(fetch("B") for _ in range(5))) + [await fetch("B")]
+
+    assert asyncio.run(run()) == [0] * 6
+    assert async_calls == ["B"]
+    stats = fetch.cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 5)
+    assert stats["miss_latency"]["count"] == 5
+
+    assert fetch.cache_clear() == 1
+
+    # 같은 이름의 함수를 다시 memoize 해도 memoize_stats() 에 따로 집계
+    @memoize(ttl=60, prefix="memo_test")
+    async def fetch(law_id):
+        return 1
+
+    assert asyncio.run(fetch("B")) == 1
+    misses = [stats["misses"] for name, stats in memoize_stats().items() if name.split("#")[0].endswith(".<locals>.fetch")]
+    assert sorted(misses) == [1, 5]